@@ -0,0 +1,108 @@
+# src/core/eventbus/async_proxy.py
+
+"""
+非同步 Event Bus 代理
+
+將事件發布自生產者執行緒解耦：`post` 只是一次 enqueue
+（微秒級），序列化與訂閱者 fan-out 由專屬 dispatcher 執行緒
+在背景完成。發布延遲不再隨訂閱者數量增長。
+"""
+
+import queue
+import threading
+from typing import Callable, List, Optional
+
+from .events import Event
+from .interfaces import IEventBus
+
+# dispatcher 關閉哨符
+_SHUTDOWN = object()
+
+
+class AsyncEventBusProxy(IEventBus):
+    """
+    非同步 Event Bus 代理
+
+    包裝任一 IEventBus：publish/post 將事件放入佇列立即返回，
+    dispatcher 執行緒負責實際的 `inner.publish`。訂閱相關操作
+    直接委派給內部 bus，因此可作為 IEventBus 的直接替換。
+    """
+
+    def __init__(self, inner: IEventBus):
+        self.inner = inner
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop,
+            name="eventbus-dispatcher",
+            daemon=True,
+        )
+        self._stopped = False
+        self._dispatcher.start()
+
+    def post(self, event: Event):
+        """
+        非同步發布事件（enqueue 後立即返回）
+
+        Args:
+            event: 事件
+        """
+        self._queue.put(event)
+
+    def publish(self, event: Event) -> bool:
+        """發布事件（非同步；等同 post）"""
+        self._queue.put(event)
+        return True
+
+    def drain(self):
+        """等待佇列中的事件全部派發完畢"""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def subscribe(
+        self,
+        event_type: str,
+        handler: Callable[[Event], None],
+    ) -> str:
+        """訂閱事件（委派給內部 bus）"""
+        return self.inner.subscribe(event_type, handler)
+
+    def unsubscribe(self, subscription_id: str) -> bool:
+        """取消訂閱（委派給內部 bus）"""
+        return self.inner.unsubscribe(subscription_id)
+
+    def has_subscribers(self, event_type: str) -> bool:
+        """是否有訂閱者對此事件類型感興趣（委派給內部 bus）"""
+        return self.inner.has_subscribers(event_type)
+
+    def start(self) -> bool:
+        """啟動內部 bus"""
+        return self.inner.start()
+
+    def stop(self) -> bool:
+        """派發完殘餘事件後停止 dispatcher 與內部 bus"""
+        if not self._stopped:
+            self._stopped = True
+            self._queue.put(_SHUTDOWN)
+            self._dispatcher.join()
+        return self.inner.stop()
+
+    def get_event_history(
+        self,
+        event_type: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Event]:
+        """獲取事件歷史（委派給內部 bus）"""
+        return self.inner.get_event_history(event_type, limit)
+
+    def _dispatch_loop(self):
+        """dispatcher 主迴圈：逐一取出事件並發布到內部 bus"""
+        while True:
+            item = self._queue.get()
+            if item is _SHUTDOWN:
+                return
+            if isinstance(item, threading.Event):
+                # drain() 放入的同步點
+                item.set()
+                continue
+            self.inner.publish(item)
@@ -0,0 +1,90 @@
+# src/core/eventbus/events.py
+
+"""
+事件定義
+
+NDH 事件模型的事件封裝與事件類型常數。
+事件契約細節見 docs/NDH_Event_Model_and_TSDB_Design_Update.md。
+"""
+
+from dataclasses import asdict, dataclass, field, is_dataclass
+from typing import Any, Dict
+
+# 事件類型常數
+TAG_CREATED = "TagCreated"
+TAG_VALUE_CHANGED = "TagValueChanged"
+TAG_DELETED = "TagDeleted"
+INSTANCE_CREATED = "InstanceCreated"
+INSTANCE_DELETED = "InstanceDeleted"
+FDL_LOADED = "FDLLoaded"
+
+
+# 熱路徑事件的 payload 以 slots dataclass 取代逐事件建構的 dict：
+# 無雜湊表配置、欄位存取為 slot 偏移；僅在對外序列化時經 asdict
+# 轉為 dict。
+
+@dataclass(slots=True, frozen=True)
+class TagCreatedPayload:
+    """TagCreated 事件 payload"""
+    tag_instance_id: str
+    tag_id: str
+    asset_instance_id: str
+    eu_unit: str
+    name: str
+    kind: str
+
+
+@dataclass(slots=True, frozen=True)
+class TagValueChangedPayload:
+    """TagValueChanged 事件 payload"""
+    tag_instance_id: str
+    tag_id: str
+    asset_instance_id: str
+    eu_unit: str
+    old_value: Any
+    new_value: Any
+    quality: str
+
+
+@dataclass(slots=True, frozen=True)
+class TagDeletedPayload:
+    """TagDeleted 事件 payload"""
+    tag_instance_id: str
+    tag_id: str
+    asset_instance_id: str
+    eu_unit: str
+
+
+@dataclass
+class Event:
+    """
+    NDH 事件
+
+    Attributes:
+        event_id: 事件 ID（UUIDv7）
+        event_type: 事件類型（例如 "TagValueChanged"）
+        timestamp: 事件時間戳（epoch 秒，float）
+        source: 事件來源（例如 "TagServant:<tag_instance_id>"）
+        payload: 事件數據（dict 或 slots payload dataclass）
+        version: 事件 schema 版本
+    """
+    event_id: str
+    event_type: str
+    timestamp: Any
+    source: str
+    payload: Any = field(default_factory=dict)
+    version: str = "1.0.0"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """序列化為 dict（用於佇列/外部傳輸；payload 延遲展開）"""
+        payload = self.payload
+        if is_dataclass(payload):
+            payload = asdict(payload)
+        return {
+            "event_id": self.event_id,
+            "event_type": self.event_type,
+            "timestamp": self.timestamp,
+            "source": self.source,
+            "payload": payload,
+            "version": self.version,
+        }
@@ -0,0 +1,146 @@
+# src/core/eventbus/inmem.py
+
+"""
+In-Memory Event Bus 實作（MVP）
+
+同步、行程內的 Event Bus，用於 MVP 與測試。
+訂閱支援 fnmatch 萬用字元（例如 "Tag*"、"*"）。
+"""
+
+import fnmatch
+import threading
+from typing import Callable, Dict, List, Optional
+
+from .events import Event
+from .interfaces import IEventBus
+
+
+def _is_wildcard(pattern: str) -> bool:
+    """訂閱樣式是否含 fnmatch 萬用字元"""
+    return any(ch in pattern for ch in "*?[")
+
+
+class InMemoryEventBus(IEventBus):
+    """In-Memory Event Bus 實作"""
+
+    def __init__(self, enable_history: bool = True, history_limit: int = 10000):
+        # 派發結構依訂閱樣式分流：精確類型進 _by_type（派發為
+        # 單次 dict 查找），萬用字元樣式進 _wildcards（僅這些
+        # 才逐一 fnmatch）。不再對每次 publish 掃全部訂閱者
+        self._wildcards: List[tuple] = []
+        self._by_type: Dict[str, List[tuple]] = {}
+        self._subscriptions: Dict[str, str] = {}
+        self._event_history: List[Event] = []
+        self._lock = threading.RLock()
+        self._running = False
+        self._enable_history = enable_history
+        self._history_limit = history_limit
+        self._next_subscription_id = 0
+        # has_subscribers 的 O(1) 計數：精確類型各一計數，
+        # 萬用字元樣式以單一計數保守涵蓋所有類型
+        self._exact_counts: Dict[str, int] = {}
+        self._wildcard_count = 0
+
+    def publish(self, event: Event) -> bool:
+        """發布事件（同步派發給所有匹配的訂閱者）"""
+        if not self._running:
+            return False
+
+        event_type = event.event_type
+        with self._lock:
+            if self._enable_history:
+                self._event_history.append(event)
+                if len(self._event_history) > self._history_limit:
+                    del self._event_history[: -self._history_limit]
+            wildcards = list(self._wildcards)
+            exact = list(self._by_type.get(event_type, ()))
+
+        for _, pattern, handler in wildcards:
+            if pattern == "*" or fnmatch.fnmatch(event_type, pattern):
+                try:
+                    handler(event)
+                except Exception as e:
+                    print(f"Error in event handler: {e}")
+        for _, handler in exact:
+            try:
+                handler(event)
+            except Exception as e:
+                print(f"Error in event handler: {e}")
+        return True
+
+    def subscribe(
+        self,
+        event_type: str,
+        handler: Callable[[Event], None],
+    ) -> str:
+        """訂閱事件"""
+        with self._lock:
+            subscription_id = f"sub_{self._next_subscription_id}"
+            self._next_subscription_id += 1
+            if _is_wildcard(event_type):
+                self._wildcards.append(
+                    (subscription_id, event_type, handler)
+                )
+                self._wildcard_count += 1
+            else:
+                self._by_type.setdefault(event_type, []).append(
+                    (subscription_id, handler)
+                )
+                self._exact_counts[event_type] = (
+                    self._exact_counts.get(event_type, 0) + 1
+                )
+            self._subscriptions[subscription_id] = event_type
+            return subscription_id
+
+    def unsubscribe(self, subscription_id: str) -> bool:
+        """取消訂閱"""
+        with self._lock:
+            pattern = self._subscriptions.pop(subscription_id, None)
+            if pattern is None:
+                return False
+            if _is_wildcard(pattern):
+                self._wildcards = [
+                    w for w in self._wildcards if w[0] != subscription_id
+                ]
+                self._wildcard_count -= 1
+            else:
+                self._by_type[pattern] = [
+                    h
+                    for h in self._by_type[pattern]
+                    if h[0] != subscription_id
+                ]
+                self._exact_counts[pattern] -= 1
+            return True
+
+    def has_subscribers(self, event_type: str) -> bool:
+        """是否有訂閱者對此事件類型感興趣（O(1) 計數查詢）"""
+        return (
+            self._wildcard_count > 0
+            or self._exact_counts.get(event_type, 0) > 0
+        )
+
+    def start(self) -> bool:
+        """啟動 Event Bus"""
+        self._running = True
+        return True
+
+    def stop(self) -> bool:
+        """停止 Event Bus"""
+        self._running = False
+        return True
+
+    def get_event_history(
+        self,
+        event_type: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Event]:
+        """獲取事件歷史"""
+        with self._lock:
+            if event_type is None:
+                history = list(self._event_history)
+            else:
+                history = [
+                    e for e in self._event_history
+                    if e.event_type == event_type
+                ]
+            return history[-limit:]
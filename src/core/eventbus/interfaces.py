@@ -0,0 +1,98 @@
+# src/core/eventbus/interfaces.py
+
+"""
+Event Bus 抽象介面
+
+定義 IEventBus 介面，支援自 In-Memory（MVP）到
+ZMQ/MQTT（生產級）的平滑演進。
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
+
+from .events import Event
+
+
+class IEventBus(ABC):
+    """Event Bus 抽象介面"""
+
+    @abstractmethod
+    def publish(self, event: Event) -> bool:
+        """
+        發布事件
+
+        Args:
+            event: 事件
+
+        Returns:
+            bool: 是否成功發布
+        """
+
+    @abstractmethod
+    def subscribe(
+        self,
+        event_type: str,
+        handler: Callable[[Event], None],
+    ) -> str:
+        """
+        訂閱事件
+
+        Args:
+            event_type: 事件類型（支援萬用字元，例如 "Tag*" 或 "*"）
+            handler: 事件處理函式
+
+        Returns:
+            str: 訂閱 ID
+        """
+
+    @abstractmethod
+    def unsubscribe(self, subscription_id: str) -> bool:
+        """
+        取消訂閱
+
+        Args:
+            subscription_id: 訂閱 ID
+
+        Returns:
+            bool: 是否成功取消
+        """
+
+    def has_subscribers(self, event_type: str) -> bool:
+        """
+        是否有訂閱者對此事件類型感興趣
+
+        發布端可據此跳過整個事件建構；預設保守地回傳 True，
+        具體實作可覆寫為 O(1) 計數查詢。
+
+        Args:
+            event_type: 事件類型
+
+        Returns:
+            bool: 是否存在匹配的訂閱者
+        """
+        return True
+
+    @abstractmethod
+    def start(self) -> bool:
+        """啟動 Event Bus"""
+
+    @abstractmethod
+    def stop(self) -> bool:
+        """停止 Event Bus"""
+
+    @abstractmethod
+    def get_event_history(
+        self,
+        event_type: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Event]:
+        """
+        獲取事件歷史（用於重放與除錯）
+
+        Args:
+            event_type: 事件類型過濾（None 表示全部）
+            limit: 最大返回數量
+
+        Returns:
+            List[Event]: 事件列表
+        """
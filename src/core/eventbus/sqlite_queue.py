@@ -0,0 +1,178 @@
+# src/core/eventbus/sqlite_queue.py
+
+"""
+SQLite 持久化佇列
+
+以 SQLite 表為後端的簡易 FIFO 佇列，供 NDH 與外部系統間的
+事件暫存交換（行程重啟後佇列內容不遺失；":memory:" 供測試）。
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# orjson 的 C 路徑免去逐欄位的 Python 層派發，且直接產出 bytes
+# （SQLite 以 BLOB 收下，不經 TEXT 編碼）；未安裝時退回 stdlib json
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+
+def _table_name(queue_name: str) -> str:
+    """佇列名稱 → SQL 表名（僅允許識別字字元）"""
+    if not queue_name.isidentifier():
+        raise ValueError(f"無效的佇列名稱: {queue_name!r}")
+    return f"queue_{queue_name}"
+
+
+class SQLiteQueue:
+    """單一 FIFO 佇列（由 SQLiteQueueManager 建立）"""
+
+    def __init__(self, conn: sqlite3.Connection, table: str, lock):
+        self._conn = conn
+        self._table = table
+        self._lock = lock
+        # SQL 文字於建構期組好一次：每次呼叫傳同一個字串物件，
+        # sqlite3 的敘述快取以 SQL 文字為鍵，重複執行免重新 prepare
+        self._put_sql = f"INSERT INTO {table} (payload) VALUES (?)"
+        self._head_sql = f"SELECT id, payload FROM {table} ORDER BY id LIMIT 1"
+        self._delete_sql = f"DELETE FROM {table} WHERE id = ?"
+        self._size_sql = f"SELECT COUNT(*) FROM {table}"
+        self._drain_sql = f"SELECT id, payload FROM {table} ORDER BY id LIMIT ?"
+        self._drain_delete_sql = f"DELETE FROM {table} WHERE id <= ?"
+
+    def put(self, message: Dict[str, Any]) -> bool:
+        """
+        將訊息放入佇列
+
+        Args:
+            message: 訊息（需可 JSON 序列化）
+
+        Returns:
+            bool: 是否成功放入
+        """
+        payload = _dumps(message)
+        try:
+            with self._lock:
+                with self._conn:
+                    self._conn.execute(self._put_sql, (payload,))
+            return True
+        except sqlite3.Error as e:
+            print(f"[SQLiteQueue] put 失敗: {e}")
+            return False
+
+    def get(self, timeout: float = 0.0) -> Optional[Dict[str, Any]]:
+        """
+        自佇列取出最舊的訊息
+
+        Args:
+            timeout: 佇列為空時的等待秒數（0 表示不等待）
+
+        Returns:
+            Optional[Dict]: 訊息（超時仍為空時為 None）
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                row = self._conn.execute(self._head_sql).fetchone()
+                if row is not None:
+                    with self._conn:
+                        self._conn.execute(self._delete_sql, (row[0],))
+                    return _loads(row[1])
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.01)
+
+    def drain(self, limit: int = 10000) -> List[Dict[str, Any]]:
+        """
+        單一交易取空佇列
+
+        取代「while size() > 0: get()」的輪詢模式：後者每則訊息
+        付一次 COUNT + SELECT + DELETE 往返（2N 次 SQL），此處
+        一次 SELECT + 一次範圍 DELETE 完成整批。
+
+        Args:
+            limit: 單次最多取出的訊息數
+
+        Returns:
+            List[Dict]: 依放入順序的訊息列表（佇列空時為空列表）
+        """
+        with self._lock:
+            with self._conn:
+                rows = self._conn.execute(
+                    self._drain_sql, (limit,)
+                ).fetchall()
+                if rows:
+                    self._conn.execute(
+                        self._drain_delete_sql, (rows[-1][0],)
+                    )
+        return [_loads(payload) for _, payload in rows]
+
+    def size(self) -> int:
+        """佇列中的訊息數量"""
+        with self._lock:
+            row = self._conn.execute(self._size_sql).fetchone()
+        return row[0]
+
+
+class SQLiteQueueManager:
+    """
+    SQLite 佇列管理器
+
+    管理同一資料庫文件內的多個命名佇列。
+    """
+
+    def __init__(self, db_path: str = "queues.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(
+            db_path, check_same_thread=False, cached_statements=128
+        )
+        # 佇列為可重建的暫存交換區，耐久性讓位給吞吐：
+        # 不落 journal、不等 fsync，鎖一次取得後不再反覆協商
+        self.conn.execute("PRAGMA journal_mode=MEMORY")
+        self.conn.execute("PRAGMA synchronous=OFF")
+        self.conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self._lock = threading.Lock()
+        # 佇列 handle 記憶化：get_queue 在迴圈內呼叫也只付
+        # 一次 DDL + handle 建構
+        self._queues: Dict[str, SQLiteQueue] = {}
+
+    def get_queue(self, name: str) -> SQLiteQueue:
+        """
+        獲取（或建立）命名佇列（handle 記憶化，重複呼叫 O(1)）
+
+        Args:
+            name: 佇列名稱
+
+        Returns:
+            SQLiteQueue: 佇列
+        """
+        queue = self._queues.get(name)
+        if queue is not None:
+            return queue
+
+        table = _table_name(name)
+        with self._lock:
+            with self.conn:
+                self.conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    f"id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                    f"payload BLOB NOT NULL)"
+                )
+        queue = SQLiteQueue(self.conn, table, self._lock)
+        self._queues[name] = queue
+        return queue
+
+    def close(self):
+        """關閉資料庫連接"""
+        self.conn.close()
@@ -0,0 +1,105 @@
+# src/core/fdl/flat.py
+
+"""
+FDL 扁平表示（AoS → SoA）
+
+巢狀的 dataclass 樹（site → areas → instances → transform）每次
+走訪都在指標間跳躍；此處將其攤平為 CSR 式的平行陣列：
+區域以 `area_instance_offsets` 切出其實例的連續區段，數值欄位
+為連續 ndarray。檢視與數值消費端迭代扁平陣列，快取行為
+自「逐物件指標追逐」變為「循序掃描」。
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from .models import FDL
+
+
+@dataclass(slots=True)
+class FDLFlat:
+    """
+    FDL 的 CSR 式扁平檢視
+
+    Attributes:
+        area_ids: 區域 ID（len = 區域數）
+        area_names: 區域名稱
+        area_types: 區域類型
+        area_connection_counts: 各區域的連接數（int32）
+        area_instance_offsets: CSR 位移（int32，len = 區域數 + 1）；
+            區域 a 的實例為區段 [offsets[a], offsets[a+1])
+        instance_ids: 實例 ID（與陣列列序對齊）
+        instance_ref_assets: 實例引用的資產 ID
+        instance_translation: (N, 3) float64 平移
+    """
+    area_ids: List[str]
+    area_names: List[str]
+    area_types: List[str]
+    area_connection_counts: np.ndarray
+    area_instance_offsets: np.ndarray
+    instance_ids: List[str]
+    instance_ref_assets: List[str]
+    instance_translation: np.ndarray
+
+
+def build_flat(fdl: FDL) -> FDLFlat:
+    """
+    建立（或取回）FDL 的扁平表示
+
+    單趟走訪填入所有陣列；結果掛在 FDL 物件上快取，
+    同一份佈局的多個檢視共用同一組陣列。
+
+    Args:
+        fdl: 已解析的 FDL
+
+    Returns:
+        FDLFlat: 扁平檢視（請勿修改）
+    """
+    flat = getattr(fdl, "_flat", None)
+    if flat is not None:
+        return flat
+
+    site = fdl.site
+    areas = site.areas
+    n_areas = len(areas)
+    n = site.total_instances
+
+    area_ids: List[str] = []
+    area_names: List[str] = []
+    area_types: List[str] = []
+    area_connection_counts = np.empty(n_areas, dtype=np.int32)
+    area_instance_offsets = np.empty(n_areas + 1, dtype=np.int32)
+    instance_ids: List[str] = []
+    instance_ref_assets: List[str] = []
+    instance_translation = np.empty((n, 3))
+
+    i = 0
+    for a, area in enumerate(areas):
+        area_ids.append(area.area_id)
+        area_names.append(area.name)
+        area_types.append(area.type)
+        area_connection_counts[a] = len(area.connections)
+        area_instance_offsets[a] = i
+        for instance in area.instances:
+            instance_ids.append(instance.instance_id)
+            instance_ref_assets.append(instance.ref_asset)
+            instance_translation[i] = instance.transform.translation
+            i += 1
+    area_instance_offsets[n_areas] = i
+
+    flat = FDLFlat(
+        area_ids=area_ids,
+        area_names=area_names,
+        area_types=area_types,
+        area_connection_counts=area_connection_counts,
+        area_instance_offsets=area_instance_offsets,
+        instance_ids=instance_ids,
+        instance_ref_assets=instance_ref_assets,
+        instance_translation=instance_translation,
+    )
+    # FDL 為非 slots dataclass：扁平檢視掛在物件上，
+    # 解析記憶層命中時亦隨物件共用
+    fdl._flat = flat
+    return flat
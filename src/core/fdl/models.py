@@ -0,0 +1,159 @@
+# src/core/fdl/models.py
+
+"""
+FDL 數據模型
+
+FDL (Factory Definition Language) v0.1 的工廠佈局模型。
+完整規格見 docs/FDL_v0.1_Specification.md。
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class Transform:
+    """
+    實例變換（FDL 座標系：Z-up，右手座標系）
+
+    Attributes:
+        translation: 平移 [x, y, z]
+        rotation: 旋轉（Euler XYZ，度）[rx, ry, rz]
+        scale: 縮放 [sx, sy, sz]
+    """
+    translation: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    rotation: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    scale: List[float] = field(default_factory=lambda: [1.0, 1.0, 1.0])
+
+
+@dataclass(slots=True)
+class AssetInstance:
+    """
+    資產實例
+
+    Attributes:
+        instance_id: 實例 ID（在 FDL 內唯一）
+        ref_asset: 引用的 IADL 資產 ID
+        name: 顯示名稱
+        transform: 實例變換
+        collision_bounds: 碰撞邊界定義
+        constraints: 實例約束（clearance 等）
+        metadata: 額外元數據
+    """
+    instance_id: str
+    ref_asset: str
+    name: str = ""
+    transform: Transform = field(default_factory=Transform)
+    collision_bounds: Dict[str, Any] = field(default_factory=dict)
+    constraints: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Connection:
+    """
+    連接（管線、電纜等）
+
+    Attributes:
+        connection_id: 連接 ID
+        type: 連接類型（例如 "pipe", "cable"）
+        name: 顯示名稱
+        from_instance_id: 起點實例 ID
+        from_port: 起點埠
+        to_instance_id: 終點實例 ID
+        to_port: 終點埠
+        path: 路徑定義
+        properties: 額外屬性
+    """
+    connection_id: str
+    type: str
+    name: str = ""
+    from_instance_id: str = ""
+    from_port: str = ""
+    to_instance_id: str = ""
+    to_port: str = ""
+    path: Dict[str, Any] = field(default_factory=dict)
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Area:
+    """
+    區域
+
+    Attributes:
+        area_id: 區域 ID
+        name: 區域名稱
+        type: 區域類型（例如 "production", "utility"）
+        boundary: 區域邊界定義
+        instances: 資產實例列表
+        connections: 連接列表
+    """
+    area_id: str
+    name: str
+    type: str = ""
+    boundary: Dict[str, Any] = field(default_factory=dict)
+    instances: List[AssetInstance] = field(default_factory=list)
+    connections: List[Connection] = field(default_factory=list)
+
+
+@dataclass
+class Location:
+    """廠區地理位置"""
+    latitude: float = 0.0
+    longitude: float = 0.0
+    altitude: float = 0.0
+
+
+@dataclass
+class Site:
+    """
+    廠區
+
+    Attributes:
+        site_id: 廠區 ID
+        name: 廠區名稱
+        location: 地理位置
+        areas: 區域列表
+    """
+    site_id: str
+    name: str
+    location: Optional[Location] = None
+    areas: List[Area] = field(default_factory=list)
+
+    # 佈局於解析後即不再變動，彙總計數以 cached_property
+    # 計算一次；樹狀檢視等每次重繪的摘要列不重走全部區域
+    @cached_property
+    def total_instances(self) -> int:
+        """全廠區的資產實例總數（快取）"""
+        return sum(len(area.instances) for area in self.areas)
+
+    @cached_property
+    def total_connections(self) -> int:
+        """全廠區的連接總數（快取）"""
+        return sum(len(area.connections) for area in self.areas)
+
+
+@dataclass
+class GlobalConstraints:
+    """全域約束"""
+    scaling_constraints: Dict[str, Any] = field(default_factory=dict)
+    collision_detection: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class FDL:
+    """
+    FDL 文件根節點
+
+    Attributes:
+        fdl_version: FDL 規格版本
+        units: 單位制定義（length, angle, up_axis, handedness）
+        site: 廠區
+        global_constraints: 全域約束
+    """
+    fdl_version: str
+    units: Dict[str, Any]
+    site: Site
+    global_constraints: Optional[GlobalConstraints] = None
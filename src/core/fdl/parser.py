@@ -0,0 +1,282 @@
+# src/core/fdl/parser.py
+
+"""
+FDL 解析器
+
+自 YAML/JSON 文件解析 FDL v0.1 工廠佈局。
+
+大型佈局可改用 `iter_fdl_instances` 以 YAML 事件流逐一產出
+資產實例，峰值記憶體自 O(文件大小) 降為 O(單一實例)。
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import yaml
+
+# libyaml 的 C loader 解析快 3-10x；PyYAML 未以 libyaml 編譯時
+# 退回純 Python 的 SafeLoader（語義相同）
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader
+
+from ..io.parse_cache import cached_parse
+from .models import (
+    Area,
+    AssetInstance,
+    Connection,
+    FDL,
+    GlobalConstraints,
+    Location,
+    Site,
+    Transform,
+)
+
+
+def _parse_vec3(data: Any, default: List[float]) -> List[float]:
+    """解析向量欄位（支援 {x,y,z} dict 與 [x,y,z] list 兩種寫法）"""
+    if data is None:
+        return list(default)
+    if isinstance(data, dict):
+        return [
+            float(data.get("x", default[0])),
+            float(data.get("y", default[1])),
+            float(data.get("z", default[2])),
+        ]
+    return [float(v) for v in data]
+
+
+def _parse_transform(data: Dict[str, Any]) -> Transform:
+    """解析 transform 區塊"""
+    if not data:
+        return Transform()
+    return Transform(
+        translation=_parse_vec3(data.get("translation"), [0.0, 0.0, 0.0]),
+        rotation=_parse_vec3(data.get("rotation"), [0.0, 0.0, 0.0]),
+        scale=_parse_vec3(data.get("scale"), [1.0, 1.0, 1.0]),
+    )
+
+
+def _parse_instance(data: Dict[str, Any]) -> AssetInstance:
+    """解析資產實例區塊"""
+    return AssetInstance(
+        instance_id=data["instance_id"],
+        ref_asset=data["ref_asset"],
+        name=data.get("name", ""),
+        transform=_parse_transform(data.get("transform", {})),
+        collision_bounds=data.get("collision_bounds", {}),
+        constraints=data.get("constraints", {}),
+        metadata=data.get("metadata", {}),
+    )
+
+
+def _parse_connection(data: Dict[str, Any]) -> Connection:
+    """解析連接區塊"""
+    from_data = data.get("from", {})
+    to_data = data.get("to", {})
+    return Connection(
+        connection_id=data["connection_id"],
+        type=data["type"],
+        name=data.get("name", ""),
+        from_instance_id=from_data.get("instance_id", ""),
+        from_port=from_data.get("port", ""),
+        to_instance_id=to_data.get("instance_id", ""),
+        to_port=to_data.get("port", ""),
+        path=data.get("path", {}),
+        properties=data.get("properties", {}),
+    )
+
+
+def _parse_area(data: Dict[str, Any]) -> Area:
+    """解析區域區塊"""
+    return Area(
+        area_id=data["area_id"],
+        name=data["name"],
+        type=data.get("type", ""),
+        boundary=data.get("boundary", {}),
+        instances=[_parse_instance(i) for i in data.get("instances", [])],
+        connections=[_parse_connection(c) for c in data.get("connections", [])],
+    )
+
+
+def parse_fdl_dict(data: Dict[str, Any]) -> FDL:
+    """
+    自 dict 構建 FDL
+
+    Args:
+        data: FDL 文件內容（已解析的 dict）
+
+    Returns:
+        FDL: 工廠佈局
+    """
+    site_data = data["site"]
+
+    location = None
+    loc_data = site_data.get("location")
+    if loc_data:
+        location = Location(
+            latitude=float(loc_data.get("latitude", 0.0)),
+            longitude=float(loc_data.get("longitude", 0.0)),
+            altitude=float(loc_data.get("altitude", 0.0)),
+        )
+
+    site = Site(
+        site_id=site_data["site_id"],
+        name=site_data["name"],
+        location=location,
+        areas=[_parse_area(a) for a in site_data.get("areas", [])],
+    )
+
+    global_constraints = None
+    gc_data = data.get("global_constraints")
+    if gc_data:
+        global_constraints = GlobalConstraints(
+            scaling_constraints=gc_data.get("scaling_constraints", {}),
+            collision_detection=gc_data.get("collision_detection", {}),
+        )
+
+    return FDL(
+        fdl_version=str(data.get("fdl_version", "0.1")),
+        units=data.get("units", {}),
+        site=site,
+        global_constraints=global_constraints,
+    )
+
+
+def parse_fdl_file(file_path: Union[str, Path], use_cache: bool = True) -> FDL:
+    """
+    自 YAML 文件解析 FDL 工廠佈局
+
+    文件未變動時（內容雜湊相同）直接自解析快取載入，
+    跳過 YAML 解析。
+
+    Args:
+        file_path: FDL 文件路徑
+        use_cache: 是否使用解析快取
+
+    Returns:
+        FDL: 工廠佈局
+    """
+    file_path = Path(file_path)
+    if use_cache:
+        return cached_parse(
+            file_path,
+            "fdl",
+            lambda data: parse_fdl_dict(yaml.load(data, Loader=_SafeLoader)),
+        )
+    with open(file_path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_SafeLoader)
+    return parse_fdl_dict(data)
+
+
+# -- 串流解析 ----------------------------------------------------------
+
+_RESOLVER = yaml.resolver.Resolver()
+
+_INSTANCES_KEY_PATH = ("site", "areas", "instances")
+
+
+def _scalar_value(event: "yaml.ScalarEvent") -> Any:
+    """依 YAML 隱式型別規則解析純量事件的值"""
+    tag = _RESOLVER.resolve(yaml.ScalarNode, event.value, event.implicit)
+    if tag.endswith(":int"):
+        return int(event.value)
+    if tag.endswith(":float"):
+        return float(event.value)
+    if tag.endswith(":bool"):
+        return event.value.lower() in ("true", "yes", "on")
+    if tag.endswith(":null"):
+        return None
+    return event.value
+
+
+def _build_value(event: Any, events: Iterator[Any]) -> Any:
+    """自事件流遞迴重建一個 YAML 節點為 Python 值"""
+    if isinstance(event, yaml.ScalarEvent):
+        return _scalar_value(event)
+    if isinstance(event, yaml.SequenceStartEvent):
+        seq: List[Any] = []
+        for ev in events:
+            if isinstance(ev, yaml.SequenceEndEvent):
+                return seq
+            seq.append(_build_value(ev, events))
+    if isinstance(event, yaml.MappingStartEvent):
+        mapping: Dict[Any, Any] = {}
+        for ev in events:
+            if isinstance(ev, yaml.MappingEndEvent):
+                return mapping
+            key = _build_value(ev, events)
+            mapping[key] = _build_value(next(events), events)
+    raise ValueError(f"非預期的 YAML 事件: {event!r}")
+
+
+def iter_fdl_instances(
+    file_path: Union[str, Path],
+) -> Iterator[Tuple[Optional[str], AssetInstance]]:
+    """
+    以 YAML 事件流逐一產出 FDL 資產實例
+
+    僅將單一實例的子樹具現化為 Python 物件，整份文件不會
+    同時駐留記憶體；適合多 GB 級佈局的增量載入。
+
+    Args:
+        file_path: FDL 文件路徑
+
+    Yields:
+        Tuple[Optional[str], AssetInstance]:
+            (所屬區域的 area_id, 資產實例)。
+            若實例出現在 area_id 欄位之前，area_id 為 None。
+    """
+    with open(file_path, "rb", buffering=1 << 20) as f:
+        events = yaml.parse(f)
+        # 每個 frame 為 ["map", 目前的鍵, 是否在等待鍵] 或 ["seq"]
+        stack: List[List[Any]] = []
+        current_area_id: Optional[str] = None
+
+        def _map_key_path() -> Tuple[str, ...]:
+            return tuple(
+                frame[1] for frame in stack if frame[0] == "map" and frame[1]
+            )
+
+        for event in events:
+            if isinstance(event, yaml.MappingStartEvent):
+                frame = stack[-1] if stack else None
+                if (
+                    frame is not None
+                    and frame[0] == "seq"
+                    and _map_key_path() == _INSTANCES_KEY_PATH
+                ):
+                    data = _build_value(event, events)
+                    yield current_area_id, _parse_instance(data)
+                    continue
+                if frame is not None and frame[0] == "map":
+                    frame[2] = True
+                stack.append(["map", None, True])
+            elif isinstance(event, yaml.SequenceStartEvent):
+                if stack and stack[-1][0] == "map":
+                    stack[-1][2] = True
+                stack.append(["seq"])
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                stack.pop()
+                if stack and stack[-1][0] == "seq" and _map_key_path() == (
+                    "site",
+                    "areas",
+                ):
+                    # 離開一個區域後重置 area_id
+                    current_area_id = None
+            elif isinstance(event, yaml.ScalarEvent):
+                if not stack:
+                    continue
+                frame = stack[-1]
+                if frame[0] == "map":
+                    if frame[2]:
+                        frame[1] = event.value
+                        frame[2] = False
+                    else:
+                        if (
+                            frame[1] == "area_id"
+                            and _map_key_path() == ("site", "areas", "area_id")
+                        ):
+                            current_area_id = event.value
+                        frame[2] = True
@@ -0,0 +1,112 @@
+# src/core/fdl/snapshot.py
+
+"""
+FDL 快照格式
+
+將 FDL 以 MessagePack 二進位快照儲存/載入，供執行期跳過 YAML 解析。
+YAML 解析約 20 MB/s，MessagePack 反序列化約 500 MB/s，
+大型佈局的載入時間可自數秒降至次百毫秒級。
+"""
+
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Union
+
+import msgpack
+
+from .models import (
+    Area,
+    AssetInstance,
+    Connection,
+    FDL,
+    GlobalConstraints,
+    Location,
+    Site,
+    Transform,
+)
+
+SNAPSHOT_SUFFIX = ".msgpack"
+
+
+def dump(fdl: FDL, file_path: Union[str, Path]):
+    """
+    將 FDL 寫為 MessagePack 快照
+
+    Args:
+        fdl: 工廠佈局
+        file_path: 快照文件路徑
+    """
+    data = msgpack.packb(asdict(fdl), use_bin_type=True)
+    with open(file_path, "wb", buffering=1 << 16) as f:
+        f.write(data)
+
+
+def _instance_from_plain(data: Dict[str, Any]) -> AssetInstance:
+    t = data["transform"]
+    return AssetInstance(
+        instance_id=data["instance_id"],
+        ref_asset=data["ref_asset"],
+        name=data["name"],
+        transform=Transform(
+            translation=t["translation"],
+            rotation=t["rotation"],
+            scale=t["scale"],
+        ),
+        collision_bounds=data["collision_bounds"],
+        constraints=data["constraints"],
+        metadata=data["metadata"],
+    )
+
+
+def _fdl_from_plain(data: Dict[str, Any]) -> FDL:
+    """自 asdict 形式的 dict 重建 FDL 數據類樹"""
+    site_data = data["site"]
+
+    location = None
+    if site_data.get("location"):
+        location = Location(**site_data["location"])
+
+    areas = [
+        Area(
+            area_id=a["area_id"],
+            name=a["name"],
+            type=a["type"],
+            boundary=a["boundary"],
+            instances=[_instance_from_plain(i) for i in a["instances"]],
+            connections=[Connection(**c) for c in a["connections"]],
+        )
+        for a in site_data["areas"]
+    ]
+
+    site = Site(
+        site_id=site_data["site_id"],
+        name=site_data["name"],
+        location=location,
+        areas=areas,
+    )
+
+    global_constraints = None
+    if data.get("global_constraints"):
+        global_constraints = GlobalConstraints(**data["global_constraints"])
+
+    return FDL(
+        fdl_version=data["fdl_version"],
+        units=data["units"],
+        site=site,
+        global_constraints=global_constraints,
+    )
+
+
+def load(file_path: Union[str, Path]) -> FDL:
+    """
+    自 MessagePack 快照載入 FDL
+
+    Args:
+        file_path: 快照文件路徑
+
+    Returns:
+        FDL: 工廠佈局
+    """
+    with open(file_path, "rb", buffering=1 << 16) as f:
+        data = msgpack.unpackb(f.read(), raw=False)
+    return _fdl_from_plain(data)
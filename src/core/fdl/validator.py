@@ -0,0 +1,164 @@
+# src/core/fdl/validator.py
+
+"""
+FDL 驗證器
+
+驗證 FDL 工廠佈局的結構完整性與約束（實例 ID 唯一性、
+連接端點存在性、縮放約束等）。
+"""
+
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from .models import FDL, Site
+from .parser import parse_fdl_file
+
+
+def parse_and_validate_fdl_file(
+    file_path: Union[str, Path], use_cache: bool = True
+) -> Tuple[FDL, List[str]]:
+    """
+    解析並驗證 FDL 文件（單一入口）
+
+    解析完成後立即在同一呼叫內跑完整驗證：物件樹仍在快取熱區
+    時走訪一次，呼叫端不再於「解析 → 使用 → 驗證」間穿插
+    第二次載入。
+
+    Args:
+        file_path: FDL 文件路徑
+        use_cache: 是否使用解析快取
+
+    Returns:
+        Tuple[FDL, List[str]]: (工廠佈局, 錯誤訊息列表)
+    """
+    fdl = parse_fdl_file(file_path, use_cache=use_cache)
+    return fdl, FDLValidator(fdl).validate()
+
+
+class FDLValidator:
+    """FDL 驗證器"""
+
+    def __init__(self, fdl: Optional[FDL] = None):
+        self.fdl = fdl
+
+    def validate_site(self, site: Site) -> List[str]:
+        """
+        驗證廠區結構
+
+        Args:
+            site: 廠區
+
+        Returns:
+            List[str]: 錯誤訊息列表（空列表表示驗證通過）
+        """
+        errors: List[str] = []
+
+        seen_instance_ids = set()
+        seen_area_ids = set()
+
+        for area in site.areas:
+            if area.area_id in seen_area_ids:
+                errors.append(f"重複的 area_id: {area.area_id}")
+            seen_area_ids.add(area.area_id)
+
+            for instance in area.instances:
+                if instance.instance_id in seen_instance_ids:
+                    errors.append(f"重複的 instance_id: {instance.instance_id}")
+                seen_instance_ids.add(instance.instance_id)
+
+                if not instance.ref_asset:
+                    errors.append(
+                        f"實例 {instance.instance_id}: ref_asset 不可為空"
+                    )
+
+                scale = instance.transform.scale
+                if any(s <= 0 for s in scale):
+                    errors.append(
+                        f"實例 {instance.instance_id}: scale 必須為正值，得到 {scale}"
+                    )
+
+            for conn in area.connections:
+                if conn.from_instance_id and conn.from_instance_id not in seen_instance_ids:
+                    errors.append(
+                        f"連接 {conn.connection_id}: 起點實例 "
+                        f"{conn.from_instance_id} 不存在"
+                    )
+                if conn.to_instance_id and conn.to_instance_id not in seen_instance_ids:
+                    errors.append(
+                        f"連接 {conn.connection_id}: 終點實例 "
+                        f"{conn.to_instance_id} 不存在"
+                    )
+
+        return errors
+
+    def validate_clearance(
+        self, site: Site, clearance_distance: float
+    ) -> List[str]:
+        """
+        驗證實例間的最小間距（向量化）
+
+        平移先攤平為 (N, 3) ndarray，成對距離以單一 numpy
+        廣播運算整批算完；Python 層只走訪違規的配對，
+        而非 O(N²) 的逐對迴圈。
+
+        Args:
+            site: 廠區
+            clearance_distance: 最小間距（公尺）
+
+        Returns:
+            List[str]: 錯誤訊息列表
+        """
+        instance_ids: List[str] = []
+        n = site.total_instances
+        if n < 2:
+            return []
+        translations = np.empty((n, 3))
+        i = 0
+        for area in site.areas:
+            for instance in area.instances:
+                translations[i] = instance.transform.translation
+                instance_ids.append(instance.instance_id)
+                i += 1
+
+        diff = translations[:, None, :] - translations[None, :, :]
+        dist = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+        iu, ju = np.triu_indices(n, k=1)
+        too_close = dist[iu, ju] < clearance_distance
+        return [
+            (
+                f"實例 {instance_ids[a]} 與 {instance_ids[b]} 間距 "
+                f"{dist[a, b]:.3f} m，低於最小間距 {clearance_distance} m"
+            )
+            for a, b in zip(iu[too_close], ju[too_close])
+        ]
+
+    def validate(self, fdl: Optional[FDL] = None) -> List[str]:
+        """
+        驗證完整 FDL 文件
+
+        Args:
+            fdl: 工廠佈局（None 時使用構造時傳入者）
+
+        Returns:
+            List[str]: 錯誤訊息列表
+        """
+        fdl = fdl or self.fdl
+        if fdl is None:
+            return ["未提供 FDL"]
+
+        errors: List[str] = []
+        if not fdl.fdl_version:
+            errors.append("fdl_version 不可為空")
+        errors.extend(self.validate_site(fdl.site))
+
+        gc = fdl.global_constraints
+        if gc is not None:
+            cd = gc.collision_detection
+            clearance = cd.get("clearance_distance")
+            if cd.get("enabled") and clearance:
+                errors.extend(
+                    self.validate_clearance(fdl.site, float(clearance))
+                )
+        return errors
@@ -0,0 +1,171 @@
+# src/core/geom/bbox.py
+
+"""
+包圍盒計算
+
+AABB（軸對齊包圍盒）模型與局部 → 世界座標的 AABB 轉換。
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+
+from ..fdl.models import Transform
+
+
+@dataclass(slots=True)
+class AABB:
+    """
+    軸對齊包圍盒
+
+    Attributes:
+        min: 最小角點 [x, y, z]
+        max: 最大角點 [x, y, z]
+    """
+    min: List[float]
+    max: List[float]
+
+    def intersects(self, other: "AABB") -> bool:
+        """
+        是否與另一 AABB 相交
+
+        Args:
+            other: 另一 AABB
+
+        Returns:
+            bool: 是否相交
+        """
+        return (
+            self.min[0] <= other.max[0] and self.max[0] >= other.min[0]
+            and self.min[1] <= other.max[1] and self.max[1] >= other.min[1]
+            and self.min[2] <= other.max[2] and self.max[2] >= other.min[2]
+        )
+
+
+def _rotation_matrix(rotation_deg: List[float]) -> List[List[float]]:
+    """自 Euler XYZ（度）構建 3x3 旋轉矩陣（R = Rz @ Ry @ Rx）"""
+    rx, ry, rz = (math.radians(v) for v in rotation_deg)
+    cx, sx = math.cos(rx), math.sin(rx)
+    cy, sy = math.cos(ry), math.sin(ry)
+    cz, sz = math.cos(rz), math.sin(rz)
+    return [
+        [cz * cy, cz * sy * sx - sz * cx, cz * sy * cx + sz * sx],
+        [sz * cy, sz * sy * sx + cz * cx, sz * sy * cx - cz * sx],
+        [-sy, cy * sx, cy * cx],
+    ]
+
+
+def compute_world_aabb(
+    local_min: List[float],
+    local_max: List[float],
+    transform: Transform,
+) -> AABB:
+    """
+    計算局部 AABB 經實例變換後的世界 AABB
+
+    轉換 8 個角點（scale → rotate → translate）後取 min/max。
+
+    Args:
+        local_min: 局部 AABB 最小角點
+        local_max: 局部 AABB 最大角點
+        transform: 實例變換
+
+    Returns:
+        AABB: 世界座標 AABB
+    """
+    sx, sy, sz = transform.scale
+    tx, ty, tz = transform.translation
+    rot = _rotation_matrix(transform.rotation)
+
+    corners = [
+        (x, y, z)
+        for x in (local_min[0], local_max[0])
+        for y in (local_min[1], local_max[1])
+        for z in (local_min[2], local_max[2])
+    ]
+
+    world_min = [math.inf, math.inf, math.inf]
+    world_max = [-math.inf, -math.inf, -math.inf]
+    for x, y, z in corners:
+        x, y, z = x * sx, y * sy, z * sz
+        wx = rot[0][0] * x + rot[0][1] * y + rot[0][2] * z + tx
+        wy = rot[1][0] * x + rot[1][1] * y + rot[1][2] * z + ty
+        wz = rot[2][0] * x + rot[2][1] * y + rot[2][2] * z + tz
+        for i, v in enumerate((wx, wy, wz)):
+            if v < world_min[i]:
+                world_min[i] = v
+            if v > world_max[i]:
+                world_max[i] = v
+    return AABB(min=world_min, max=world_max)
+
+
+def _rotation_matrices(rotations_deg: np.ndarray) -> np.ndarray:
+    """自 Euler XYZ（度）批量構建 (N,3,3) 旋轉矩陣（R = Rz @ Ry @ Rx）"""
+    rad = np.radians(rotations_deg)
+    cx, sx = np.cos(rad[:, 0]), np.sin(rad[:, 0])
+    cy, sy = np.cos(rad[:, 1]), np.sin(rad[:, 1])
+    cz, sz = np.cos(rad[:, 2]), np.sin(rad[:, 2])
+    rot = np.empty((len(rotations_deg), 3, 3), dtype=np.float32)
+    rot[:, 0, 0] = cz * cy
+    rot[:, 0, 1] = cz * sy * sx - sz * cx
+    rot[:, 0, 2] = cz * sy * cx + sz * sx
+    rot[:, 1, 0] = sz * cy
+    rot[:, 1, 1] = sz * sy * sx + cz * cx
+    rot[:, 1, 2] = sz * sy * cx - cz * sx
+    rot[:, 2, 0] = -sy
+    rot[:, 2, 1] = cy * sx
+    rot[:, 2, 2] = cy * cx
+    return rot
+
+
+def compute_world_aabbs(
+    local_min: List[float],
+    local_max: List[float],
+    transforms: Sequence[Transform],
+) -> List[AABB]:
+    """
+    批量計算共享同一局部 AABB 的多個實例的世界 AABB
+
+    以 NumPy broadcasting 一次轉換全部 N×8 個角點（連續浮點運算，
+    SIMD 向量化），攤提後遠快於逐實例的純 Python 轉換。
+
+    Args:
+        local_min: 局部 AABB 最小角點
+        local_max: 局部 AABB 最大角點
+        transforms: 各實例的變換
+
+    Returns:
+        List[AABB]: 與 transforms 同序的世界 AABB 列表
+    """
+    t = np.array(
+        [tr.translation for tr in transforms], dtype=np.float32
+    )
+    scale = np.array([tr.scale for tr in transforms], dtype=np.float32)
+    rot = _rotation_matrices(
+        np.array([tr.rotation for tr in transforms], dtype=np.float32)
+    )
+
+    # (8,3) 局部角點，所有實例共用
+    corners = np.array(
+        [
+            (x, y, z)
+            for x in (local_min[0], local_max[0])
+            for y in (local_min[1], local_max[1])
+            for z in (local_min[2], local_max[2])
+        ],
+        dtype=np.float32,
+    )
+
+    # (N,8,3)：縮放 → 旋轉 → 平移
+    corners_world = (
+        (corners[None, :, :] * scale[:, None, :]) @ rot.transpose(0, 2, 1)
+        + t[:, None, :]
+    )
+    mins = corners_world.min(axis=1)
+    maxs = corners_world.max(axis=1)
+    return [
+        AABB(min=mins[i].tolist(), max=maxs[i].tolist())
+        for i in range(len(transforms))
+    ]
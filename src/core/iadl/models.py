@@ -0,0 +1,54 @@
+# src/core/iadl/models.py
+
+"""
+IADL 數據模型
+
+IADL (Industrial Asset Definition Language) v1.0 的資產定義模型。
+完整規格見 docs/IADL_v1.0_Specification.md。
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ..tags.models import Tag
+
+
+@dataclass
+class BBox:
+    """資產包圍盒（資產局部座標，單位與資產一致）"""
+    min: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    max: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+
+
+@dataclass
+class Asset:
+    """
+    IADL 資產定義
+
+    Attributes:
+        asset_id: 資產 ID（唯一）
+        name: 資產名稱
+        asset_type: 資產類型（例如 "pump", "chiller"）
+        description: 描述
+        version: 資產定義版本
+        usd_file: 資產的 USD 模型檔路徑
+        bbox: 資產包圍盒
+        tags: Tag 定義列表
+        metadata: 額外元數據
+    """
+    asset_id: str
+    name: str
+    asset_type: str = ""
+    description: str = ""
+    version: str = "1.0"
+    usd_file: Optional[str] = None
+    bbox: Optional[BBox] = None
+    tags: List[Tag] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def get_tag(self, name: str) -> Optional[Tag]:
+        """依名稱查找 Tag 定義"""
+        for tag in self.tags:
+            if tag.name == name:
+                return tag
+        return None
@@ -0,0 +1,75 @@
+# src/core/iadl/parser.py
+
+"""
+IADL 解析器
+
+自 YAML/JSON 文件解析 IADL 資產定義。
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Union
+
+import yaml
+
+from ..io.parse_cache import cached_parse
+from ..tags.models import Tag
+from .models import Asset, BBox
+
+
+def parse_iadl_dict(data: Dict[str, Any]) -> Asset:
+    """
+    自 dict 構建 Asset
+
+    Args:
+        data: IADL 資產定義（已解析的 dict）
+
+    Returns:
+        Asset: 資產定義
+    """
+    asset_data = data.get("asset", data)
+
+    bbox = None
+    bbox_data = asset_data.get("bbox")
+    if bbox_data:
+        bbox = BBox(
+            min=list(bbox_data.get("min", [0.0, 0.0, 0.0])),
+            max=list(bbox_data.get("max", [0.0, 0.0, 0.0])),
+        )
+
+    tags = [Tag.from_dict(t) for t in asset_data.get("tags", [])]
+
+    return Asset(
+        asset_id=asset_data["asset_id"],
+        name=asset_data["name"],
+        asset_type=asset_data.get("asset_type", ""),
+        description=asset_data.get("description", ""),
+        version=asset_data.get("version", "1.0"),
+        usd_file=asset_data.get("usd_file"),
+        bbox=bbox,
+        tags=tags,
+        metadata=asset_data.get("metadata", {}),
+    )
+
+
+def parse_iadl_file(file_path: Union[str, Path], use_cache: bool = True) -> Asset:
+    """
+    自 YAML 文件解析 IADL 資產定義
+
+    文件未變動時（內容雜湊相同）直接自解析快取載入，
+    跳過 YAML 解析。
+
+    Args:
+        file_path: IADL 文件路徑
+        use_cache: 是否使用解析快取
+
+    Returns:
+        Asset: 資產定義
+    """
+    file_path = Path(file_path)
+    if use_cache:
+        return cached_parse(
+            file_path, "iadl", lambda data: parse_iadl_dict(yaml.safe_load(data))
+        )
+    with open(file_path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    return parse_iadl_dict(data)
@@ -0,0 +1,103 @@
+# src/core/io/parse_cache.py
+
+"""
+解析結果快取
+
+以文件內容雜湊（BLAKE2b）為鍵，將解析結果 pickle 到
+`~/.cache/idtf/<namespace>/<hash>.pkl`。YAML 解析速度約 20 MB/s，
+BLAKE2b 雜湊約 2 GB/s，因此文件未變動時可將載入成本
+自「重新解析」降為「雜湊 + unpickle」。
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+CACHE_ROOT = Path(
+    os.environ.get("IDTF_CACHE_DIR", str(Path.home() / ".cache" / "idtf"))
+)
+
+# 行程內記憶層：以 (路徑, mtime_ns, 大小) 為鍵。同一行程內
+# 重複解析同一文件（多個測試模組載入同一份 FDL）連讀檔、
+# 雜湊與 unpickle 都省下，直接共用已解析的物件樹
+_MEMO: Dict[Tuple[str, str, int, int], Any] = {}
+
+# 快取格式版本：混入內容雜湊。模型 dataclass 的欄位佈局改變時
+# 遞增，使舊 pickle 整批失效（slots pickle 可成功還原但缺新欄位，
+# 僅靠內容雜湊偵測不到）
+CACHE_FORMAT_VERSION = 2
+
+
+def cached_parse(
+    file_path: Path,
+    namespace: str,
+    parse_fn: Callable[[bytes], Any],
+) -> Any:
+    """
+    以內容雜湊快取解析結果
+
+    Args:
+        file_path: 來源文件路徑
+        namespace: 快取命名空間（例如 "fdl", "iadl"）
+        parse_fn: 解析函式（輸入文件 bytes，返回解析結果）
+
+    Returns:
+        Any: 解析結果（行程內命中直接共用物件樹；
+            磁碟命中自 pickle 載入）
+    """
+    stat = file_path.stat()
+    memo_key = (namespace, str(file_path), stat.st_mtime_ns, stat.st_size)
+    obj = _MEMO.get(memo_key)
+    if obj is not None:
+        return obj
+
+    data = file_path.read_bytes()
+    hasher = hashlib.blake2b(data, digest_size=16)
+    hasher.update(str(CACHE_FORMAT_VERSION).encode())
+    digest = hasher.hexdigest()
+    cache_file = CACHE_ROOT / namespace / f"{digest}.pkl"
+
+    if cache_file.exists():
+        try:
+            obj = pickle.loads(cache_file.read_bytes())
+            _MEMO[memo_key] = obj
+            return obj
+        except Exception:
+            # 快取損毀或版本不相容時重新解析
+            pass
+
+    obj = parse_fn(data)
+    _MEMO[memo_key] = obj
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(
+            pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+    except OSError:
+        # 快取寫入失敗不影響解析結果
+        pass
+
+    return obj
+
+
+def clear_cache(namespace: str) -> int:
+    """
+    清除指定命名空間的快取
+
+    Args:
+        namespace: 快取命名空間
+
+    Returns:
+        int: 刪除的快取文件數量
+    """
+    cache_dir = CACHE_ROOT / namespace
+    if not cache_dir.exists():
+        return 0
+    count = 0
+    for cache_file in cache_dir.glob("*.pkl"):
+        cache_file.unlink()
+        count += 1
+    return count
@@ -0,0 +1,82 @@
+# src/core/runtime/asset_library_svc.py
+
+"""
+資產庫服務
+
+管理已載入的 IADL 資產定義，提供依 ID 查找與批量載入。
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from ..iadl.models import Asset
+from ..iadl.parser import parse_iadl_file
+
+
+class AssetLibrary:
+    """IADL 資產庫"""
+
+    def __init__(self):
+        self.assets: Dict[str, Asset] = {}
+
+    def add_asset(self, asset: Asset):
+        """
+        加入資產定義
+
+        Args:
+            asset: IADL 資產定義
+        """
+        self.assets[asset.asset_id] = asset
+
+    def add_many(self, assets: Iterable[Asset]):
+        """
+        批量加入資產定義（單次 dict.update）
+
+        Args:
+            assets: IADL 資產定義集合
+        """
+        self.assets.update((asset.asset_id, asset) for asset in assets)
+
+    def get_asset(self, asset_id: str) -> Optional[Asset]:
+        """
+        依 ID 查找資產定義
+
+        Args:
+            asset_id: 資產 ID
+
+        Returns:
+            Optional[Asset]: 資產定義（不存在時為 None）
+        """
+        return self.assets.get(asset_id)
+
+    def load_directory(self, directory: Union[str, Path]) -> List[Asset]:
+        """
+        載入目錄下所有 IADL YAML 文件
+
+        多文件時以執行緒池平行解析：文件 I/O 與 libyaml C loader
+        的解析段都會釋放 GIL，多核下整個目錄的載入時間接近
+        最大單文件時間。結果依路徑排序，與逐一載入語義相同。
+
+        Args:
+            directory: IADL 目錄路徑
+
+        Returns:
+            List[Asset]: 載入的資產定義列表
+        """
+        paths = sorted(Path(directory).glob("*.yaml"))
+        if len(paths) > 1:
+            workers = min(8, os.cpu_count() or 1, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                loaded = list(ex.map(parse_iadl_file, paths))
+        else:
+            loaded = [parse_iadl_file(p) for p in paths]
+        self.add_many(loaded)
+        return loaded
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+    def __repr__(self) -> str:
+        return f"AssetLibrary(assets={len(self.assets)})"
@@ -0,0 +1,301 @@
+# src/core/runtime/layout_svc.py
+
+"""
+Layout Service（佈局服務）
+
+管理 FDL 工廠佈局的運行時可變視圖：實例增刪、變換更新、
+批量佈局生成與 AABB 碰撞檢測。
+
+碰撞檢測所需的世界 AABB 以 generation 計數快取於服務內：
+僅變換有異動的實例會重新計算 AABB，靜態場景下重複查詢
+為 O(N) 而非 O(N × 變換成本)。
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from ..fdl.models import Area, AssetInstance, FDL, Transform
+from ..geom.bbox import AABB, compute_world_aabb, compute_world_aabbs
+from .asset_library_svc import AssetLibrary
+
+# 無資產定義（或定義缺 bbox）時使用的後備局部包圍盒
+_DEFAULT_LOCAL_BBOX = ([-0.5, -0.5, 0.0], [0.5, 0.5, 1.0])
+
+
+class LayoutService:
+    """佈局服務"""
+
+    def __init__(self, asset_library: Optional[AssetLibrary] = None):
+        self.asset_library = asset_library
+        self.lock = threading.Lock()
+        self.fdl: Optional[FDL] = None
+
+        self._areas_by_id: Dict[str, Area] = {}
+        self.instances: Dict[str, AssetInstance] = {}
+        self._instance_to_area: Dict[str, str] = {}
+
+        # AABB 快取（generation-based invalidation）：
+        # _gen 於任何佈局異動時遞增；_instance_gen 記錄實例最後
+        # 異動時的 generation；_aabb_gen 記錄快取計算時的 generation。
+        # 兩者不相等即表示快取過期。
+        self._gen: int = 0
+        self._instance_gen: Dict[str, int] = {}
+        self._aabb_cache: Dict[str, AABB] = {}
+        self._aabb_gen: Dict[str, int] = {}
+
+    def load_fdl(self, fdl: FDL):
+        """
+        載入 FDL 工廠佈局並建立索引
+
+        Args:
+            fdl: 已解析的 FDL
+        """
+        with self.lock:
+            self.fdl = fdl
+            self._areas_by_id.clear()
+            self.instances.clear()
+            self._instance_to_area.clear()
+            self._instance_gen.clear()
+            self._aabb_cache.clear()
+            self._aabb_gen.clear()
+            self._gen += 1
+            for area in fdl.site.areas:
+                self._areas_by_id[area.area_id] = area
+                for instance in area.instances:
+                    self.instances[instance.instance_id] = instance
+                    self._instance_to_area[instance.instance_id] = area.area_id
+                    self._instance_gen[instance.instance_id] = self._gen
+
+    def add_instance(self, area_id: str, instance: AssetInstance):
+        """
+        新增資產實例到指定區域
+
+        Args:
+            area_id: 目標區域 ID
+            instance: 資產實例
+
+        Raises:
+            KeyError: 區域不存在
+        """
+        with self.lock:
+            area = self._areas_by_id[area_id]
+            area.instances.append(instance)
+            self.instances[instance.instance_id] = instance
+            self._instance_to_area[instance.instance_id] = area_id
+            self._gen += 1
+            self._instance_gen[instance.instance_id] = self._gen
+
+    def add_instances_bulk(self, area_id: str, instances: List[AssetInstance]):
+        """
+        批量新增資產實例到指定區域
+
+        整批只取一次鎖：以單次 list.extend 接入區域，索引一併
+        批量更新。萬級批量下鎖操作自 N 次降為 1 次。
+
+        Args:
+            area_id: 目標區域 ID
+            instances: 資產實例列表
+
+        Raises:
+            KeyError: 區域不存在
+        """
+        with self.lock:
+            area = self._areas_by_id[area_id]
+            area.instances.extend(instances)
+            self._gen += 1
+            gen = self._gen
+            for instance in instances:
+                instance_id = instance.instance_id
+                self.instances[instance_id] = instance
+                self._instance_to_area[instance_id] = area_id
+                self._instance_gen[instance_id] = gen
+
+    def remove_instance(self, instance_id: str) -> Optional[AssetInstance]:
+        """
+        移除資產實例
+
+        Args:
+            instance_id: 實例 ID
+
+        Returns:
+            Optional[AssetInstance]: 被移除的實例（不存在時為 None）
+        """
+        with self.lock:
+            instance = self.instances.pop(instance_id, None)
+            if instance is None:
+                return None
+            area_id = self._instance_to_area.pop(instance_id)
+            self._areas_by_id[area_id].instances.remove(instance)
+            self._gen += 1
+            self._instance_gen.pop(instance_id, None)
+            self._aabb_cache.pop(instance_id, None)
+            self._aabb_gen.pop(instance_id, None)
+            return instance
+
+    def update_instance_transform(self, instance_id: str, transform: Transform):
+        """
+        更新實例變換（標記其 AABB 快取過期）
+
+        Args:
+            instance_id: 實例 ID
+            transform: 新變換
+
+        Raises:
+            KeyError: 實例不存在
+        """
+        with self.lock:
+            instance = self.instances[instance_id]
+            instance.transform = transform
+            self._gen += 1
+            self._instance_gen[instance_id] = self._gen
+
+    def generate_batch_instances(
+        self,
+        ref_asset: str,
+        count: int,
+        id_prefix: str,
+        origin: Optional[List[float]] = None,
+        spacing: float = 2.0,
+        columns: int = 10,
+    ) -> List[AssetInstance]:
+        """
+        生成網格排列的批量實例（不加入佈局）
+
+        Args:
+            ref_asset: 引用的 IADL 資產 ID
+            count: 實例數量
+            id_prefix: 實例 ID 前綴
+            origin: 網格原點 [x, y, z]
+            spacing: 網格間距（米）
+            columns: 每列實例數
+
+        Returns:
+            List[AssetInstance]: 生成的實例列表
+        """
+        ox, oy, oz = origin or [0.0, 0.0, 0.0]
+        instances = []
+        for i in range(count):
+            row, col = divmod(i, columns)
+            instances.append(
+                AssetInstance(
+                    instance_id=f"{id_prefix}_{i:04d}",
+                    ref_asset=ref_asset,
+                    name=f"{id_prefix} {i}",
+                    transform=Transform(
+                        translation=[
+                            ox + col * spacing,
+                            oy + row * spacing,
+                            oz,
+                        ]
+                    ),
+                )
+            )
+        return instances
+
+    def generate_batch_layout(
+        self,
+        area_id: str,
+        ref_asset: str,
+        count: int,
+        id_prefix: str,
+        **kwargs,
+    ) -> List[AssetInstance]:
+        """
+        生成批量實例並加入指定區域
+
+        Args:
+            area_id: 目標區域 ID
+            ref_asset: 引用的 IADL 資產 ID
+            count: 實例數量
+            id_prefix: 實例 ID 前綴
+            **kwargs: 傳給 generate_batch_instances 的網格參數
+
+        Returns:
+            List[AssetInstance]: 加入的實例列表
+        """
+        instances = self.generate_batch_instances(
+            ref_asset, count, id_prefix, **kwargs
+        )
+        self.add_instances_bulk(area_id, instances)
+        return instances
+
+    def _local_bbox(
+        self, instance: AssetInstance
+    ) -> Tuple[List[float], List[float]]:
+        """取得實例的局部包圍盒（資產定義 bbox → collision_bounds → 後備）"""
+        if self.asset_library is not None:
+            asset = self.asset_library.get_asset(instance.ref_asset)
+            if asset is not None and asset.bbox is not None:
+                return asset.bbox.min, asset.bbox.max
+        bounds = instance.collision_bounds
+        if bounds.get("min") and bounds.get("max"):
+            return bounds["min"], bounds["max"]
+        return _DEFAULT_LOCAL_BBOX
+
+    def instance_aabbs(self) -> Dict[str, AABB]:
+        """
+        獲取所有實例的世界 AABB（快取；僅重算過期項）
+
+        Returns:
+            Dict[str, AABB]: instance_id → 世界 AABB（請勿修改）
+        """
+        with self.lock:
+            cache = self._aabb_cache
+            aabb_gen = self._aabb_gen
+            # 過期項依局部包圍盒分組：同一資產定義的實例共用一組
+            # (8,3) 角點，可用 NumPy broadcasting 一次轉換整組。
+            stale_groups: Dict[
+                Tuple[Tuple[float, ...], Tuple[float, ...]],
+                List[AssetInstance],
+            ] = {}
+            for instance_id, instance in self.instances.items():
+                gen = self._instance_gen[instance_id]
+                if aabb_gen.get(instance_id) == gen:
+                    continue
+                local_min, local_max = self._local_bbox(instance)
+                key = (tuple(local_min), tuple(local_max))
+                stale_groups.setdefault(key, []).append(instance)
+                aabb_gen[instance_id] = gen
+            for (local_min, local_max), group in stale_groups.items():
+                if len(group) == 1:
+                    instance = group[0]
+                    cache[instance.instance_id] = compute_world_aabb(
+                        local_min, local_max, instance.transform
+                    )
+                    continue
+                aabbs = compute_world_aabbs(
+                    local_min,
+                    local_max,
+                    [instance.transform for instance in group],
+                )
+                for instance, aabb in zip(group, aabbs):
+                    cache[instance.instance_id] = aabb
+            return cache
+
+    def detect_collisions(self) -> List[Tuple[str, str]]:
+        """
+        檢測實例間的 AABB 碰撞
+
+        使用服務內的 AABB 快取：靜態場景下重複查詢不重算變換。
+
+        Returns:
+            List[Tuple[str, str]]: 相交的實例 ID 對
+        """
+        aabbs = self.instance_aabbs()
+        ids = list(aabbs)
+        collisions = []
+        for i, id_a in enumerate(ids):
+            aabb_a = aabbs[id_a]
+            for id_b in ids[i + 1:]:
+                if aabb_a.intersects(aabbs[id_b]):
+                    collisions.append((id_a, id_b))
+        return collisions
+
+    def __len__(self) -> int:
+        return len(self.instances)
+
+    def __repr__(self) -> str:
+        return (
+            f"LayoutService(areas={len(self._areas_by_id)}, "
+            f"instances={len(self.instances)})"
+        )
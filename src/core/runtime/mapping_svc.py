@@ -0,0 +1,184 @@
+# src/core/runtime/mapping_svc.py
+
+"""
+映射服務
+
+管理 Tag 實例與外部系統（OPC UA、AVEVA PI、Modbus 等）
+數據位址之間的映射，支援高頻輪詢場景下的並行存取。
+"""
+
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class TagInstance:
+    """
+    Tag 實例（不可變）
+
+    Attributes:
+        tag_instance_id: Tag 實例 ID（asset_instance_id + tag_id）
+        asset_instance_id: 所屬資產實例 ID
+        tag_id: IADL Tag 定義 ID
+        properties: 額外屬性
+    """
+    tag_instance_id: str
+    asset_instance_id: str
+    tag_id: str
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        # asset_instance_id 在同一資產的多個 Tag 間重複，intern 後
+        # dict 查找與相等比較走指標比較的快路徑
+        object.__setattr__(
+            self, "asset_instance_id", sys.intern(self.asset_instance_id)
+        )
+
+
+@dataclass(slots=True)
+class TagMapping:
+    """
+    Tag 映射
+
+    Attributes:
+        tag_instance_id: Tag 實例 ID
+        external_source: 外部系統類型（例如 "OPC_UA", "AVEVA_PI", "Modbus"）
+        external_address: 外部數據位址
+        polling_interval_ms: 輪詢間隔（毫秒）
+        properties: 額外屬性
+    """
+    tag_instance_id: str
+    external_source: str
+    external_address: str
+    polling_interval_ms: int = 1000
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+
+class MappingService:
+    """
+    映射服務
+
+    內部以 16 路分片（shard）儲存，每個分片有獨立鎖：
+    不相關鍵的讀寫不會互相序列化，高頻輪詢下鎖競爭約降為 1/16。
+    """
+
+    _SHARD_COUNT = 16
+    _SHARD_MASK = _SHARD_COUNT - 1
+
+    def __init__(self):
+        self._instance_shards: List[Dict[str, TagInstance]] = [
+            {} for _ in range(self._SHARD_COUNT)
+        ]
+        self._mapping_shards: List[Dict[str, TagMapping]] = [
+            {} for _ in range(self._SHARD_COUNT)
+        ]
+        self._locks: List[threading.Lock] = [
+            threading.Lock() for _ in range(self._SHARD_COUNT)
+        ]
+        # by-source 索引為跨分片結構，以獨立鎖保護
+        self._mappings_by_source: Dict[str, List[TagMapping]] = {}
+        self._source_lock = threading.Lock()
+
+    def _shard(self, key: str) -> int:
+        """計算鍵所屬分片"""
+        return hash(key) & self._SHARD_MASK
+
+    # -- Tag 實例 ------------------------------------------------------
+
+    def create_tag_instance(self, tag_instance: TagInstance):
+        """
+        創建 Tag 實例
+
+        Args:
+            tag_instance: Tag 實例
+        """
+        i = self._shard(tag_instance.tag_instance_id)
+        with self._locks[i]:
+            self._instance_shards[i][tag_instance.tag_instance_id] = tag_instance
+
+    def get_tag_instance(self, tag_instance_id: str) -> Optional[TagInstance]:
+        """
+        查找 Tag 實例
+
+        Args:
+            tag_instance_id: Tag 實例 ID
+
+        Returns:
+            Optional[TagInstance]: Tag 實例（不存在時為 None）
+        """
+        i = self._shard(tag_instance_id)
+        with self._locks[i]:
+            return self._instance_shards[i].get(tag_instance_id)
+
+    def remove_tag_instance(self, tag_instance_id: str) -> bool:
+        """
+        移除 Tag 實例（與其映射）
+
+        Args:
+            tag_instance_id: Tag 實例 ID
+
+        Returns:
+            bool: 是否有移除
+        """
+        i = self._shard(tag_instance_id)
+        with self._locks[i]:
+            removed = self._instance_shards[i].pop(tag_instance_id, None)
+            mapping = self._mapping_shards[i].pop(tag_instance_id, None)
+        if mapping is not None:
+            with self._source_lock:
+                source_list = self._mappings_by_source.get(mapping.external_source)
+                if source_list is not None:
+                    source_list.remove(mapping)
+        return removed is not None
+
+    # -- 映射 ----------------------------------------------------------
+
+    def create_mapping(self, mapping: TagMapping):
+        """
+        創建 Tag 映射
+
+        Args:
+            mapping: Tag 映射
+        """
+        # external_source 為低基數字串（OPC_UA / AVEVA_PI / Modbus ...），
+        # intern 後 by-source 索引的鍵比較為 O(1) 指標比較
+        mapping.external_source = sys.intern(mapping.external_source)
+        i = self._shard(mapping.tag_instance_id)
+        with self._locks[i]:
+            self._mapping_shards[i][mapping.tag_instance_id] = mapping
+        with self._source_lock:
+            self._mappings_by_source.setdefault(
+                mapping.external_source, []
+            ).append(mapping)
+
+    def get_mapping(self, tag_instance_id: str) -> Optional[TagMapping]:
+        """
+        查找 Tag 映射
+
+        Args:
+            tag_instance_id: Tag 實例 ID
+
+        Returns:
+            Optional[TagMapping]: Tag 映射（不存在時為 None）
+        """
+        i = self._shard(tag_instance_id)
+        with self._locks[i]:
+            return self._mapping_shards[i].get(tag_instance_id)
+
+    def get_mappings_by_source(self, external_source: str) -> List[TagMapping]:
+        """
+        依外部系統類型查找映射
+
+        Args:
+            external_source: 外部系統類型
+
+        Returns:
+            List[TagMapping]: 映射列表
+        """
+        with self._source_lock:
+            return list(self._mappings_by_source.get(external_source, ()))
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._mapping_shards)
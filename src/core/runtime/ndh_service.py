@@ -0,0 +1,439 @@
+# src/core/runtime/ndh_service.py
+
+"""
+NDH (Neutral Data Hub) 服務
+
+NDH 是事件中心：載入 IADL 資產庫與 FDL 工廠佈局，
+為每個資產實例生成 AssetServant / TagServant，
+並串接 Event Bus 與 TSDB。
+"""
+
+import sys
+from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..eventbus.async_proxy import AsyncEventBusProxy
+from ..eventbus.interfaces import IEventBus
+from ..fdl import snapshot
+from ..fdl.models import AssetInstance, FDL
+from ..fdl.parser import parse_fdl_file
+from ..iadl.models import Asset
+from ..tsdb.interfaces import ITSDB
+from ..tsdb.write_buffer import TSDBWriteBuffer
+from .asset_library_svc import AssetLibrary
+from .tag_servant import TagServant, TagServantConfig
+
+
+@dataclass(slots=True)
+class InstanceSoA:
+    """
+    FDL 資產實例的 SoA（structure-of-arrays）檢視
+
+    變換數值自 dataclass 樹攤平為連續 ndarray（列序同佈局
+    走訪序），數值消費端（間距檢查、批量變換）走向量化
+    numpy 而非逐實例的屬性鏈。
+
+    Attributes:
+        instance_ids: 實例 ID（與陣列列序對齊）
+        translations: (N, 3) float64 平移
+        rotations: (N, 3) float64 旋轉（度）
+        scales: (N, 3) float64 縮放
+    """
+    instance_ids: List[str]
+    translations: np.ndarray
+    rotations: np.ndarray
+    scales: np.ndarray
+
+
+class AssetServant:
+    """
+    Asset Servant（資產實例服務者）
+
+    對應一個 FDL 資產實例，持有其所有 TagServant。
+
+    對已知的資產定義，`specialize_servant_class` 會在載入期生成
+    專屬子類，將各 TagServant 綁定為同名屬性，熱路徑上的
+    Tag 查找自 dict 查找變為屬性存取。
+    """
+
+    # 專屬子類以定義期已知的 Tag 名稱覆寫此欄位
+    _tag_names: tuple = ()
+
+    def __init__(
+        self,
+        instance: AssetInstance,
+        asset_definition: Asset,
+        event_bus: Optional[IEventBus] = None,
+    ):
+        self.instance = instance
+        self.asset_definition = asset_definition
+        self.event_bus = event_bus
+        # 分組/排序鍵（NDHService.iter_asset_types 以 attrgetter
+        # 讀取）：建構期解出，熱路徑免走兩層屬性鏈
+        self._type_name = asset_definition.name
+
+        # 同一資產實例的所有 TagServant 共享一份配置（flyweight）：
+        # 批量切換（例如 bind_tsdb）只需翻轉一個屬性。
+        self._shared_config = TagServantConfig()
+        self._shared_tsdb = None
+
+        self.tag_servants: Dict[str, TagServant] = {}
+        # get_all_tag_servants 的快取列表（延遲建立）：Tag 集合
+        # 於建構期固定，樹狀檢視等每次重繪的呼叫端為 O(1)
+        self._tag_servant_list: Optional[List[TagServant]] = None
+        for tag in asset_definition.tags:
+            self.tag_servants[tag.name] = TagServant(
+                tag_definition=tag,
+                asset_instance_id=instance.instance_id,
+                event_bus=event_bus,
+                config=self._shared_config,
+            )
+
+        # 專屬子類：將 TagServant 綁定為同名屬性（C 層級查找）
+        for name in self._tag_names:
+            setattr(self, name, self.tag_servants[name])
+
+    def bind_tsdb(self, tsdb, write_buffer=None):
+        """
+        批量綁定 TSDB
+
+        一次性將 TSDB 指派給所有 TagServant，並透過共享配置
+        開啟 auto_write_tsdb（單一屬性寫入，而非逐一設定）。
+
+        Args:
+            tsdb: TSDB 實例
+            write_buffer: 共享的 TSDBWriteBuffer（設定後寫入走批量緩衝）
+        """
+        self._shared_tsdb = tsdb
+        tag_servants = self.tag_servants.values()
+        for tag_servant in tag_servants:
+            tag_servant.tsdb = tsdb
+            tag_servant.write_buffer = write_buffer
+        self._shared_config.auto_write_tsdb = True
+
+    def get_all_tag_servants(self) -> List[TagServant]:
+        """
+        獲取所有 TagServant
+
+        Returns:
+            List[TagServant]: 快取的 TagServant 列表（請勿修改）
+        """
+        if self._tag_servant_list is None:
+            self._tag_servant_list = list(self.tag_servants.values())
+        return self._tag_servant_list
+
+    @property
+    def tag_servant_count(self) -> int:
+        """TagServant 數量（O(1)，不具現列表）"""
+        return len(self.tag_servants)
+
+    def start(self):
+        """啟動所有 TagServant"""
+        for servant in self.tag_servants.values():
+            servant.start()
+
+    def stop(self):
+        """停止所有 TagServant"""
+        for servant in self.tag_servants.values():
+            servant.stop()
+
+    def __repr__(self) -> str:
+        return (
+            f"AssetServant({self.instance.instance_id}, "
+            f"asset={self.asset_definition.asset_id}, "
+            f"tags={len(self.tag_servants)})"
+        )
+
+
+def specialize_servant_class(asset: Asset) -> type:
+    """
+    為資產定義生成專屬 AssetServant 子類
+
+    資產定義的 Tag 集合在載入期即固定，runtime codegen
+    （partial evaluation）讓 Tag 派發成本在類生成時一次付清。
+
+    Args:
+        asset: IADL 資產定義
+
+    Returns:
+        type: AssetServant 子類
+    """
+    tag_names = tuple(
+        tag.name for tag in asset.tags if tag.name.isidentifier()
+    )
+    return type(
+        f"AssetServant_{asset.asset_id}",
+        (AssetServant,),
+        {"_tag_names": tag_names},
+    )
+
+
+class NDHService:
+    """NDH 服務"""
+
+    def __init__(
+        self,
+        event_bus: Optional[IEventBus] = None,
+        tsdb: Optional[ITSDB] = None,
+    ):
+        # 事件發布走非同步代理：update_value 熱路徑上只剩 enqueue，
+        # 訂閱者 fan-out 由 dispatcher 執行緒承擔
+        if event_bus is not None and not isinstance(
+            event_bus, AsyncEventBusProxy
+        ):
+            event_bus = AsyncEventBusProxy(event_bus)
+        self.event_bus = event_bus
+        self.tsdb = tsdb
+        # 所有 TagServant 共享一個寫入緩衝，TSDB 批量提交攤提交易開銷
+        self.write_buffer = (
+            TSDBWriteBuffer(tsdb) if tsdb is not None else None
+        )
+        self.asset_library = AssetLibrary()
+        self.asset_servants: Dict[str, AssetServant] = {}
+        # 預先攤平的 TagServant 列表：於 generate_servants 內批量維護，
+        # 使 get_all_tag_servants / __repr__ 為 O(1) 而非每次重新走訪。
+        self._all_tag_servants: List[TagServant] = []
+        # 每個資產定義對應一個專屬 AssetServant 子類（延遲生成）
+        self._servant_classes: Dict[str, type] = {}
+        # iter_asset_types 的快取分組檢視（servant 增減時失效）
+        self._asset_type_groups: Optional[
+            List[Tuple[str, List[AssetServant]]]
+        ] = None
+        # build_instance_arrays 的快取 SoA 檢視（載入新 FDL 時失效）
+        self._instance_soa: Optional[InstanceSoA] = None
+        self.fdl: Optional[FDL] = None
+
+    def load_iadl_assets(self, iadl_dir: Union[str, Path]) -> int:
+        """
+        載入目錄下所有 IADL 資產定義
+
+        Args:
+            iadl_dir: IADL 目錄路徑
+
+        Returns:
+            int: 載入的資產定義數量
+        """
+        loaded = self.asset_library.load_directory(iadl_dir)
+        return len(loaded)
+
+    def load_fdl_from_file(self, fdl_file: Union[str, Path]) -> FDL:
+        """
+        自文件載入 FDL 工廠佈局
+
+        `.msgpack` 快照直接反序列化；YAML 文件若存在較新的同名快照
+        則改走快照路徑，否則解析 YAML 並自動寫出快照供下次使用。
+
+        Args:
+            fdl_file: FDL 文件路徑（.yaml/.json 或 .msgpack 快照）
+
+        Returns:
+            FDL: 工廠佈局
+        """
+        self._instance_soa = None
+        path = Path(fdl_file)
+        if path.suffix == snapshot.SNAPSHOT_SUFFIX:
+            self.fdl = snapshot.load(path)
+            return self.fdl
+
+        snap_path = path.with_suffix(path.suffix + snapshot.SNAPSHOT_SUFFIX)
+        if (
+            snap_path.exists()
+            and snap_path.stat().st_mtime >= path.stat().st_mtime
+        ):
+            self.fdl = snapshot.load(snap_path)
+            return self.fdl
+
+        self.fdl = parse_fdl_file(path)
+        try:
+            snapshot.dump(self.fdl, snap_path)
+        except OSError:
+            # 快照寫入失敗不影響載入
+            pass
+        return self.fdl
+
+    def generate_servants(self) -> int:
+        """
+        為已載入 FDL 中的每個資產實例生成 Servant
+
+        重複呼叫為冪等：已登錄的 instance_id 直接跳過，
+        `asset_servants` 與扁平的 Tag 列表保持一致。
+
+        Returns:
+            int: 本次新生成的 AssetServant 數量
+        """
+        if self.fdl is None:
+            raise RuntimeError("尚未載入 FDL，請先呼叫 load_fdl_from_file")
+
+        # 先以 comprehension 建出整批 servant，再單次 update/extend
+        # 批量登錄：迴圈內不逐項做 dict 指派與快取失效。
+        # 已登錄的實例不重建，否則 dict 端去重而扁平列表重複
+        existing = self.asset_servants
+        new_servants = [
+            servant
+            for area in self.fdl.site.areas
+            for instance in area.instances
+            if instance.instance_id not in existing
+            and (servant := self._build_asset_servant(instance)) is not None
+        ]
+        self.asset_servants.update(
+            (servant.instance.instance_id, servant)
+            for servant in new_servants
+        )
+        for servant in new_servants:
+            self._all_tag_servants.extend(servant.tag_servants.values())
+        if new_servants:
+            self._asset_type_groups = None
+        return len(new_servants)
+
+    def _build_asset_servant(
+        self, instance: AssetInstance
+    ) -> Optional[AssetServant]:
+        """
+        為單一資產實例建構 AssetServant（不登錄，由呼叫端批量登錄）
+
+        Args:
+            instance: FDL 資產實例
+
+        Returns:
+            Optional[AssetServant]: 建構的 Servant（資產定義不存在時為 None）
+        """
+        # ref_asset 為低基數字串（數百個資產定義重複於大量實例），
+        # intern 後資產庫 dict 查找走指標比較的快路徑
+        instance.ref_asset = sys.intern(instance.ref_asset)
+        asset = self.asset_library.get_asset(instance.ref_asset)
+        if asset is None:
+            print(
+                f"[NDHService] Warning: 資產定義 '{instance.ref_asset}' "
+                f"不存在，略過實例 '{instance.instance_id}'"
+            )
+            return None
+
+        servant_class = self._servant_classes.get(asset.asset_id)
+        if servant_class is None:
+            servant_class = specialize_servant_class(asset)
+            self._servant_classes[asset.asset_id] = servant_class
+
+        servant = servant_class(
+            instance=instance,
+            asset_definition=asset,
+            event_bus=self.event_bus,
+        )
+
+        if self.tsdb is not None:
+            servant.bind_tsdb(self.tsdb, write_buffer=self.write_buffer)
+
+        return servant
+
+    def iter_asset_types(self) -> List[Tuple[str, List[AssetServant]]]:
+        """
+        依資產類型分組的 Servant 檢視（快取）
+
+        分組在首次存取時建立一次（排序 + groupby，鍵為
+        建構期快取的 _type_name），之後的樹狀檢視重繪直接
+        迭代快取結構；generate_servants 新增 servant 時失效。
+
+        Returns:
+            List[Tuple[str, List[AssetServant]]]:
+                (資產名稱, Servant 列表)，依名稱排序（請勿修改）
+        """
+        if self._asset_type_groups is None:
+            type_key = attrgetter("_type_name")
+            servants = sorted(self.asset_servants.values(), key=type_key)
+            self._asset_type_groups = [
+                (name, list(group))
+                for name, group in groupby(servants, key=type_key)
+            ]
+        return self._asset_type_groups
+
+    def get_all_tag_servants(self) -> List[TagServant]:
+        """
+        獲取所有 TagServant
+
+        Returns:
+            List[TagServant]: 預先攤平的 TagServant 列表（請勿修改）
+        """
+        return self._all_tag_servants
+
+    @property
+    def tag_servant_count(self) -> int:
+        """TagServant 總數（O(1)，讀預先攤平列表的長度）"""
+        return len(self._all_tag_servants)
+
+    def build_instance_arrays(self) -> InstanceSoA:
+        """
+        將已載入 FDL 的實例變換攤平為 SoA ndarray（快取）
+
+        單趟走訪填入預配置的 (N, 3) 陣列；之後的數值檢查
+        （間距、邊界）對整批實例做向量化運算。
+
+        Returns:
+            InstanceSoA: SoA 檢視（載入新 FDL 前請勿修改）
+        """
+        if self.fdl is None:
+            raise RuntimeError("尚未載入 FDL，請先呼叫 load_fdl_from_file")
+        if self._instance_soa is None:
+            n = self.fdl.site.total_instances
+            instance_ids: List[str] = []
+            translations = np.empty((n, 3))
+            rotations = np.empty((n, 3))
+            scales = np.empty((n, 3))
+            i = 0
+            for area in self.fdl.site.areas:
+                for instance in area.instances:
+                    transform = instance.transform
+                    translations[i] = transform.translation
+                    rotations[i] = transform.rotation
+                    scales[i] = transform.scale
+                    instance_ids.append(instance.instance_id)
+                    i += 1
+            self._instance_soa = InstanceSoA(
+                instance_ids=instance_ids,
+                translations=translations,
+                rotations=rotations,
+                scales=scales,
+            )
+        return self._instance_soa
+
+    @property
+    def instance_soa(self) -> InstanceSoA:
+        """已載入 FDL 的 SoA 檢視（延遲建立並快取）"""
+        return self.build_instance_arrays()
+
+    def reset_fdl(self):
+        """
+        清除已載入的 FDL 與其 Servant（保留 bus / TSDB / 資產庫）
+
+        同一服務實例可依序跑多份 FDL：SQLite 連線、事件代理、
+        寫入緩衝與已載入的 IADL 資產庫（含特化 servant 類）
+        都不重建。呼叫端應先 stop_all_servants。
+        """
+        self.asset_servants.clear()
+        self._all_tag_servants.clear()
+        self._asset_type_groups = None
+        self._instance_soa = None
+        self.fdl = None
+
+    def start_all_servants(self):
+        """啟動所有 Servant"""
+        for servant in self.asset_servants.values():
+            servant.start()
+
+    def stop_all_servants(self):
+        """停止所有 Servant（沖刷殘餘的 TSDB 寫入）"""
+        for servant in self.asset_servants.values():
+            servant.stop()
+        if isinstance(self.event_bus, AsyncEventBusProxy):
+            self.event_bus.drain()
+        if self.write_buffer is not None:
+            self.write_buffer.flush()
+
+    def __repr__(self) -> str:
+        return (
+            f"NDHService(assets={len(self.asset_servants)}, "
+            f"tags={len(self._all_tag_servants)})"
+        )
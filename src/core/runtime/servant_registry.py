@@ -0,0 +1,120 @@
+# src/core/runtime/servant_registry.py
+
+"""
+TagServant 註冊表與中央沖刷排程器
+
+合併視窗若由每個 TagServant 各自持有 threading.Timer，萬級 Tag
+即是萬級執行緒（每條 ~8 MB 堆疊）。TagServantRegistry 以單一
+min-heap（(到期時刻, 序號, servant)）加一條 worker 執行緒服務
+全部 servant：排程為 O(log N)，到期的 servant 由 worker 依序
+呼叫 `_flush_pending()`，批次沖刷亦更具快取局部性。
+"""
+
+import heapq
+import threading
+import time
+from typing import List, Optional, Tuple
+
+
+class TagServantRegistry:
+    """TagServant 註冊表（中央沖刷排程器）"""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, object]] = []
+        self._cond = threading.Condition()
+        self._seq = 0
+        self._servants: set = set()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    def register(self, servant):
+        """
+        註冊 Servant（於 TagServant.start() 呼叫）
+
+        Args:
+            servant: TagServant
+        """
+        with self._cond:
+            self._servants.add(servant)
+
+    def deregister(self, servant):
+        """
+        註銷 Servant（於 TagServant.stop() 呼叫）
+
+        已入堆的排程項不主動移除；到期時 servant 的待處理值
+        已被 force_flush 清空，沖刷為 no-op。
+
+        Args:
+            servant: TagServant
+        """
+        with self._cond:
+            self._servants.discard(servant)
+
+    def schedule_flush(self, servant, delay_seconds: float):
+        """
+        排程一次沖刷（O(log N)）
+
+        Args:
+            servant: TagServant
+            delay_seconds: 延遲秒數
+        """
+        deadline = time.monotonic() + delay_seconds
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, self._seq, servant))
+            self._seq += 1
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="tag-servant-scheduler",
+                    daemon=True,
+                )
+                self._worker.start()
+            self._cond.notify()
+
+    def shutdown(self):
+        """停止 worker 並沖刷所有已排程的 servant"""
+        with self._cond:
+            self._closed = True
+            pending = [entry[2] for entry in self._heap]
+            self._heap.clear()
+            self._cond.notify()
+            worker = self._worker
+        for servant in pending:
+            servant._flush_pending()
+        if worker is not None:
+            worker.join()
+
+    def _run(self):
+        """worker 主迴圈：等待最早到期項，到期後執行沖刷"""
+        while True:
+            with self._cond:
+                while not self._heap and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                now = time.monotonic()
+                deadline = self._heap[0][0]
+                if deadline > now:
+                    self._cond.wait(deadline - now)
+                    continue
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    due.append(heapq.heappop(self._heap)[2])
+            for servant in due:
+                servant._flush_pending()
+
+
+# 行程級共享註冊表：所有啟用合併視窗的 TagServant 共用一條
+# 排程執行緒（延遲建立）
+_default_registry: Optional[TagServantRegistry] = None
+_default_lock = threading.Lock()
+
+
+def default_registry() -> TagServantRegistry:
+    """獲取行程級共享的 TagServantRegistry（首次呼叫時建立）"""
+    global _default_registry
+    if _default_registry is None:
+        with _default_lock:
+            if _default_registry is None:
+                _default_registry = TagServantRegistry()
+    return _default_registry
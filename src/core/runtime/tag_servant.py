@@ -0,0 +1,306 @@
+# src/core/runtime/tag_servant.py
+
+"""
+Tag Servant
+
+每個 Tag 實例對應一個 TagServant，負責：
+
+- 接收外部值更新（update_value）
+- 依配置寫入 TSDB
+- 發布 TagCreated / TagValueChanged / TagDeleted 事件
+"""
+
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Optional
+
+from ..eventbus.events import (
+    Event,
+    TAG_CREATED,
+    TAG_DELETED,
+    TAG_VALUE_CHANGED,
+    TagCreatedPayload,
+    TagDeletedPayload,
+    TagValueChangedPayload,
+)
+from ..eventbus.interfaces import IEventBus
+from ..tags.id_generator import generate_uuidv7
+from ..tags.models import Tag, TagKind
+from ..tsdb.interfaces import ITSDB, TagValue
+from .servant_registry import TagServantRegistry, default_registry
+
+
+@dataclass(slots=True)
+class TagServantConfig:
+    """
+    TagServant 配置
+
+    Attributes:
+        auto_write_tsdb: 值更新時是否自動寫入 TSDB
+        publish_events: 是否發布事件
+        value_change_threshold: 數值變化閾值（低於閾值的更新被忽略；0 表示不過濾）
+        coalesce_window_ms: 合併視窗（毫秒）；kHz 級的更新在視窗內
+            只保留最新值，視窗到期時發出單一事件/TSDB 寫入（0 表示不合併）
+    """
+    auto_write_tsdb: bool = False
+    publish_events: bool = True
+    value_change_threshold: float = 0.0
+    coalesce_window_ms: int = 0
+
+
+def _always_update(value: Any) -> bool:
+    """無閾值過濾：所有更新一律套用"""
+    return True
+
+
+def _numeric_threshold(servant: "TagServant", threshold: float):
+    """數值型 Tag 的閾值過濾閉包（首個值一律套用）"""
+    def check(value: Any) -> bool:
+        current = servant.current_value
+        return current is None or abs(value - current) >= threshold
+    return check
+
+
+def _equality_only(servant: "TagServant"):
+    """非數值型 Tag：僅過濾與當前值完全相等的更新"""
+    def check(value: Any) -> bool:
+        return value != servant.current_value
+    return check
+
+
+class TagServant:
+    """Tag Servant（Tag 實例服務者）"""
+
+    def __init__(
+        self,
+        tag_definition: Tag,
+        asset_instance_id: str,
+        event_bus: Optional[IEventBus] = None,
+        tsdb: Optional[ITSDB] = None,
+        config: Optional[TagServantConfig] = None,
+    ):
+        self.tag_definition = tag_definition
+        self.asset_instance_id = asset_instance_id
+        # 組合式 ID 於建構期格式化一次並 intern：TSDB 與事件
+        # 路由的 dict 查找走指標比較快路徑，呼叫端一律取此
+        # 屬性，不得於查詢迴圈內重新以 f-string 組合
+        self.tag_instance_id = sys.intern(
+            f"{asset_instance_id}_{tag_definition.tag_id}"
+        )
+        self.event_bus = event_bus
+        self.tsdb = tsdb
+        # 共享的 TSDBWriteBuffer；設定後 TSDB 寫入改走批量緩衝
+        self.write_buffer = None
+        self.config = config or TagServantConfig()
+
+        self.current_value: Any = None
+        self.current_quality: str = "Good"
+        self.last_update_time: Optional[float] = None
+        self._started = False
+
+        # 合併視窗狀態：視窗內只保留最新的 (value, quality)；
+        # 沖刷由行程級共享的 TagServantRegistry 排程（單一
+        # worker 執行緒），而非每個 servant 一條 Timer 執行緒
+        self._pending: Optional[tuple] = None
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._registry: Optional[TagServantRegistry] = None
+        if self.config.coalesce_window_ms > 0:
+            self._registry = default_registry()
+
+        # 閾值檢查於建構期特化：Tag 的數值性在定義期已知，
+        # 熱路徑上不再逐次做 isinstance 派發
+        self._check_threshold = self._bind_threshold_check()
+
+        # 事件 payload 的不可變欄位在 Servant 生命週期內固定，
+        # 以 partial 預先綁定；熱路徑上建構 slots payload 物件時
+        # 只補差異欄位，無 dict 配置
+        self._source = f"TagServant:{self.tag_instance_id}"
+        self._kind_value = tag_definition.kind.value
+        base_fields = {
+            "tag_instance_id": self.tag_instance_id,
+            "tag_id": tag_definition.tag_id,
+            "asset_instance_id": asset_instance_id,
+            "eu_unit": tag_definition.eu_unit,
+        }
+        self._value_changed_payload = partial(
+            TagValueChangedPayload, **base_fields
+        )
+        self._created_payload = partial(TagCreatedPayload, **base_fields)
+        self._deleted_payload = partial(TagDeletedPayload, **base_fields)
+
+        # Event 模板：event_type 與 source 預先綁定，
+        # 發布時只填 event_id / timestamp / payload 三個差異欄位
+        self._value_changed_event = partial(
+            Event, event_type=TAG_VALUE_CHANGED, source=self._source
+        )
+        self._created_event = partial(
+            Event, event_type=TAG_CREATED, source=self._source
+        )
+        self._deleted_event = partial(
+            Event, event_type=TAG_DELETED, source=self._source
+        )
+
+    def _bind_threshold_check(self):
+        """
+        依 Tag 種類與閾值配置選定 update_value 的過濾閉包
+
+        Returns:
+            Callable[[Any], bool]: 傳回 True 表示應套用此次更新
+        """
+        threshold = self.config.value_change_threshold
+        if threshold <= 0:
+            return _always_update
+        kind = self.tag_definition.kind
+        if kind in (TagKind.SENSOR, TagKind.ACTUATOR):
+            return _numeric_threshold(self, threshold)
+        return _equality_only(self)
+
+    def start(self):
+        """啟動 Servant（發布 TagCreated 事件）"""
+        if self._started:
+            return
+        self._started = True
+        if self._registry is not None:
+            self._registry.register(self)
+        if (
+            self.event_bus is not None
+            and self.config.publish_events
+            and self.event_bus.has_subscribers(TAG_CREATED)
+        ):
+            self._publish_tag_created()
+
+    def stop(self):
+        """停止 Servant（發布 TagDeleted 事件）"""
+        if not self._started:
+            return
+        self._started = False
+        self.force_flush()
+        if self._registry is not None:
+            self._registry.deregister(self)
+        if (
+            self.event_bus is not None
+            and self.config.publish_events
+            and self.event_bus.has_subscribers(TAG_DELETED)
+        ):
+            self._publish_tag_deleted()
+
+    def update_value(self, value: Any, quality: str = "Good"):
+        """
+        更新 Tag 值
+
+        依配置套用變化閾值過濾，寫入 TSDB 並發布 TagValueChanged 事件。
+
+        Args:
+            value: 新值
+            quality: 數據品質
+        """
+        if not self._check_threshold(value):
+            return
+
+        window_ms = self.config.coalesce_window_ms
+        if window_ms > 0:
+            with self._pending_lock:
+                self._pending = (value, quality)
+                schedule = not self._flush_scheduled
+                if schedule:
+                    self._flush_scheduled = True
+            if schedule:
+                self._registry.schedule_flush(self, window_ms / 1000.0)
+            return
+
+        self._apply_update(value, quality)
+
+    def _apply_update(self, value: Any, quality: str):
+        """套用一次值更新（寫入 TSDB 並發布事件）"""
+        old_value = self.current_value
+        ts = time.time()
+        self.current_value = value
+        self.current_quality = quality
+        self.last_update_time = ts
+
+        if self.config.auto_write_tsdb and self.tsdb is not None:
+            self._write_to_tsdb(value, quality, ts)
+
+        if (
+            self.event_bus is not None
+            and self.config.publish_events
+            and self.event_bus.has_subscribers(TAG_VALUE_CHANGED)
+        ):
+            self._publish_tag_value_changed(old_value, value, ts)
+
+    def _flush_pending(self):
+        """合併視窗到期：以視窗內最新值發出單一更新"""
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = None
+            self._flush_scheduled = False
+        if pending is not None:
+            self._apply_update(*pending)
+
+    def force_flush(self):
+        """立即沖刷合併視窗內的待處理值（已入堆的排程項到期後為 no-op）"""
+        self._flush_pending()
+
+    def get_value(self) -> Any:
+        """獲取當前值"""
+        return self.current_value
+
+    def _write_to_tsdb(self, value: Any, quality: str, timestamp: float):
+        """寫入當前值到 TSDB（int 奈秒時間戳，免 isoformat）"""
+        tag_value = TagValue.with_ns(
+            self.tag_instance_id,
+            int(timestamp * 1_000_000_000),
+            value,
+            quality,
+            self._source,
+        )
+        if self.write_buffer is not None:
+            self.write_buffer.append(tag_value)
+        else:
+            self.tsdb.write_tag_value(tag_value)
+
+    def _publish_tag_created(self):
+        """發布 TagCreated 事件"""
+        event = self._created_event(
+            event_id=generate_uuidv7(),
+            timestamp=time.time(),
+            payload=self._created_payload(
+                name=self.tag_definition.name,
+                kind=self._kind_value,
+            ),
+        )
+        self.event_bus.publish(event)
+
+    def _publish_tag_value_changed(
+        self, old_value: Any, new_value: Any, ts: float
+    ):
+        """發布 TagValueChanged 事件"""
+        event = self._value_changed_event(
+            event_id=generate_uuidv7(),
+            timestamp=ts,
+            payload=self._value_changed_payload(
+                old_value=old_value,
+                new_value=new_value,
+                quality=self.current_quality,
+            ),
+        )
+        self.event_bus.publish(event)
+
+    def _publish_tag_deleted(self):
+        """發布 TagDeleted 事件"""
+        event = self._deleted_event(
+            event_id=generate_uuidv7(),
+            timestamp=time.time(),
+            payload=self._deleted_payload(),
+        )
+        self.event_bus.publish(event)
+
+    def __repr__(self) -> str:
+        return (
+            f"TagServant({self.tag_instance_id}, "
+            f"value={self.current_value!r})"
+        )
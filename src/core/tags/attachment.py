@@ -0,0 +1,213 @@
+# src/core/tags/attachment.py
+
+"""
+Tag 附著策略
+
+計算 Tag 在世界座標系中的位置：
+
+- by_pos: Tag 局部座標經資產世界變換矩陣轉換
+- by_prim: Tag 附著的 Prim 世界變換矩陣的平移分量
+
+變換矩陣內部以扁平 row-major `array.array('f')`（16 floats，
+連續 64 bytes）表示，而非 4 個 list + 16 個 boxed float（~1 KB）；
+熱路徑呼叫端以 `pack_matrix` 打包一次後重複使用。
+"""
+
+import array
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+from .models import AttachmentStrategy, Tag
+
+# 巢狀 4x4 列表或扁平 row-major 16 floats 皆可
+Matrix4 = Union[List[List[float]], "array.array"]
+
+
+def pack_matrix(matrix: List[List[float]]) -> "array.array":
+    """
+    將 4x4 巢狀列表矩陣打包為扁平 row-major array('f')
+
+    Args:
+        matrix: 4x4 變換矩陣（巢狀列表）
+
+    Returns:
+        array.array: 16 floats，索引規則 m[i*4+j]
+    """
+    return array.array("f", (v for row in matrix for v in row))
+
+
+def _as_flat(matrix: Matrix4) -> Sequence[float]:
+    """確保矩陣為扁平 16-float 表示（巢狀列表即時打包）"""
+    if len(matrix) == 4:
+        return pack_matrix(matrix)
+    return matrix
+
+
+def _transform_point(matrix: Matrix4, point: Sequence[float]) -> List[float]:
+    """
+    以 4x4 變換矩陣轉換一個點
+
+    Args:
+        matrix: 4x4 變換矩陣（巢狀列表或扁平 row-major）
+        point: [x, y, z]
+
+    Returns:
+        List[float]: 轉換後的 [x, y, z]
+    """
+    m = _as_flat(matrix)
+    x, y, z = point[0], point[1], point[2]
+    new_x = m[0] * x + m[1] * y + m[2] * z + m[3]
+    new_y = m[4] * x + m[5] * y + m[6] * z + m[7]
+    new_z = m[8] * x + m[9] * y + m[10] * z + m[11]
+    return [new_x, new_y, new_z]
+
+
+def compute_tag_world_position(
+    tag: Tag,
+    asset_world_transform: Matrix4,
+    prim_world_transform: Optional[Matrix4] = None,
+) -> List[float]:
+    """
+    計算 Tag 的世界座標位置
+
+    Args:
+        tag: Tag 定義
+        asset_world_transform: 資產實例的世界變換矩陣（4x4）
+        prim_world_transform: by_prim 附著時，Prim 的世界變換矩陣
+
+    Returns:
+        List[float]: 世界座標 [x, y, z]
+    """
+    if tag.attachment_strategy == AttachmentStrategy.BY_POSITION:
+        local = (
+            tag.local_position
+            if tag.local_position is not None
+            else (0.0, 0.0, 0.0)
+        )
+        return _transform_point(asset_world_transform, local)
+
+    if tag.attachment_strategy == AttachmentStrategy.BY_PRIM:
+        if prim_world_transform is None:
+            raise ValueError(
+                f"Tag '{tag.name}': by_prim 附著需要 prim_world_transform"
+            )
+        m = _as_flat(prim_world_transform)
+        return [m[3], m[7], m[11]]
+
+    raise ValueError(f"未知的附著策略: {tag.attachment_strategy}")
+
+
+def _transform_points_kernel(
+    points: "np.ndarray", matrix: "np.ndarray"
+) -> "np.ndarray":
+    """
+    以 4x4 變換矩陣批量轉換 (N,3) 點陣列
+
+    形狀固定的數值內迴圈；numba 可用時 JIT 編譯為機器碼
+    （於 import 期預先編譯，首次呼叫無 JIT 延遲）。
+
+    Args:
+        points: 點陣列，shape (N,3)，dtype float32
+        matrix: 4x4 變換矩陣，dtype float32
+
+    Returns:
+        np.ndarray: 轉換後的點陣列，shape (N,3)
+    """
+    n = points.shape[0]
+    out = np.empty((n, 3), dtype=np.float32)
+    for i in range(n):
+        x = points[i, 0]
+        y = points[i, 1]
+        z = points[i, 2]
+        out[i, 0] = matrix[0, 0] * x + matrix[0, 1] * y + matrix[0, 2] * z + matrix[0, 3]
+        out[i, 1] = matrix[1, 0] * x + matrix[1, 1] * y + matrix[1, 2] * z + matrix[1, 3]
+        out[i, 2] = matrix[2, 0] * x + matrix[2, 1] * y + matrix[2, 2] * z + matrix[2, 3]
+    return out
+
+
+def _transform_points_numpy(
+    points: "np.ndarray", matrix: "np.ndarray"
+) -> "np.ndarray":
+    """numba 不可用時的向量化後備實作"""
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+if numba is not None:
+    transform_points = numba.njit(cache=True, fastmath=True)(
+        _transform_points_kernel
+    )
+    # import 期預先編譯，避免首次呼叫付 JIT 成本
+    transform_points(
+        np.zeros((1, 3), dtype=np.float32), np.eye(4, dtype=np.float32)
+    )
+else:
+    transform_points = _transform_points_numpy
+
+
+def compute_tag_world_positions_batch(
+    tags: Sequence[Tag],
+    asset_transform: "np.ndarray",
+    prim_transforms: Optional["np.ndarray"] = None,
+) -> "np.ndarray":
+    """
+    批量計算多個 Tag 的世界座標位置
+
+    將局部座標堆疊為 (N,4) 齊次座標陣列，一次矩陣乘法轉換
+    全部 N 個點；萬級 Tag 的全場景位置刷新自 N 次純 Python
+    矩陣乘法縮為單一向量化運算。
+
+    Args:
+        tags: Tag 定義序列（須為相同附著策略）
+        asset_transform: 資產實例的世界變換矩陣，shape (4,4)
+        prim_transforms: by_prim 附著時各 Tag 的 Prim 局部變換
+            矩陣，shape (N,4,4)
+
+    Returns:
+        np.ndarray: 世界座標陣列，shape (N,3)，dtype float32
+    """
+    asset_transform = np.asarray(asset_transform, dtype=np.float32)
+
+    if prim_transforms is not None:
+        # by_prim: prim 世界矩陣 = 資產矩陣 @ prim 矩陣，取平移分量
+        prim_world = asset_transform @ np.asarray(
+            prim_transforms, dtype=np.float32
+        )
+        return prim_world[:, :3, 3]
+
+    locals_arr = np.zeros((len(tags), 3), dtype=np.float32)
+    for i, tag in enumerate(tags):
+        if tag.local_position is not None:
+            locals_arr[i] = tag.local_position
+    return transform_points(locals_arr, asset_transform)
+
+
+def validate_tag_attachment(
+    tag: Tag, revalidate: bool = False
+) -> Tuple[bool, Optional[str]]:
+    """
+    驗證 Tag 附著設定是否完整
+
+    Tag 為 frozen dataclass 且 __post_init__ 已執行過驗證，
+    建構成功即代表有效；預設直接回報通過，不重跑驗證。
+
+    Args:
+        tag: Tag 定義
+        revalidate: 是否強制重跑驗證（僅供處理外部反序列化等
+            繞過建構流程的物件時使用）
+
+    Returns:
+        Tuple[bool, Optional[str]]: (是否有效, 錯誤訊息)
+    """
+    if not revalidate:
+        return True, None
+    try:
+        tag._validate()
+    except ValueError as e:
+        return False, str(e)
+    return True, None
@@ -0,0 +1,167 @@
+# src/core/tags/models.py
+
+"""
+Tag 數據模型
+
+定義 Tag（測點）的數據結構、種類與附著策略。
+Tag 是 IADL 資產上的可觀測/可控制點，對應外部系統
+（SCADA、OPC UA、AVEVA PI 等）的一個數據位址。
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional
+from weakref import WeakValueDictionary
+
+import numpy as np
+
+
+# str 混入使成員本身即為字串：序列化免 .value 間接層，
+# 與字串字面值的比較走 C 層級字串相等
+class TagKind(str, Enum):
+    """Tag 種類"""
+    SENSOR = "sensor"        # 感測器（唯讀）
+    ACTUATOR = "actuator"    # 致動器（可寫）
+    STATUS = "status"        # 狀態（離散值）
+    CONFIG = "config"        # 配置參數
+
+
+class AttachmentStrategy(str, Enum):
+    """Tag 附著策略"""
+    BY_POSITION = "by_pos"   # 以資產局部座標附著
+    BY_PRIM = "by_prim"      # 以 USD Prim 路徑附著
+
+
+# hash consing 池：欄位相同的 Tag 定義共享單一實例（弱引用，
+# 無人持有時自動回收）。同一資產定義重複解析（快取失效、
+# 多行程載入合併等）時不再產生逐實例的重複定義物件
+_TAG_POOL: "WeakValueDictionary" = WeakValueDictionary()
+
+
+# frozen + slots：免去每實例 __dict__（~112 bytes），屬性存取走
+# C 層級 slot 偏移；eq=False 保留以身分為準的雜湊/相等，使 Tag
+# 可直接作為 dict 鍵／集合成員（ndarray 與 dict 欄位無法逐欄位雜湊）
+@dataclass(slots=True, frozen=True, eq=False, weakref_slot=True)
+class Tag:
+    """
+    Tag 定義（不可變）
+
+    Attributes:
+        tag_id: Tag ID（UUIDv7）
+        name: Tag 名稱（在資產內唯一）
+        kind: Tag 種類
+        eu_unit: 工程單位（例如 "degC", "bar", "rpm"）
+        attachment_strategy: 附著策略
+        local_position: by_pos 附著時的資產局部座標，shape (3,)
+            的 float32 陣列（建構時自 list 自動轉換）
+        prim_path: by_prim 附著時的 USD Prim 路徑
+        properties: 額外屬性
+        display: 預先渲染的顯示字串「name [kind] eu_unit」；
+            樹狀檢視等列表端單一屬性存取即可，免逐列三次
+            屬性鏈走訪 + 格式化
+    """
+    tag_id: str
+    name: str
+    kind: TagKind = TagKind.SENSOR
+    eu_unit: str = ""
+    attachment_strategy: AttachmentStrategy = AttachmentStrategy.BY_POSITION
+    local_position: Optional[np.ndarray] = None
+    prim_path: Optional[str] = None
+    properties: Dict[str, Any] = field(default_factory=dict)
+    display: str = field(init=False, default="")
+
+    def __post_init__(self):
+        # 座標以 float32 陣列儲存（12 bytes）而非 list + boxed float
+        # （~200 bytes），百萬級 Tag 下大幅縮小記憶體與快取足跡，
+        # 並使批量世界座標計算可直接堆疊
+        if self.local_position is not None:
+            object.__setattr__(
+                self,
+                "local_position",
+                np.asarray(self.local_position, dtype=np.float32),
+            )
+        display = f"{self.name} [{self.kind.value}]"
+        if self.eu_unit:
+            display = f"{display} {self.eu_unit}"
+        object.__setattr__(self, "display", display)
+        self._validate()
+
+    def _validate(self):
+        """驗證 Tag 定義的完整性"""
+        if not self.tag_id:
+            raise ValueError("Tag.tag_id 不可為空")
+        if not self.name:
+            raise ValueError("Tag.name 不可為空")
+        if self.attachment_strategy == AttachmentStrategy.BY_POSITION:
+            if self.local_position is not None and len(self.local_position) != 3:
+                raise ValueError(
+                    f"Tag '{self.name}': local_position 必須為 [x, y, z]"
+                )
+        elif self.attachment_strategy == AttachmentStrategy.BY_PRIM:
+            if not self.prim_path:
+                raise ValueError(
+                    f"Tag '{self.name}': by_prim 附著策略需要 prim_path"
+                )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """序列化為 dict（用於 YAML/JSON 導出）"""
+        data = {
+            "tag_id": self.tag_id,
+            "name": self.name,
+            "kind": self.kind.value,
+            "eu_unit": self.eu_unit,
+            "attachment_strategy": self.attachment_strategy.value,
+        }
+        if self.local_position is not None:
+            data["local_position"] = [float(v) for v in self.local_position]
+        if self.prim_path is not None:
+            data["prim_path"] = self.prim_path
+        if self.properties:
+            data["properties"] = self.properties
+        return data
+
+    @classmethod
+    def _intern(cls, **kwargs) -> "Tag":
+        """
+        建構（或自池中取回）Tag 定義
+
+        欄位逐一相同的定義回傳同一個實例（hash consing），
+        重複解析不再複製定義物件，且相等檢查可退化為身分
+        比較。帶 properties 的定義（dict 不可雜湊）不入池。
+
+        Returns:
+            Tag: 池中共享的（或新建的）Tag 定義
+        """
+        if kwargs.get("properties"):
+            return cls(**kwargs)
+        position = kwargs.get("local_position")
+        key = (
+            kwargs["tag_id"],
+            kwargs["name"],
+            kwargs.get("kind"),
+            kwargs.get("eu_unit"),
+            kwargs.get("attachment_strategy"),
+            tuple(position) if position is not None else None,
+            kwargs.get("prim_path"),
+        )
+        tag = _TAG_POOL.get(key)
+        if tag is None:
+            tag = cls(**kwargs)
+            _TAG_POOL[key] = tag
+        return tag
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Tag":
+        """自 dict 反序列化（經 hash-consing 池去重）"""
+        return cls._intern(
+            tag_id=data["tag_id"],
+            name=data["name"],
+            kind=TagKind(data.get("kind", "sensor")),
+            eu_unit=data.get("eu_unit", ""),
+            attachment_strategy=AttachmentStrategy(
+                data.get("attachment_strategy", "by_pos")
+            ),
+            local_position=data.get("local_position"),
+            prim_path=data.get("prim_path"),
+            properties=data.get("properties", {}),
+        )
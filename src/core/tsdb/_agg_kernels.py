@@ -0,0 +1,169 @@
+# src/core/tsdb/_agg_kernels.py
+
+"""
+行程內聚合核心
+
+SQL 層無法下推（或精度不足）的聚合於此以數值核心計算：
+形狀固定的 f64 內迴圈，numba 可用時 JIT 為機器碼並由 LLVM
+自動向量化（於 import 期預先編譯），不可用時退回 NumPy 的
+向量化實作。求和採 Kahan 補償、標準差採 Welford 單趟遞推，
+避免 SUM(v*v) 動差式在大均值/小變異數據上的災難性消去。
+"""
+
+import numpy as np
+
+try:
+    import numba
+    prange = numba.prange
+except ImportError:
+    numba = None
+    prange = range
+
+
+def _sum_f64_kernel(values: "np.ndarray") -> float:
+    """Kahan 補償求和"""
+    total = 0.0
+    comp = 0.0
+    for i in range(values.shape[0]):
+        y = values[i] - comp
+        t = total + y
+        comp = (t - total) - y
+        total = t
+    return total
+
+
+def _min_f64_kernel(values: "np.ndarray") -> float:
+    m = values[0]
+    for i in range(1, values.shape[0]):
+        if values[i] < m:
+            m = values[i]
+    return m
+
+
+def _max_f64_kernel(values: "np.ndarray") -> float:
+    m = values[0]
+    for i in range(1, values.shape[0]):
+        if values[i] > m:
+            m = values[i]
+    return m
+
+
+def _stddev_welford_f64_kernel(values: "np.ndarray") -> float:
+    """Welford 單趟母體標準差"""
+    mean = 0.0
+    m2 = 0.0
+    for i in range(values.shape[0]):
+        delta = values[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (values[i] - mean)
+    return (m2 / values.shape[0]) ** 0.5
+
+
+def _bucket_agg_kernel(
+    ts: "np.ndarray",
+    values: "np.ndarray",
+    bucket_ns: int,
+    first_bucket: int,
+    out_ts_min: "np.ndarray",
+    out_ts_max: "np.ndarray",
+    out_sum: "np.ndarray",
+    out_cnt: "np.ndarray",
+    out_min: "np.ndarray",
+    out_max: "np.ndarray",
+    out_std: "np.ndarray",
+):
+    """
+    單趟分桶聚合（桶間可平行）
+
+    時間戳已排序；各桶以二分搜尋定出 [lo, hi) 邊界後，
+    桶內單趟迴圈同時累計 sum/min/max 與 Welford 動差。
+    桶與桶互不相依，numba 下以 prange 跨核心平行。
+
+    Args:
+        ts: 已排序的時間戳陣列（int64 奈秒）
+        values: 對應的值陣列（float64）
+        bucket_ns: 桶寬（奈秒）
+        first_bucket: 首桶編號（ts[0] // bucket_ns）
+        out_*: 每桶輸出陣列，長度為桶數；空桶 out_cnt 為 0
+    """
+    n_buckets = out_cnt.shape[0]
+    for b in prange(n_buckets):
+        lo = np.searchsorted(ts, (first_bucket + b) * bucket_ns)
+        hi = np.searchsorted(ts, (first_bucket + b + 1) * bucket_ns)
+        out_cnt[b] = hi - lo
+        if hi == lo:
+            continue
+        out_ts_min[b] = ts[lo]
+        out_ts_max[b] = ts[hi - 1]
+        total = 0.0
+        mn = values[lo]
+        mx = values[lo]
+        mean = 0.0
+        m2 = 0.0
+        for i in range(lo, hi):
+            v = values[i]
+            total += v
+            if v < mn:
+                mn = v
+            if v > mx:
+                mx = v
+            delta = v - mean
+            mean += delta / (i - lo + 1)
+            m2 += delta * (v - mean)
+        out_sum[b] = total
+        out_min[b] = mn
+        out_max[b] = mx
+        out_std[b] = (m2 / (hi - lo)) ** 0.5
+
+
+def _bucket_agg_numpy(
+    ts, values, bucket_ns, first_bucket,
+    out_ts_min, out_ts_max, out_sum, out_cnt, out_min, out_max, out_std,
+):
+    """numba 不可用時的向量化後備實作（reduceat 分段歸約）"""
+    bucket_ids = ts // bucket_ns - first_bucket
+    occupied, edges = np.unique(bucket_ids, return_index=True)
+    counts = np.diff(np.append(edges, len(values)))
+    out_cnt[occupied] = counts
+    out_ts_min[occupied] = ts[edges]
+    out_ts_max[occupied] = ts[np.append(edges[1:], len(ts)) - 1]
+    out_sum[occupied] = np.add.reduceat(values, edges)
+    out_min[occupied] = np.minimum.reduceat(values, edges)
+    out_max[occupied] = np.maximum.reduceat(values, edges)
+    bounds = list(edges) + [len(values)]
+    for i, b in enumerate(occupied):
+        out_std[b] = np.std(values[bounds[i]:bounds[i + 1]])
+
+
+if numba is not None:
+    sum_f64 = numba.njit(cache=True)(_sum_f64_kernel)
+    min_f64 = numba.njit(cache=True)(_min_f64_kernel)
+    max_f64 = numba.njit(cache=True)(_max_f64_kernel)
+    stddev_welford_f64 = numba.njit(cache=True)(_stddev_welford_f64_kernel)
+    bucket_agg = numba.njit(cache=True, parallel=True)(_bucket_agg_kernel)
+    # import 期預先編譯，避免首次呼叫付 JIT 成本
+    _warm = np.ones(2, dtype=np.float64)
+    sum_f64(_warm)
+    min_f64(_warm)
+    max_f64(_warm)
+    stddev_welford_f64(_warm)
+    bucket_agg(
+        np.arange(2, dtype=np.int64), _warm, 1, 0,
+        np.zeros(2, dtype=np.int64), np.zeros(2, dtype=np.int64),
+        np.zeros(2), np.zeros(2, dtype=np.int64),
+        np.zeros(2), np.zeros(2), np.zeros(2),
+    )
+else:
+    def sum_f64(values: "np.ndarray") -> float:
+        return float(np.sum(values))
+
+    def min_f64(values: "np.ndarray") -> float:
+        return float(np.min(values))
+
+    def max_f64(values: "np.ndarray") -> float:
+        return float(np.max(values))
+
+    def stddev_welford_f64(values: "np.ndarray") -> float:
+        return float(np.std(values))
+
+    bucket_agg = _bucket_agg_numpy
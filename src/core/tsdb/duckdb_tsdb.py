@@ -0,0 +1,278 @@
+# src/core/tsdb/duckdb_tsdb.py
+
+"""
+DuckDB TSDB 實作（分析型）
+
+以 DuckDB 的欄式向量化引擎執行分析型查詢：分桶聚合走原生
+`time_bucket`，STDDEV 走內建 `stddev_pop`，百萬列級掃描較
+列式 SQLite 快一至兩個數量級。介面與 SQLiteTSDB 相同
+（ITSDB），呼叫端於配置期切換。
+
+時間戳邊界約定與 SQLiteTSDB 一致：寫入/查詢接受 int 奈秒、
+float epoch 秒或 ISO 8601 字串，讀取返回 epoch 奈秒整數。
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+import duckdb
+import numpy as np
+
+from .interfaces import (
+    AggregatedValue,
+    AggregationFunction,
+    ITSDB,
+    TagValue,
+)
+from .sqlite_tsdb import _to_ns
+
+# 聚合函式對應的 DuckDB 聚合（STDDEV 為原生 stddev_pop，
+# 無需 Python 後處理）
+_AGG_SQL = {
+    AggregationFunction.AVG: "AVG",
+    AggregationFunction.MIN: "MIN",
+    AggregationFunction.MAX: "MAX",
+    AggregationFunction.SUM: "SUM",
+    AggregationFunction.COUNT: "COUNT",
+    AggregationFunction.STDDEV: "STDDEV_POP",
+}
+
+
+class DuckDBTSDB(ITSDB):
+    """DuckDB TSDB 實作"""
+
+    # ts 以 TIMESTAMP（微秒）儲存；邊界以 make_timestamp(µs)
+    # 寫入、epoch_ns(ts) 讀出，對呼叫端維持整數奈秒介面
+    _INSERT_SQL = (
+        "INSERT INTO tag_values (tag_id, ts, value, quality, source) "
+        "VALUES (?, make_timestamp(?), ?, ?, ?)"
+    )
+    _SELECT_COLS = (
+        "SELECT tag_id, epoch_ns(ts), value, quality, source FROM tag_values "
+    )
+    # DuckDB 拒絕負值 LIMIT（SQLite 視為「無上限」）；
+    # limit < 0 時改走無 LIMIT 子句的變體以維持介面一致
+    _QUERY_RANGE_NO_LIMIT_SQL = (
+        _SELECT_COLS
+        + "WHERE tag_id = ? AND ts >= make_timestamp(?) "
+        "AND ts <= make_timestamp(?) ORDER BY ts"
+    )
+    _QUERY_RANGE_SQL = _QUERY_RANGE_NO_LIMIT_SQL + " LIMIT ?"
+    _LATEST_SQL = _SELECT_COLS + "WHERE tag_id = ? ORDER BY ts DESC LIMIT 1"
+    _DELETE_ALL_SQL = "DELETE FROM tag_values WHERE tag_id = ?"
+
+    def __init__(self, db_path: str = ":memory:"):
+        self.db_path = db_path
+        self.conn = duckdb.connect(db_path)
+        self._lock = threading.Lock()
+        self._create_tables()
+
+    def _create_tables(self):
+        """創建數據表（欄式儲存，無需額外索引即可高效範圍掃描）"""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS tag_values (
+                tag_id TEXT NOT NULL,
+                ts TIMESTAMP NOT NULL,
+                value DOUBLE,
+                quality TEXT DEFAULT 'Good',
+                source TEXT DEFAULT ''
+            )
+        """)
+
+    @staticmethod
+    def _to_us(timestamp: Any) -> int:
+        """正規化為 epoch 微秒整數（TIMESTAMP 欄位精度）"""
+        return _to_ns(timestamp) // 1000
+
+    def write_tag_value(self, tag_value: TagValue) -> bool:
+        """寫入單個數據點"""
+        with self._lock:
+            try:
+                self.conn.execute(
+                    self._INSERT_SQL,
+                    (
+                        tag_value.tag_id,
+                        self._to_us(tag_value.timestamp),
+                        tag_value.value,
+                        tag_value.quality,
+                        tag_value.source,
+                    ),
+                )
+                return True
+            except duckdb.Error as e:
+                print(f"[DuckDBTSDB] write_tag_value failed: {e}")
+                return False
+
+    def write_tag_values(self, tag_values: List[TagValue]) -> int:
+        """批量寫入數據點（單一 executemany）"""
+        with self._lock:
+            try:
+                self.conn.executemany(
+                    self._INSERT_SQL,
+                    [
+                        (
+                            tv.tag_id,
+                            self._to_us(tv.timestamp),
+                            tv.value,
+                            tv.quality,
+                            tv.source,
+                        )
+                        for tv in tag_values
+                    ],
+                )
+                return len(tag_values)
+            except duckdb.Error as e:
+                print(f"[DuckDBTSDB] write_tag_values failed: {e}")
+                return 0
+
+    def query_tag_values(
+        self,
+        tag_id: str,
+        start_time: Optional[Any] = None,
+        end_time: Optional[Any] = None,
+        limit: int = 1000,
+    ) -> List[TagValue]:
+        """
+        查詢時間範圍內的數據點（返回的時間戳為 epoch 奈秒整數）
+
+        `limit` 為負值時返回整個範圍（與 SQLiteTSDB 行為一致）。
+        """
+        start_us = (
+            self._to_us(start_time) if start_time is not None else -(2**62)
+        )
+        end_us = self._to_us(end_time) if end_time is not None else 2**62
+        if limit < 0:
+            sql, params = (
+                self._QUERY_RANGE_NO_LIMIT_SQL,
+                (tag_id, start_us, end_us),
+            )
+        else:
+            sql, params = (
+                self._QUERY_RANGE_SQL,
+                (tag_id, start_us, end_us, limit),
+            )
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [
+            TagValue(
+                tag_id=row[0],
+                timestamp=row[1],
+                value=row[2],
+                quality=row[3],
+                source=row[4],
+            )
+            for row in rows
+        ]
+
+    def query_latest_value(self, tag_id: str) -> Optional[TagValue]:
+        """查詢最新數據點（返回的時間戳為 epoch 奈秒整數）"""
+        with self._lock:
+            row = self.conn.execute(self._LATEST_SQL, (tag_id,)).fetchone()
+        if row is None:
+            return None
+        return TagValue(
+            tag_id=row[0],
+            timestamp=row[1],
+            value=row[2],
+            quality=row[3],
+            source=row[4],
+        )
+
+    def query_aggregated_values(
+        self,
+        tag_id: str,
+        start_time: Any,
+        end_time: Any,
+        function: AggregationFunction = AggregationFunction.AVG,
+        interval_seconds: Optional[int] = None,
+    ) -> List[AggregatedValue]:
+        """
+        時間分桶聚合查詢
+
+        以原生 `time_bucket` 於 DuckDB 向量化引擎內完成分桶，
+        每桶返回一筆 AggregatedValue（start/end 為桶內實際的
+        最早/最晚時間戳）。`interval_seconds` 為 None 時整段
+        範圍為單一桶。
+        """
+        agg = _AGG_SQL.get(function)
+        if agg is None:
+            raise ValueError(f"不支援的聚合函式: {function}")
+
+        start_us = self._to_us(start_time)
+        end_us = self._to_us(end_time)
+        if interval_seconds is not None and interval_seconds > 0:
+            bucket_us = interval_seconds * 1_000_000
+        else:
+            bucket_us = end_us + 1
+
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT epoch_ns(MIN(ts)), epoch_ns(MAX(ts)), "
+                f"{agg}(value), COUNT(*) FROM tag_values "
+                "WHERE tag_id = ? AND ts >= make_timestamp(?) "
+                "AND ts <= make_timestamp(?) "
+                "GROUP BY time_bucket(to_microseconds(CAST(? AS BIGINT)), ts) "
+                "ORDER BY 1",
+                (tag_id, start_us, end_us, bucket_us),
+            ).fetchall()
+        return [
+            AggregatedValue(
+                tag_id=tag_id,
+                start_time=row[0],
+                end_time=row[1],
+                value=row[2],
+                count=row[3],
+            )
+            for row in rows
+        ]
+
+    def query_tag_values_columnar(
+        self,
+        tag_id: str,
+        start_time: Optional[Any] = None,
+        end_time: Optional[Any] = None,
+        limit: int = 1000,
+    ) -> Dict[str, "np.ndarray"]:
+        """
+        欄式查詢：直接返回 NumPy 欄陣列
+
+        與 SQLiteTSDB.query_tag_values_columnar 同介面（含
+        `limit < 0` 返回整個範圍）；DuckDB 的 fetchnumpy 自
+        欄式結果集直接輸出陣列，無逐列物件。
+
+        Returns:
+            Dict[str, np.ndarray]: {"timestamp": int64 陣列,
+            "value": float64 陣列}，依時間遞增排序
+        """
+        start_us = (
+            self._to_us(start_time) if start_time is not None else -(2**62)
+        )
+        end_us = self._to_us(end_time) if end_time is not None else 2**62
+        sql = (
+            "SELECT epoch_ns(ts) AS timestamp, value FROM tag_values "
+            "WHERE tag_id = ? AND ts >= make_timestamp(?) "
+            "AND ts <= make_timestamp(?) ORDER BY ts"
+        )
+        params = (tag_id, start_us, end_us)
+        if limit >= 0:
+            sql += " LIMIT ?"
+            params += (limit,)
+        with self._lock:
+            result = self.conn.execute(sql, params).fetchnumpy()
+        return {
+            "timestamp": np.asarray(result["timestamp"], dtype=np.int64),
+            "value": np.asarray(result["value"], dtype=np.float64),
+        }
+
+    def delete_tag_values(self, tag_id: str) -> int:
+        """刪除指定 Tag 的所有數據點"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT COUNT(*) FROM tag_values WHERE tag_id = ?", (tag_id,)
+            ).fetchone()
+            self.conn.execute(self._DELETE_ALL_SQL, (tag_id,))
+            return row[0]
+
+    def close(self):
+        """關閉連線"""
+        self.conn.close()
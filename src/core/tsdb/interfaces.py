@@ -0,0 +1,212 @@
+# src/core/tsdb/interfaces.py
+
+"""
+TSDB 抽象介面
+
+定義 ITSDB 介面與時序數據模型，支援自 SQLite（MVP）到
+DuckDB / TDEngine（生產級）的平滑演進。
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+class AggregationFunction(Enum):
+    """聚合函式"""
+    AVG = "avg"
+    MIN = "min"
+    MAX = "max"
+    SUM = "sum"
+    COUNT = "count"
+    STDDEV = "stddev"
+
+
+# slots=True：熱路徑上每列配置一個 TagValue，省去 __dict__
+# 後的實例約為原本的一半大小，屬性存取亦較快
+@dataclass(slots=True)
+class TagValue:
+    """
+    時序數據點
+
+    Attributes:
+        tag_id: Tag 實例 ID
+        timestamp: 時間戳
+        value: 數值
+        quality: 數據品質（"Good", "Bad", "Uncertain"）
+        source: 數據來源
+    """
+    tag_id: str
+    timestamp: Any
+    value: Any
+    quality: str = "Good"
+    source: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """序列化為 dict"""
+        return {
+            "tag_id": self.tag_id,
+            "timestamp": self.timestamp,
+            "value": self.value,
+            "quality": self.quality,
+            "source": self.source,
+        }
+
+    @classmethod
+    def with_ns(
+        cls,
+        tag_id: str,
+        ts_ns: int,
+        value: Any,
+        quality: str = "Good",
+        source: str = "",
+    ) -> "TagValue":
+        """
+        以 epoch 奈秒整數時間戳建構
+
+        寫入熱路徑的建構入口：時間戳直接以 int 奈秒傳遞，
+        免去 datetime/isoformat 的逐筆物件配置，後端亦無需
+        再解析字串。
+
+        Args:
+            tag_id: Tag 實例 ID
+            ts_ns: epoch 奈秒整數時間戳
+            value: 數值
+            quality: 數據品質
+            source: 數據來源
+
+        Returns:
+            TagValue: 數據點
+        """
+        return cls(tag_id, ts_ns, value, quality, source)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TagValue":
+        """自 dict 反序列化"""
+        return cls(
+            data["tag_id"],
+            data["timestamp"],
+            data["value"],
+            data.get("quality", "Good"),
+            data.get("source", ""),
+        )
+
+
+@dataclass(slots=True)
+class AggregatedValue:
+    """
+    聚合查詢結果
+
+    Attributes:
+        tag_id: Tag 實例 ID
+        start_time: 聚合區間起點
+        end_time: 聚合區間終點
+        value: 聚合值
+        count: 區間內數據點數量
+    """
+    tag_id: str
+    start_time: Any
+    end_time: Any
+    value: float
+    count: int
+
+
+class ITSDB(ABC):
+    """時序數據庫抽象介面"""
+
+    @abstractmethod
+    def write_tag_value(self, tag_value: TagValue) -> bool:
+        """
+        寫入單個數據點
+
+        Args:
+            tag_value: 數據點
+
+        Returns:
+            bool: 是否成功寫入
+        """
+
+    @abstractmethod
+    def write_tag_values(self, tag_values: List[TagValue]) -> int:
+        """
+        批量寫入數據點
+
+        Args:
+            tag_values: 數據點列表
+
+        Returns:
+            int: 成功寫入的數據點數量
+        """
+
+    @abstractmethod
+    def query_tag_values(
+        self,
+        tag_id: str,
+        start_time: Optional[Any] = None,
+        end_time: Optional[Any] = None,
+        limit: int = 1000,
+    ) -> List[TagValue]:
+        """
+        查詢時間範圍內的數據點
+
+        Args:
+            tag_id: Tag 實例 ID
+            start_time: 開始時間（None 表示不限）
+            end_time: 結束時間（None 表示不限）
+            limit: 最大返回數量
+
+        Returns:
+            List[TagValue]: 數據點列表（依時間排序）
+        """
+
+    @abstractmethod
+    def query_latest_value(self, tag_id: str) -> Optional[TagValue]:
+        """
+        查詢最新數據點
+
+        Args:
+            tag_id: Tag 實例 ID
+
+        Returns:
+            Optional[TagValue]: 最新數據點（無數據時為 None）
+        """
+
+    @abstractmethod
+    def query_aggregated_values(
+        self,
+        tag_id: str,
+        start_time: Any,
+        end_time: Any,
+        function: AggregationFunction = AggregationFunction.AVG,
+        interval_seconds: Optional[int] = None,
+    ) -> List[AggregatedValue]:
+        """
+        聚合查詢
+
+        Args:
+            tag_id: Tag 實例 ID
+            start_time: 開始時間
+            end_time: 結束時間
+            function: 聚合函式
+            interval_seconds: 聚合間隔（秒；None 表示整段範圍一筆）
+
+        Returns:
+            List[AggregatedValue]: 聚合結果列表
+        """
+
+    @abstractmethod
+    def delete_tag_values(self, tag_id: str) -> int:
+        """
+        刪除指定 Tag 的所有數據點
+
+        Args:
+            tag_id: Tag 實例 ID
+
+        Returns:
+            int: 刪除的數據點數量
+        """
+
+    @abstractmethod
+    def close(self):
+        """關閉連線"""
@@ -0,0 +1,735 @@
+# src/core/tsdb/sqlite_tsdb.py
+
+"""
+SQLite TSDB 實作（MVP）
+
+以單一 SQLite 數據庫文件儲存時序數據，用於 MVP 與本地開發。
+時間戳以 epoch 奈秒整數儲存（8 bytes、B-tree 數值範圍掃描）；
+寫入/查詢介面同時接受 int 奈秒、float epoch 秒與 ISO 8601 字串，
+於邊界轉換一次。
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from ._agg_kernels import bucket_agg, stddev_welford_f64
+from .interfaces import (
+    AggregatedValue,
+    AggregationFunction,
+    ITSDB,
+    TagValue,
+)
+
+def _to_ns(timestamp: Any) -> int:
+    """
+    將時間戳正規化為 epoch 奈秒整數
+
+    Args:
+        timestamp: int 奈秒、float epoch 秒或 ISO 8601 字串
+
+    Returns:
+        int: epoch 奈秒
+    """
+    if isinstance(timestamp, int):
+        return timestamp
+    if isinstance(timestamp, float):
+        return int(timestamp * 1_000_000_000)
+    # ISO 8601 字串（naive 視為 UTC）
+    s = timestamp[:-1] if timestamp.endswith("Z") else timestamp
+    dt = datetime.fromisoformat(s)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1_000_000_000)
+
+
+# shared_memory 數據庫的常駐連線：in-memory DB 在最後一條連線
+# 關閉時即被回收，每個命名 DB 保留一條連線讓 schema 與頁快取
+# 存活整個行程生命週期
+_MEMORY_KEEPALIVE: Dict[str, sqlite3.Connection] = {}
+
+
+# 聚合函式對應的 SQL 運算子
+_AGG_SQL = {
+    AggregationFunction.AVG: "AVG",
+    AggregationFunction.MIN: "MIN",
+    AggregationFunction.MAX: "MAX",
+    AggregationFunction.SUM: "SUM",
+    AggregationFunction.COUNT: "COUNT",
+}
+
+
+class SQLiteTSDB(ITSDB):
+    """SQLite TSDB 實作"""
+
+    # SQL 以常數字串預先定義：sqlite3 的 statement cache 以 SQL
+    # 文本為鍵，重複命中同一字面字串才能省去解析；query_tag_values
+    # 的四種邊界組合各自展開為獨立常數，不在呼叫期串接
+    _INSERT_SQL = (
+        "INSERT OR REPLACE INTO tag_values "
+        "(tag_id, timestamp, value, quality, source) "
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+    _SELECT_COLS = "SELECT tag_id, timestamp, value, quality, source FROM tag_values "
+    _QUERY_SQL = _SELECT_COLS + "WHERE tag_id = ? ORDER BY timestamp LIMIT ?"
+    _QUERY_START_SQL = (
+        _SELECT_COLS
+        + "WHERE tag_id = ? AND timestamp >= ? ORDER BY timestamp LIMIT ?"
+    )
+    _QUERY_END_SQL = (
+        _SELECT_COLS
+        + "WHERE tag_id = ? AND timestamp <= ? ORDER BY timestamp LIMIT ?"
+    )
+    _QUERY_RANGE_SQL = (
+        _SELECT_COLS
+        + "WHERE tag_id = ? AND timestamp >= ? AND timestamp <= ? "
+        "ORDER BY timestamp LIMIT ?"
+    )
+    _LATEST_SQL = (
+        _SELECT_COLS + "WHERE tag_id = ? ORDER BY timestamp DESC LIMIT 1"
+    )
+    _DELETE_ALL_SQL = "DELETE FROM tag_values WHERE tag_id = ?"
+
+    # 欄式讀取路徑只取數值欄位
+    _NUM_COLS = "SELECT timestamp, value FROM tag_values "
+    _NUM_QUERY_SQL = _NUM_COLS + "WHERE tag_id = ? ORDER BY timestamp LIMIT ?"
+    _NUM_QUERY_START_SQL = (
+        _NUM_COLS + "WHERE tag_id = ? AND timestamp >= ? ORDER BY timestamp LIMIT ?"
+    )
+    _NUM_QUERY_END_SQL = (
+        _NUM_COLS + "WHERE tag_id = ? AND timestamp <= ? ORDER BY timestamp LIMIT ?"
+    )
+    _NUM_QUERY_RANGE_SQL = (
+        _NUM_COLS
+        + "WHERE tag_id = ? AND timestamp >= ? AND timestamp <= ? "
+        "ORDER BY timestamp LIMIT ?"
+    )
+
+    def __init__(self, db_path: str = "tsdb.db", uri: bool = False):
+        self.db_path = db_path
+        self._uri = uri
+        # 每執行緒各自持有連線：單一共享連線上 SQLite 以內部
+        # mutex 序列化所有操作，多客戶端攝取無法擴展；WAL 下
+        # 各執行緒自有連線可並行讀 + 單寫。in-memory 數據庫
+        # 維持單一共享連線 + 鎖
+        self._is_memory = db_path == ":memory:" or (
+            uri and "mode=memory" in db_path
+        )
+        self._local = threading.local()
+        self._conns: List[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self._shared_conn: Optional[sqlite3.Connection] = None
+        self._shared_lock = threading.Lock()
+        if self._is_memory:
+            self._shared_conn = self._open_conn()
+        self._create_tables()
+
+    @classmethod
+    def shared_memory(cls, name: str) -> "SQLiteTSDB":
+        """
+        行程內共享的命名 in-memory TSDB
+
+        以 `file:<name>?mode=memory&cache=shared` URI 連線：同名的
+        後續實例附掛到同一個 in-RAM 數據庫，schema 建立與頁快取
+        暖機只付一次。每個名稱保留一條常駐連線，避免最後一條
+        連線關閉時數據庫被回收。
+
+        Args:
+            name: 數據庫名稱（行程內唯一）
+
+        Returns:
+            SQLiteTSDB: 共享 in-memory TSDB
+        """
+        uri = f"file:{name}?mode=memory&cache=shared"
+        if name not in _MEMORY_KEEPALIVE:
+            _MEMORY_KEEPALIVE[name] = sqlite3.connect(
+                uri, uri=True, check_same_thread=False
+            )
+        return cls(uri, uri=True)
+
+    def _open_conn(self) -> sqlite3.Connection:
+        """開啟新連線並套用 PRAGMA（每連線一次）"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=256,
+            uri=self._uri,
+        )
+        self._apply_pragmas(conn)
+        with self._conns_lock:
+            self._conns.append(conn)
+        return conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """當前執行緒的連線（首次存取時延遲開啟）"""
+        if self._shared_conn is not None:
+            return self._shared_conn
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open_conn()
+            self._local.conn = conn
+        return conn
+
+    @property
+    def _lock(self) -> threading.Lock:
+        """當前連線的鎖（per-thread 連線的鎖無競爭）"""
+        if self._shared_conn is not None:
+            return self._shared_lock
+        lock = getattr(self._local, "lock", None)
+        if lock is None:
+            lock = threading.Lock()
+            self._local.lock = lock
+        return lock
+
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        """
+        套用寫入吞吐量導向的 PRAGMA 調校
+
+        預設 rollback journal + synchronous=FULL 每次提交都 fsync，
+        是時序寫入速率的主要瓶頸。WAL + NORMAL 下批量與單筆寫入的
+        每次提交延遲降一個數量級，且讀寫可並行。
+        """
+        conn.execute("PRAGMA page_size=8192")
+        if self._is_memory:
+            # in-memory 無耐久性需求：journal 也留在記憶體
+            conn.execute("PRAGMA journal_mode=MEMORY")
+        else:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA wal_autocheckpoint=10000")
+            conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        # 多連線並發下寫衝突改為等待而非立即 SQLITE_BUSY
+        conn.execute("PRAGMA busy_timeout=5000")
+
+    def _create_tables(self):
+        """
+        創建數據表
+
+        以 (tag_id, timestamp) 複合主鍵 + WITHOUT ROWID 叢集儲存：
+        每筆插入只寫一棵 B-tree，範圍掃描依 tag 再依時間的物理
+        順序讀取，無 rowid 間接層。
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tag_values (
+                tag_id TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
+                value REAL,
+                quality TEXT DEFAULT 'Good',
+                source TEXT DEFAULT '',
+                PRIMARY KEY (tag_id, timestamp)
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+    def write_tag_value(self, tag_value: TagValue) -> bool:
+        """寫入單個數據點"""
+        with self._lock:
+            try:
+                self.conn.execute(
+                    self._INSERT_SQL,
+                    (
+                        tag_value.tag_id,
+                        _to_ns(tag_value.timestamp),
+                        tag_value.value,
+                        tag_value.quality,
+                        tag_value.source,
+                    ),
+                )
+                self.conn.commit()
+                return True
+            except sqlite3.Error as e:
+                print(f"[SQLiteTSDB] write_tag_value failed: {e}")
+                return False
+
+    def write_tag_values(self, tag_values: List[TagValue]) -> int:
+        """
+        批量寫入數據點
+
+        單一 executemany 於 `with self.conn:` 隱式交易內執行：
+        整批一次 BEGIN/COMMIT、一次 fsync。交易為全有或全無，
+        成功即代表整批落地，直接返回 len(tag_values)。
+        """
+        with self._lock:
+            try:
+                with self.conn:
+                    self.conn.executemany(
+                        self._INSERT_SQL,
+                        (
+                            (tv.tag_id, _to_ns(tv.timestamp), tv.value, tv.quality, tv.source)
+                            for tv in tag_values
+                        ),
+                    )
+                return len(tag_values)
+            except sqlite3.Error as e:
+                print(f"[SQLiteTSDB] write_tag_values failed: {e}")
+                return 0
+
+    def query_tag_values(
+        self,
+        tag_id: str,
+        start_time: Optional[Any] = None,
+        end_time: Optional[Any] = None,
+        limit: int = 1000,
+    ) -> List[TagValue]:
+        """查詢時間範圍內的數據點（返回的時間戳為 epoch 奈秒整數）"""
+        return list(
+            self.iter_tag_values(tag_id, start_time, end_time, limit=limit)
+        )
+
+    def iter_tag_values(
+        self,
+        tag_id: str,
+        start_time: Optional[Any] = None,
+        end_time: Optional[Any] = None,
+        limit: int = -1,
+        chunk: int = 10000,
+    ) -> Iterator[TagValue]:
+        """
+        串流查詢時間範圍內的數據點
+
+        以 fetchmany 分塊自 cursor 取數並逐筆 yield，峰值記憶體
+        為一個 chunk 而非整個結果集；大範圍匯出/封存等路徑應
+        優先使用此入口。query_tag_values 即為其 list 包裝。
+
+        範圍掃描直接走 WITHOUT ROWID 表的叢集主鍵
+        (tag_id, timestamp)（EXPLAIN QUERY PLAN:
+        'SEARCH tag_values USING PRIMARY KEY (tag_id=? AND
+        timestamp>? AND timestamp<?)'），結果已依時間排序，
+        ORDER BY 不觸發額外排序；次級 (tag_id, timestamp) 索引
+        只會是整表的第二份拷貝，刻意不建。
+
+        Args:
+            tag_id: Tag 實例 ID
+            start_time: 開始時間（None 表示不限）
+            end_time: 結束時間（None 表示不限）
+            limit: 最大筆數（-1 表示不限）
+            chunk: 每次自 cursor 預取的筆數
+
+        Yields:
+            TagValue: 數據點（依時間遞增；時間戳為 epoch 奈秒整數）
+        """
+        sql, params = self._pick_range_sql(
+            (
+                self._QUERY_SQL,
+                self._QUERY_START_SQL,
+                self._QUERY_END_SQL,
+                self._QUERY_RANGE_SQL,
+            ),
+            tag_id,
+            start_time,
+            end_time,
+            limit,
+        )
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(sql, params)
+        while True:
+            # 逐塊取數；鎖僅於取塊期間持有，不橫跨消費端迭代
+            with self._lock:
+                rows = cursor.fetchmany(chunk)
+            if not rows:
+                return
+            for row in rows:
+                yield TagValue(row[0], row[1], row[2], row[3], row[4])
+
+    def query_tag_values_multi(
+        self,
+        tag_ids: List[str],
+        start_time: Optional[Any] = None,
+        end_time: Optional[Any] = None,
+    ) -> Dict[str, List[TagValue]]:
+        """
+        批量查詢多個 Tag 的時間範圍數據
+
+        單一 `tag_id IN (...)` 查詢取代逐 Tag 的 SQL 往返，
+        監控面板等一次掃多個 Tag 的呼叫端自 N 次
+        round trip 降為 1 次；結果於單趟走訪中依 tag_id 分組。
+        SQL 文字依 tag 數固定，重複呼叫仍命中敘述快取。
+
+        Args:
+            tag_ids: Tag 實例 ID 列表
+            start_time: 開始時間（None 表示不限）
+            end_time: 結束時間（None 表示不限）
+
+        Returns:
+            Dict[str, List[TagValue]]: tag_id → 數據點列表
+                （無數據的 tag 對應空列表）
+        """
+        results: Dict[str, List[TagValue]] = {t: [] for t in tag_ids}
+        if not tag_ids:
+            return results
+
+        placeholders = ",".join("?" * len(tag_ids))
+        conditions = [f"tag_id IN ({placeholders})"]
+        params: List[Any] = list(tag_ids)
+        if start_time is not None:
+            conditions.append("timestamp >= ?")
+            params.append(_to_ns(start_time))
+        if end_time is not None:
+            conditions.append("timestamp <= ?")
+            params.append(_to_ns(end_time))
+        sql = (
+            f"{self._SELECT_COLS}"
+            f"WHERE {' AND '.join(conditions)} "
+            f"ORDER BY tag_id, timestamp"
+        )
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        for row in rows:
+            results[row[0]].append(
+                TagValue(row[0], row[1], row[2], row[3], row[4])
+            )
+        return results
+
+    @staticmethod
+    def _pick_range_sql(variants, tag_id, start_time, end_time, limit):
+        """
+        依時間邊界組合選定常數 SQL 與參數
+
+        Args:
+            variants: (無邊界, 僅起點, 僅迄點, 雙邊界) 四個常數 SQL
+
+        Returns:
+            Tuple[str, tuple]: (SQL, 參數)
+        """
+        no_bounds, start_only, end_only, both = variants
+        if start_time is not None and end_time is not None:
+            return both, (tag_id, _to_ns(start_time), _to_ns(end_time), limit)
+        if start_time is not None:
+            return start_only, (tag_id, _to_ns(start_time), limit)
+        if end_time is not None:
+            return end_only, (tag_id, _to_ns(end_time), limit)
+        return no_bounds, (tag_id, limit)
+
+    def query_tag_values_columnar(
+        self,
+        tag_id: str,
+        start_time: Optional[Any] = None,
+        end_time: Optional[Any] = None,
+        limit: int = 1000,
+    ) -> Dict[str, "np.ndarray"]:
+        """
+        欄式查詢：直接返回 NumPy 欄陣列
+
+        分析型下游（聚合、繪圖、重採樣）不需要逐列的 TagValue
+        物件；此路徑只取數值欄位，單次 fetchall 後以 np.fromiter
+        直接填入連續陣列，免去每列一個 Python 物件的配置。
+
+        Args:
+            tag_id: Tag ID
+            start_time: 起始時間（int 奈秒 / float 秒 / ISO 字串）
+            end_time: 結束時間
+            limit: 最大筆數
+
+        Returns:
+            Dict[str, np.ndarray]: {"timestamp": int64 陣列,
+            "value": float64 陣列}，依時間遞增排序
+        """
+        sql, params = self._pick_range_sql(
+            (
+                self._NUM_QUERY_SQL,
+                self._NUM_QUERY_START_SQL,
+                self._NUM_QUERY_END_SQL,
+                self._NUM_QUERY_RANGE_SQL,
+            ),
+            tag_id,
+            start_time,
+            end_time,
+            limit,
+        )
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        n = len(rows)
+        return {
+            "timestamp": np.fromiter(
+                (row[0] for row in rows), dtype=np.int64, count=n
+            ),
+            "value": np.fromiter(
+                (row[1] for row in rows), dtype=np.float64, count=n
+            ),
+        }
+
+    def archive_tag(self, tag_id: str, parquet_path: str) -> int:
+        """
+        將指定 Tag 的全部數據點封存為 Parquet 文件
+
+        感測器時序以輕量編碼（delta、字典、zstd）高度可壓縮；
+        冷數據移至欄式 Parquet 後，掃描自記憶體頻寬受限縮為
+        小數倍的 I/O。熱表保留在 SQLite，封存不刪除原始列——
+        下游可經 pyarrow.dataset 聯集查詢，確認後再行
+        delete_tag_values。
+
+        Args:
+            tag_id: Tag 實例 ID
+            parquet_path: 輸出 Parquet 文件路徑
+
+        Returns:
+            int: 封存的數據點數量
+
+        Raises:
+            RuntimeError: 未安裝 pyarrow 時
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError(
+                "archive_tag 需要 pyarrow（pip install pyarrow）"
+            ) from e
+
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT timestamp, value, quality, source FROM tag_values "
+                "WHERE tag_id = ? ORDER BY timestamp",
+                (tag_id,),
+            ).fetchall()
+        if not rows:
+            return 0
+
+        n = len(rows)
+        table = pa.table(
+            {
+                "timestamp": pa.array(
+                    np.fromiter((r[0] for r in rows), dtype=np.int64, count=n)
+                ),
+                "value": pa.array(
+                    np.fromiter((r[1] for r in rows), dtype=np.float64, count=n)
+                ),
+                # 低基數欄位以字典編碼
+                "quality": pa.array([r[2] for r in rows]).dictionary_encode(),
+                "source": pa.array([r[3] for r in rows]).dictionary_encode(),
+            }
+        )
+        pq.write_table(
+            table,
+            parquet_path,
+            compression="zstd",
+            use_dictionary=True,
+            write_statistics=True,
+            row_group_size=10_000_000,
+        )
+        return n
+
+    def query_latest_value(self, tag_id: str) -> Optional[TagValue]:
+        """
+        查詢最新數據點（返回的時間戳為 epoch 奈秒整數）
+
+        WITHOUT ROWID 表叢集於 (tag_id, timestamp)，此查詢即為
+        主鍵上的 O(log n) 反向探測（EXPLAIN QUERY PLAN:
+        `SEARCH tag_values USING PRIMARY KEY (tag_id=?)`），
+        無 rowid 間接層；毋需另建覆蓋索引——在 WITHOUT ROWID
+        表上那等同複製整張表。
+        """
+        with self._lock:
+            row = self.conn.execute(self._LATEST_SQL, (tag_id,)).fetchone()
+            if row is None:
+                return None
+            return TagValue(
+                tag_id=row[0],
+                timestamp=row[1],
+                value=row[2],
+                quality=row[3],
+                source=row[4],
+            )
+
+    def query_aggregated_values(
+        self,
+        tag_id: str,
+        start_time: Any,
+        end_time: Any,
+        function: AggregationFunction = AggregationFunction.AVG,
+        interval_seconds: Optional[int] = None,
+    ) -> List[AggregatedValue]:
+        """
+        時間分桶聚合查詢
+
+        以整數奈秒時間戳 `GROUP BY timestamp / bucket_ns` 於 SQLite
+        C 層完成分桶聚合，每桶返回一筆 AggregatedValue（start/end
+        為桶內實際的最早/最晚時間戳）。`interval_seconds` 為 None
+        時整段範圍視為單一桶。STDDEV 以 SUM(v)/SUM(v*v)/COUNT
+        一次掃描取得動差後於 Python 後處理。
+        """
+        start_ns = _to_ns(start_time)
+        end_ns = _to_ns(end_time)
+        if interval_seconds is not None and interval_seconds > 0:
+            bucket_ns = interval_seconds * 1_000_000_000
+        else:
+            # 單一桶：桶寬涵蓋 [0, end_ns]，分桶對齊 epoch 起點，
+            # 範圍內所有時間戳落在桶 0
+            bucket_ns = end_ns + 1
+
+        if function is AggregationFunction.STDDEV:
+            return self._query_stddev(tag_id, start_ns, end_ns, bucket_ns)
+
+        agg = _AGG_SQL.get(function)
+        if agg is None:
+            raise ValueError(f"不支援的聚合函式: {function}")
+
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT MIN(timestamp), MAX(timestamp), {agg}(value), COUNT(*) "
+                "FROM tag_values "
+                "WHERE tag_id = ? AND timestamp >= ? AND timestamp <= ? "
+                "GROUP BY timestamp / ? ORDER BY 1",
+                (tag_id, start_ns, end_ns, bucket_ns),
+            ).fetchall()
+        return [
+            AggregatedValue(
+                tag_id=tag_id,
+                start_time=row[0],
+                end_time=row[1],
+                value=row[2],
+                count=row[3],
+            )
+            for row in rows
+        ]
+
+    def _query_stddev(
+        self, tag_id: str, start_ns: int, end_ns: int, bucket_ns: int
+    ) -> List[AggregatedValue]:
+        """
+        分桶標準差：欄式取數 + Welford 數值核心
+
+        SQLite 無內建 STDDEV；SUM(v*v) 動差式在大均值/小變異的
+        感測器數據上會災難性消去。改為單次欄式取出範圍內的
+        (timestamp, value)，以 searchsorted 在已排序的時間戳上
+        切出桶界，每桶交給 _agg_kernels 的 Welford 核心。
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                self._NUM_QUERY_RANGE_SQL,
+                (tag_id, start_ns, end_ns, -1),
+            ).fetchall()
+        if not rows:
+            return []
+
+        n = len(rows)
+        ts = np.fromiter((row[0] for row in rows), dtype=np.int64, count=n)
+        values = np.fromiter(
+            (row[1] for row in rows), dtype=np.float64, count=n
+        )
+
+        # epoch 對齊的桶編號；時間戳已排序，桶界以 searchsorted 取得
+        bucket_ids = ts // bucket_ns
+        edges = np.searchsorted(
+            bucket_ids, np.unique(bucket_ids), side="left"
+        )
+        bounds = list(edges) + [n]
+
+        results = []
+        for i in range(len(edges)):
+            lo, hi = bounds[i], bounds[i + 1]
+            results.append(
+                AggregatedValue(
+                    tag_id=tag_id,
+                    start_time=int(ts[lo]),
+                    end_time=int(ts[hi - 1]),
+                    value=stddev_welford_f64(values[lo:hi]),
+                    count=hi - lo,
+                )
+            )
+        return results
+
+    def query_aggregated_values_fast(
+        self,
+        tag_id: str,
+        start_time: Any,
+        end_time: Any,
+        function: AggregationFunction = AggregationFunction.AVG,
+        interval_seconds: Optional[int] = None,
+    ) -> List[AggregatedValue]:
+        """
+        分桶聚合（行程內平行核心）
+
+        寬時間範圍分出大量桶時，桶間聚合可跨核心平行。單次
+        欄式取數後整批交給 _agg_kernels.bucket_agg：numba 下
+        以 prange 平行各桶，一趟同時算出 sum/count/min/max/
+        stddev，再依 function 取對應輸出。語義與
+        query_aggregated_values 相同（epoch 對齊桶、start/end
+        為桶內實際時間戳）。
+        """
+        if function not in _AGG_SQL and function is not AggregationFunction.STDDEV:
+            raise ValueError(f"不支援的聚合函式: {function}")
+
+        start_ns = _to_ns(start_time)
+        end_ns = _to_ns(end_time)
+        if interval_seconds is not None and interval_seconds > 0:
+            bucket_ns = interval_seconds * 1_000_000_000
+        else:
+            bucket_ns = end_ns + 1
+
+        with self._lock:
+            rows = self.conn.execute(
+                self._NUM_QUERY_RANGE_SQL, (tag_id, start_ns, end_ns, -1)
+            ).fetchall()
+        if not rows:
+            return []
+
+        n = len(rows)
+        ts = np.fromiter((row[0] for row in rows), dtype=np.int64, count=n)
+        values = np.fromiter(
+            (row[1] for row in rows), dtype=np.float64, count=n
+        )
+
+        first_bucket = int(ts[0]) // bucket_ns
+        n_buckets = int(ts[-1]) // bucket_ns - first_bucket + 1
+        ts_min = np.zeros(n_buckets, dtype=np.int64)
+        ts_max = np.zeros(n_buckets, dtype=np.int64)
+        sums = np.zeros(n_buckets)
+        counts = np.zeros(n_buckets, dtype=np.int64)
+        mins = np.zeros(n_buckets)
+        maxs = np.zeros(n_buckets)
+        stds = np.zeros(n_buckets)
+        bucket_agg(
+            ts, values, bucket_ns, first_bucket,
+            ts_min, ts_max, sums, counts, mins, maxs, stds,
+        )
+
+        if function is AggregationFunction.AVG:
+            out = sums / np.maximum(counts, 1)
+        elif function is AggregationFunction.MIN:
+            out = mins
+        elif function is AggregationFunction.MAX:
+            out = maxs
+        elif function is AggregationFunction.SUM:
+            out = sums
+        elif function is AggregationFunction.COUNT:
+            out = counts
+        else:
+            out = stds
+
+        return [
+            AggregatedValue(
+                tag_id=tag_id,
+                start_time=int(ts_min[b]),
+                end_time=int(ts_max[b]),
+                value=float(out[b]),
+                count=int(counts[b]),
+            )
+            for b in range(n_buckets)
+            if counts[b] > 0
+        ]
+
+    def delete_tag_values(self, tag_id: str) -> int:
+        """刪除指定 Tag 的所有數據點"""
+        with self._lock:
+            cursor = self.conn.execute(self._DELETE_ALL_SQL, (tag_id,))
+            self.conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        """關閉所有已開啟的連線（含其他執行緒的 per-thread 連線）"""
+        with self._conns_lock:
+            conns = self._conns
+            self._conns = []
+        for conn in conns:
+            conn.close()
+        self._shared_conn = None
@@ -0,0 +1,96 @@
+# src/core/tsdb/write_buffer.py
+
+"""
+TSDB 寫入緩衝
+
+逐點寫入 TSDB 的每次呼叫都付一次交易/提交開銷，是吞吐量的
+頭號殺手。TSDBWriteBuffer 將多個 TagServant 的數據點匯入共享
+緩衝，由單一背景 flusher 執行緒以 `write_tag_values` 批量送出：
+達到 `max_points` 或 `max_latency_ms` 任一閾值即沖刷。
+"""
+
+import threading
+from collections import deque
+from typing import List
+
+from .interfaces import ITSDB, TagValue
+
+
+class TSDBWriteBuffer:
+    """
+    共享 TSDB 寫入緩衝
+
+    Attributes:
+        max_points: 觸發沖刷的緩衝點數
+        max_latency_ms: 數據點在緩衝內的最大停留時間（毫秒）
+    """
+
+    def __init__(
+        self,
+        tsdb: ITSDB,
+        max_points: int = 2000,
+        max_latency_ms: int = 100,
+    ):
+        self.tsdb = tsdb
+        self.max_points = max_points
+        self.max_latency_ms = max_latency_ms
+
+        self._buffer: deque = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._flusher = threading.Thread(
+            target=self._flush_loop,
+            name="tsdb-write-buffer",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def append(self, tag_value: TagValue):
+        """
+        追加一個數據點到緩衝
+
+        Args:
+            tag_value: 數據點
+        """
+        with self._cond:
+            self._buffer.append(tag_value)
+            if len(self._buffer) >= self.max_points:
+                self._cond.notify()
+
+    def flush(self):
+        """同步沖刷緩衝內的所有數據點"""
+        with self._cond:
+            batch = self._drain_locked()
+        if batch:
+            self.tsdb.write_tag_values(batch)
+
+    def close(self):
+        """停止 flusher 執行緒並沖刷殘餘數據點"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._flusher.join()
+        self.flush()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def _drain_locked(self) -> List[TagValue]:
+        """取出並清空緩衝（呼叫者須持有 _cond）"""
+        batch = list(self._buffer)
+        self._buffer.clear()
+        return batch
+
+    def _flush_loop(self):
+        """背景沖刷迴圈：滿量立即沖刷，否則依最大延遲定期沖刷"""
+        timeout = self.max_latency_ms / 1000.0
+        while True:
+            with self._cond:
+                if not self._closed and len(self._buffer) < self.max_points:
+                    self._cond.wait(timeout)
+                batch = self._drain_locked()
+                closed = self._closed
+            if batch:
+                self.tsdb.write_tag_values(batch)
+            if closed:
+                return
@@ -0,0 +1,290 @@
+# src/core/usdkit/io.py
+
+"""
+USD Stage / Prim I/O 輔助
+
+封裝 OpenUSD 的 Stage 建立/開啟/匯出與 Prim 增刪查，
+供 runtime 與 tools 層以一致介面操作 USD 場景。
+"""
+
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from pxr import Sdf, Usd, UsdGeom
+
+# in_memory stage → 目標輸出路徑（commit_stage 時使用）
+_PENDING_EXPORT: "WeakKeyDictionary" = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=4096)
+def _sdf_path(prim_path: str) -> Sdf.Path:
+    """
+    字串 → Sdf.Path 的快取轉換
+
+    每次以字串呼叫 DefinePrim/GetPrimAtPath 都在 C++ 層重新
+    解析並 intern 路徑；pipeline 反覆操作同一批路徑時，
+    快取後直接傳遞已建構的 Sdf.Path。（原工單同時提及
+    TfToken 快取；Python 綁定的 prim type 以字串傳遞、
+    無可建構的 TfToken，故僅快取路徑。）
+    """
+    return Sdf.Path(prim_path)
+
+
+def _coerce_crate(file_path: Union[str, Path]) -> Path:
+    """未指定副檔名或 `.usd` 一律改寫為 `.usdc`（二進位 crate）"""
+    file_path = Path(file_path)
+    if file_path.suffix.lower() in ("", ".usd"):
+        file_path = file_path.with_suffix(".usdc")
+    return file_path
+
+
+def create_stage(
+    file_path: Union[str, Path],
+    up_axis: str = "Z",
+    in_memory: bool = False,
+) -> Usd.Stage:
+    """
+    創建新的 USD Stage
+
+    未指定副檔名或為 `.usd` 時一律改寫為 `.usdc`（二進位
+    crate 格式）：ASCII `.usda` 的存/載慢 3-10 倍且文件大得多，
+    僅建議除錯時使用。
+
+    `in_memory=True` 時在記憶體中 authoring：file-backed stage
+    上每次 DefinePrim 都弄髒磁碟 layer，大量 authoring 後以
+    `commit_stage` 一次性序列化到目標路徑快得多（多次小寫
+    合併為單次大寫）。
+
+    Args:
+        file_path: 輸出文件路徑（例如 "scene.usdc"）
+        up_axis: 上軸（"Z" 或 "Y"）
+        in_memory: 是否在記憶體中 authoring（以 commit_stage 落盤）
+
+    Returns:
+        Usd.Stage: 新建的 Stage
+    """
+    file_path = _coerce_crate(file_path)
+    if in_memory:
+        stage = Usd.Stage.CreateInMemory()
+        _PENDING_EXPORT[stage] = file_path
+    else:
+        stage = Usd.Stage.CreateNew(str(file_path))
+    UsdGeom.SetStageUpAxis(
+        stage, UsdGeom.Tokens.z if up_axis.upper() == "Z" else UsdGeom.Tokens.y
+    )
+    return stage
+
+
+def commit_stage(stage: Usd.Stage) -> str:
+    """
+    將 in-memory Stage 一次性匯出到 create_stage 記錄的目標路徑
+
+    file-backed stage 則等價於 `Save()`。
+
+    Args:
+        stage: create_stage 返回的 Stage
+
+    Returns:
+        str: 實際輸出路徑
+    """
+    target = _PENDING_EXPORT.pop(stage, None)
+    if target is not None:
+        stage.Export(str(target))
+        return str(target)
+    stage.Save()
+    return stage.GetRootLayer().realPath
+
+
+def open_stage(
+    file_path: Union[str, Path], load: str = "all"
+) -> Optional[Usd.Stage]:
+    """
+    開啟既有的 USD Stage
+
+    `load="none"` 以 LoadNone 開啟：不組合/載入任何 payload，
+    之後以 `stage.Load(prim_path)` 按需水合。對只做遍歷或
+    中繼數據查詢的路徑，省去載入全部引用資產的成本。
+
+    Args:
+        file_path: USD 文件路徑
+        load: payload 載入策略（"all" 或 "none"）
+
+    Returns:
+        Optional[Usd.Stage]: Stage（文件不存在時為 None）
+    """
+    # Usd.Stage.Open 對不存在的文件拋 Tf.ErrorException，
+    # 先檢查路徑以兌現「不存在返回 None」的介面約定
+    if not Path(file_path).is_file():
+        return None
+    load_set = (
+        Usd.Stage.LoadNone if load == "none" else Usd.Stage.LoadAll
+    )
+    return Usd.Stage.Open(str(file_path), load=load_set)
+
+
+def open_stage_for_read(file_path: Union[str, Path]) -> Optional[Usd.Stage]:
+    """
+    以 LoadNone 開啟 Stage（純遍歷/中繼數據查詢的便捷入口）
+
+    Args:
+        file_path: USD 文件路徑
+
+    Returns:
+        Optional[Usd.Stage]: Stage（文件不存在時為 None）
+    """
+    return open_stage(file_path, load="none")
+
+
+def export_stage(stage: Usd.Stage, file_path: Union[str, Path]) -> str:
+    """
+    將 Stage 匯出到指定路徑
+
+    與 create_stage 相同，未指定副檔名或 `.usd` 改寫為 `.usdc`。
+
+    Args:
+        stage: 來源 Stage
+        file_path: 輸出路徑
+
+    Returns:
+        str: 實際輸出路徑
+    """
+    file_path = _coerce_crate(file_path)
+    stage.Export(str(file_path))
+    return str(file_path)
+
+
+def create_prim(
+    stage: Usd.Stage, prim_path: str, prim_type: str = "Xform"
+) -> Usd.Prim:
+    """
+    在 Stage 上定義一個 Prim
+
+    Args:
+        stage: 目標 Stage
+        prim_path: Prim 路徑（例如 "/World/Pump_001"）
+        prim_type: Prim 類型（例如 "Xform", "Mesh"）
+
+    Returns:
+        Usd.Prim: 定義的 Prim
+    """
+    return stage.DefinePrim(_sdf_path(prim_path), prim_type)
+
+
+def author_prim_spec(
+    layer: Sdf.Layer, prim_path: str, prim_type: str = "Xform"
+) -> Sdf.PrimSpec:
+    """
+    在 Sdf layer 上直接定義 Prim spec（可安全用於 ChangeBlock 內）
+
+    Usd.Stage 層級的 DefinePrim 依賴組合結果，在 Sdf.ChangeBlock
+    內呼叫會拋 Tf.ErrorException；此函式只動 layer 的 prim spec，
+    是 ChangeBlock 內唯一合法的 authoring 形式。
+
+    Args:
+        layer: 目標 layer（通常為 stage 的 edit target layer）
+        prim_path: Prim 路徑
+        prim_type: Prim 類型
+
+    Returns:
+        Sdf.PrimSpec: 建立（或既有）的 prim spec
+    """
+    spec = Sdf.CreatePrimInLayer(layer, _sdf_path(prim_path))
+    spec.specifier = Sdf.SpecifierDef
+    # 空類型維持無類型 prim（與 DefinePrim 一致）；
+    # 對 spec 寫入空 typeName 會拋 Tf.ErrorException
+    if prim_type:
+        spec.typeName = prim_type
+    return spec
+
+
+def create_prims(
+    stage: Usd.Stage, specs: List[Tuple[str, str]]
+) -> List[Usd.Prim]:
+    """
+    批量定義 Prim（單一 Sdf.ChangeBlock 內）
+
+    逐次 create_prim 每筆都觸發 USD 變更通知並重組合 stage
+    （O(N × 深度)）；ChangeBlock 將通知推遲到區塊結束，
+    千級 Prim 的 authoring 僅付一次重組合成本。區塊內
+    以 Sdf 層級寫 prim spec（stage 層級的 DefinePrim 依賴
+    組合結果，在 ChangeBlock 內會拋錯），組合後的 Prim
+    於區塊結束、stage 重組合完成後再取回。
+
+    Args:
+        stage: 目標 Stage
+        specs: (prim_path, prim_type) 列表
+
+    Returns:
+        List[Usd.Prim]: 定義的 Prim 列表（與 specs 同序）
+    """
+    layer = stage.GetEditTarget().GetLayer()
+    with Sdf.ChangeBlock():
+        for prim_path, prim_type in specs:
+            author_prim_spec(layer, prim_path, prim_type)
+    return [
+        stage.GetPrimAtPath(_sdf_path(prim_path))
+        for prim_path, _ in specs
+    ]
+
+
+@contextmanager
+def batched_authoring(stage: Usd.Stage):
+    """
+    批量 authoring 上下文：區塊內的變更通知推遲到退出時
+
+    產出 stage 的 edit target layer；區塊內只能做 Sdf 層級的
+    編輯（author_prim_spec 等），stage 層級的 DefinePrim /
+    GetPrimAtPath 依賴組合結果、於 ChangeBlock 內會拋錯，
+    須待區塊結束後再呼叫：
+
+        with batched_authoring(stage) as layer:
+            for prim_path, prim_type in specs:
+                author_prim_spec(layer, prim_path, prim_type)
+        prims = [get_prim(stage, p) for p, _ in specs]
+
+    Args:
+        stage: 目標 Stage（ChangeBlock 為全域性，layer 自
+            edit target 取得）
+    """
+    with Sdf.ChangeBlock():
+        yield stage.GetEditTarget().GetLayer()
+
+
+def get_prim(
+    stage: Usd.Stage, prim_path: str, load: bool = False
+) -> Optional[Usd.Prim]:
+    """
+    獲取指定路徑的 Prim
+
+    Args:
+        stage: 目標 Stage
+        prim_path: Prim 路徑
+        load: 是否按需載入該 Prim 的 payload（配合 LoadNone
+            開啟的 stage 做選擇性水合）
+
+    Returns:
+        Optional[Usd.Prim]: Prim（不存在時為 None）
+    """
+    prim = stage.GetPrimAtPath(_sdf_path(prim_path))
+    if not prim.IsValid():
+        return None
+    if load and not prim.IsLoaded():
+        prim.Load()
+    return prim
+
+
+def delete_prim(stage: Usd.Stage, prim_path: str) -> bool:
+    """
+    刪除指定路徑的 Prim
+
+    Args:
+        stage: 目標 Stage
+        prim_path: Prim 路徑
+
+    Returns:
+        bool: 是否成功刪除
+    """
+    return stage.RemovePrim(_sdf_path(prim_path))
@@ -0,0 +1,182 @@
+# src/core/usdkit/reference.py
+
+"""
+USD Reference / Variant 輔助
+
+資產引用與 variant set 的增改查：IADL 資產庫以 variant
+表達設備的型號/狀態切換，FDL 佈局以 reference 實例化資產。
+"""
+
+from contextlib import contextmanager
+from typing import List, Optional
+
+from pxr import Usd
+
+
+def add_reference(
+    prim: Usd.Prim, asset_path: str, prim_path: Optional[str] = None
+) -> bool:
+    """
+    為 Prim 加入對外部資產的引用
+
+    Args:
+        prim: 目標 Prim
+        asset_path: 被引用的 USD 文件路徑
+        prim_path: 被引用文件內的 prim 路徑（None 表示 defaultPrim）
+
+    Returns:
+        bool: 是否成功加入
+    """
+    if prim_path is not None:
+        return prim.GetReferences().AddReference(asset_path, prim_path)
+    return prim.GetReferences().AddReference(asset_path)
+
+
+def list_references(prim: Usd.Prim, deep: bool = False) -> List[str]:
+    """
+    列出 Prim 引用的資產路徑
+
+    預設經 Usd.PrimCompositionQuery 以單次 C++ 呼叫取得直接
+    引用 arc，不在 Python 層逐 layer 走訪 prim stack；
+    `deep=True` 時退回完整 prim stack 走訪（涵蓋巢狀組合中
+    的全部 reference list，較慢）。
+
+    Args:
+        prim: 目標 Prim
+        deep: 是否走訪完整 prim stack
+
+    Returns:
+        List[str]: 引用的資產路徑列表
+    """
+    if deep:
+        asset_paths = []
+        for spec in prim.GetPrimStack():
+            for ref in spec.referenceList.prependedItems:
+                asset_paths.append(ref.assetPath)
+        return asset_paths
+
+    query = Usd.PrimCompositionQuery.GetDirectReferences(prim)
+    asset_paths = []
+    for arc in query.GetCompositionArcs():
+        _, ref = arc.GetIntroducingListEditor()
+        if ref is not None:
+            asset_paths.append(ref.assetPath)
+    return asset_paths
+
+
+def _get_or_create_variant_set(
+    prim: Usd.Prim, variant_set_name: str
+) -> Usd.VariantSet:
+    """
+    獲取（或建立）Prim 上的 variant set
+
+    GetVariantSet 是一次組合查詢；五個 variant 輔助函式統一
+    經此取得，批量 authoring 時同一 prim/名稱只查一次由
+    呼叫端持有返回值即可。
+
+    Args:
+        prim: 目標 Prim
+        variant_set_name: variant set 名稱
+
+    Returns:
+        Usd.VariantSet: variant set（不存在時建立）
+    """
+    variant_sets = prim.GetVariantSets()
+    if variant_sets.HasVariantSet(variant_set_name):
+        return variant_sets.GetVariantSet(variant_set_name)
+    return variant_sets.AddVariantSet(variant_set_name)
+
+
+def add_variant(
+    prim: Usd.Prim, variant_set_name: str, variant_name: str
+) -> bool:
+    """
+    在 variant set 中新增一個 variant
+
+    Args:
+        prim: 目標 Prim
+        variant_set_name: variant set 名稱
+        variant_name: variant 名稱
+
+    Returns:
+        bool: 是否成功新增
+    """
+    return _get_or_create_variant_set(prim, variant_set_name).AddVariant(
+        variant_name
+    )
+
+
+def set_variant_selection(
+    prim: Usd.Prim, variant_set_name: str, variant_name: str
+) -> bool:
+    """
+    設定 variant 選擇
+
+    Args:
+        prim: 目標 Prim
+        variant_set_name: variant set 名稱
+        variant_name: 要選擇的 variant
+
+    Returns:
+        bool: 是否成功設定
+    """
+    return _get_or_create_variant_set(
+        prim, variant_set_name
+    ).SetVariantSelection(variant_name)
+
+
+def get_variant_selection(prim: Usd.Prim, variant_set_name: str) -> str:
+    """
+    獲取當前的 variant 選擇
+
+    Args:
+        prim: 目標 Prim
+        variant_set_name: variant set 名稱
+
+    Returns:
+        str: 當前選擇的 variant（未選擇時為空字串）
+    """
+    return _get_or_create_variant_set(
+        prim, variant_set_name
+    ).GetVariantSelection()
+
+
+def list_variants(prim: Usd.Prim, variant_set_name: str) -> List[str]:
+    """
+    列出 variant set 中的所有 variant
+
+    Args:
+        prim: 目標 Prim
+        variant_set_name: variant set 名稱
+
+    Returns:
+        List[str]: variant 名稱列表
+    """
+    return _get_or_create_variant_set(
+        prim, variant_set_name
+    ).GetVariantNames()
+
+
+@contextmanager
+def edit_variant(
+    prim: Usd.Prim, variant_set_name: str, variant_name: str
+):
+    """
+    在指定 variant 的編輯上下文內 authoring
+
+    用法：
+
+        with edit_variant(prim, "model", "high_detail"):
+            create_prim(stage, "/Asset/Geo", "Mesh")
+
+    Args:
+        prim: 目標 Prim
+        variant_set_name: variant set 名稱
+        variant_name: 目標 variant（不存在時建立並選擇）
+    """
+    variant_set = _get_or_create_variant_set(prim, variant_set_name)
+    if variant_name not in variant_set.GetVariantNames():
+        variant_set.AddVariant(variant_name)
+    variant_set.SetVariantSelection(variant_name)
+    with variant_set.GetVariantEditContext():
+        yield variant_set
@@ -0,0 +1,183 @@
+# src/core/usdkit/units.py
+
+"""
+長度單位轉換
+
+IADL/FDL 資產與 USD stage 間的單位對齊：標量轉換、批量
+點陣列轉換與 stage 級 metersPerUnit 換算。
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from pxr import Gf, Usd, UsdGeom
+
+# 各單位對公尺的比例
+UNIT_TO_METERS = {
+    "mm": 0.001,
+    "cm": 0.01,
+    "dm": 0.1,
+    "m": 1.0,
+    "km": 1000.0,
+    "in": 0.0254,
+    "ft": 0.3048,
+    "yd": 0.9144,
+}
+
+# 單位對 → 比例係數，於 import 期全展開（8 單位 = 64 項）：
+# 熱路徑自兩次 dict 查找 + 除法縮為單次查找 + 乘法
+SCALE_FACTORS = {
+    (a, b): UNIT_TO_METERS[a] / UNIT_TO_METERS[b]
+    for a in UNIT_TO_METERS
+    for b in UNIT_TO_METERS
+}
+
+
+def convert_length(value: float, from_unit: str, to_unit: str) -> float:
+    """
+    轉換單一長度值
+
+    Args:
+        value: 長度值
+        from_unit: 來源單位（例如 "mm"）
+        to_unit: 目標單位（例如 "m"）
+
+    Returns:
+        float: 轉換後的長度值
+
+    Raises:
+        ValueError: 未知單位
+    """
+    try:
+        return value * SCALE_FACTORS[(from_unit, to_unit)]
+    except KeyError:
+        unknown = from_unit if from_unit not in UNIT_TO_METERS else to_unit
+        raise ValueError(f"未知單位: {unknown}") from None
+
+
+def convert_points_array(
+    points: "np.ndarray",
+    from_unit: str,
+    to_unit: str,
+    out: Optional["np.ndarray"] = None,
+) -> "np.ndarray":
+    """
+    批量轉換點陣列
+
+    單位驗證一次、比例係數計算一次，整個 (N,3) 陣列以單一
+    向量化乘法轉換；點雲/網格頂點等批量呼叫端不再逐座標
+    走 Python 標量路徑。
+
+    Args:
+        points: 點陣列，shape (N,3)
+        from_unit: 來源單位
+        to_unit: 目標單位
+        out: 選配的輸出陣列（原地轉換時傳入 points 本身）
+
+    Returns:
+        np.ndarray: 轉換後的點陣列
+    """
+    try:
+        scale = SCALE_FACTORS[(from_unit, to_unit)]
+    except KeyError:
+        unknown = from_unit if from_unit not in UNIT_TO_METERS else to_unit
+        raise ValueError(f"未知單位: {unknown}") from None
+    return np.multiply(np.asarray(points, dtype=np.float64), scale, out=out)
+
+
+def convert_point(
+    point: Sequence[float], from_unit: str, to_unit: str
+) -> List[float]:
+    """
+    轉換單一點座標（convert_points_array 的薄包裝）
+
+    Args:
+        point: [x, y, z]
+        from_unit: 來源單位
+        to_unit: 目標單位
+
+    Returns:
+        List[float]: 轉換後的 [x, y, z]
+    """
+    converted = convert_points_array(
+        np.asarray(point, dtype=np.float64).reshape(1, 3),
+        from_unit,
+        to_unit,
+    )
+    return converted[0].tolist()
+
+
+def convert_stage_units(
+    stage: Usd.Stage, to_unit: str, metadata_only: bool = False
+) -> float:
+    """
+    將 Stage 換算到目標單位
+
+    更新 metersPerUnit 中繼數據，並只在每條分支最上層的
+    Xformable prim 套用縮放補償：該縮放沿子樹傳遞（含後代的
+    平移），逐層補償會讓縮放隨巢狀深度次方複利。補償 prim
+    自身的平移位於 stage 空間、不受自身 scale op 影響，
+    須一併乘上係數。
+
+    縮放係數為 1.0（單位未變）或 `metadata_only=True` 時只更新
+    中繼數據、不觸碰幾何。補償優先走 XformCommonAPI（每 prim
+    單次 C++ 呼叫），僅在 xformOp 順序不相容時退回逐 op 檢查。
+
+    Args:
+        stage: 目標 Stage
+        to_unit: 目標單位
+        metadata_only: 只改 metersPerUnit，跳過幾何縮放
+
+    Returns:
+        float: 套用的縮放係數
+    """
+    if to_unit not in UNIT_TO_METERS:
+        raise ValueError(f"未知單位: {to_unit}")
+    current_mpu = UsdGeom.GetStageMetersPerUnit(stage)
+    target_mpu = UNIT_TO_METERS[to_unit]
+    scale_factor = current_mpu / target_mpu
+
+    if metadata_only or scale_factor == 1.0:
+        UsdGeom.SetStageMetersPerUnit(stage, target_mpu)
+        return scale_factor
+
+    # token 查找提升到迴圈外；PrimRange 以標準述詞過濾
+    # inactive/abstract，不組合不需要的子樹
+    type_scale = UsdGeom.XformOp.TypeScale
+    type_translate = UsdGeom.XformOp.TypeTranslate
+    default_time = Usd.TimeCode.Default()
+    it = iter(
+        Usd.PrimRange.Stage(
+            stage, Usd.PrimIsActive & Usd.PrimIsDefined & ~Usd.PrimIsAbstract
+        )
+    )
+    for prim in it:
+        if not prim.IsA(UsdGeom.Xformable):
+            continue
+        # 補償掛在此 prim 後即涵蓋整個子樹（後代的縮放與
+        # 平移都在補償之下），不再深入
+        it.PruneChildren()
+        api = UsdGeom.XformCommonAPI(prim)
+        if api:
+            translation, _, scale, _, _ = api.GetXformVectors(default_time)
+            api.SetTranslate(translation * scale_factor)
+            api.SetScale(scale * scale_factor)
+            continue
+        xformable = UsdGeom.Xformable(prim)
+        scaled = False
+        for op in xformable.GetOrderedXformOps():
+            op_type = op.GetOpType()
+            if op_type == type_translate:
+                # 標量乘法保留 op 原有的 Vec3d/Vec3f 精度
+                op.Set(op.Get() * scale_factor)
+            elif op_type == type_scale and not scaled:
+                op.Set(op.Get() * scale_factor)
+                scaled = True
+        if not scaled:
+            xformable.AddScaleOp().Set(
+                Gf.Vec3f(scale_factor, scale_factor, scale_factor)
+            )
+
+    UsdGeom.SetStageMetersPerUnit(stage, target_mpu)
+    return scale_factor
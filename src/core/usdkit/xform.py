@@ -0,0 +1,338 @@
+# src/core/usdkit/xform.py
+
+"""
+USD 變換（Xform）輔助
+
+變換矩陣的建構/分解與 prim 變換的讀寫。矩陣採 USD 的
+row-vector 慣例（平移在第 3 列）。
+"""
+
+import math
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pxr import Gf, Usd, UsdGeom
+
+from ..geom.bbox import _rotation_matrices
+
+# token / op 類型常數於模組載入期解析一次，
+# 熱路徑不再逐次經 pybind 屬性存取
+_TOKEN_Y = UsdGeom.Tokens.y
+_OP_TRANSLATE = UsdGeom.XformOp.TypeTranslate
+_OP_ROTATE_X = UsdGeom.XformOp.TypeRotateX
+_OP_ROTATE_Y = UsdGeom.XformOp.TypeRotateY
+_OP_ROTATE_Z = UsdGeom.XformOp.TypeRotateZ
+_OP_ROTATE_XYZ = UsdGeom.XformOp.TypeRotateXYZ
+_OP_SCALE = UsdGeom.XformOp.TypeScale
+
+
+def create_transform_matrix(
+    translation: Sequence[float] = (0.0, 0.0, 0.0),
+    rotation: Sequence[float] = (0.0, 0.0, 0.0),
+    scale: Sequence[float] = (1.0, 1.0, 1.0),
+) -> Gf.Matrix4d:
+    """
+    建構 4x4 變換矩陣（scale → rotate → translate）
+
+    旋轉與平移直接以 SetTransform 合成到單一 Matrix4d，
+    僅在縮放非單位時再乘一次：相較逐軸建 Matrix4d 再連乘，
+    省去 3 個暫存矩陣與 2 次矩陣乘法的 pybind 往返。
+
+    Args:
+        translation: 平移 [x, y, z]
+        rotation: Euler 旋轉角（度，XYZ 順序）
+        scale: 縮放 [x, y, z]
+
+    Returns:
+        Gf.Matrix4d: 變換矩陣
+    """
+    # Gf.Rotation 的 * 為由左至右套用：X → Y → Z，
+    # 與批量路徑、RotateXYZ op 及分解端同一慣例
+    rot = (
+        Gf.Rotation(Gf.Vec3d(1, 0, 0), rotation[0])
+        * Gf.Rotation(Gf.Vec3d(0, 1, 0), rotation[1])
+        * Gf.Rotation(Gf.Vec3d(0, 0, 1), rotation[2])
+    )
+    matrix = Gf.Matrix4d()
+    matrix.SetTransform(rot, Gf.Vec3d(*translation))
+    if tuple(scale) != (1.0, 1.0, 1.0):
+        matrix = Gf.Matrix4d().SetScale(Gf.Vec3d(*scale)) * matrix
+    return matrix
+
+
+def create_transform_matrices_batch(
+    translations: "np.ndarray",
+    rotations: "np.ndarray",
+    scales: "np.ndarray",
+) -> "np.ndarray":
+    """
+    批量建構變換矩陣（純 NumPy）
+
+    sin/cos 與矩陣組合全程向量化，keyframe bake 等批量呼叫端
+    一次建出 (N,4,4)，不經 Gf 逐個組裝。輸出與
+    create_transform_matrix 同為 row-vector 慣例。
+
+    Args:
+        translations: 平移陣列，shape (N,3)
+        rotations: Euler 旋轉角陣列（度，XYZ 順序），shape (N,3)
+        scales: 縮放陣列，shape (N,3)
+
+    Returns:
+        np.ndarray: 變換矩陣陣列，shape (N,4,4)，dtype float64
+    """
+    translations = np.asarray(translations, dtype=np.float64)
+    scales = np.asarray(scales, dtype=np.float64)
+    rot = _rotation_matrices(np.asarray(rotations, dtype=np.float64))
+
+    n = translations.shape[0]
+    out = np.zeros((n, 4, 4), dtype=np.float64)
+    # row-vector 慣例：上 3x3 = diag(scale) @ R.T，平移在第 3 列
+    out[:, :3, :3] = scales[:, :, None] * rot.transpose(0, 2, 1)
+    out[:, 3, :3] = translations
+    out[:, 3, 3] = 1.0
+    return out
+
+
+def decompose_transform_matrix(
+    matrix: Gf.Matrix4d,
+) -> Tuple[List[float], List[float], List[float]]:
+    """
+    分解變換矩陣為平移/旋轉/縮放
+
+    Args:
+        matrix: 4x4 變換矩陣
+
+    縮放以單一向量化 norm 自 3x3 子矩陣取得（免建 Vec3d 暫存），
+    旋轉以 atan2 做完整 XYZ Euler 擷取（含 gimbal lock 分支）。
+    擷取端與建構端同採 X → Y → Z 套用順序，非 gimbal lock 下
+    與 create_transform_matrix / create_transform_matrices_batch
+    互為反函數（角度正規化到主值域，gimbal lock 時約定 rz = 0）。
+
+    Returns:
+        Tuple: (translation, rotation_euler_deg, scale)
+    """
+    translation = [matrix[3][0], matrix[3][1], matrix[3][2]]
+
+    arr = np.array(
+        [[matrix[i][j] for j in range(3)] for i in range(3)],
+        dtype=np.float64,
+    )
+    scale_arr = np.linalg.norm(arr, axis=1)
+
+    # row-vector 慣例下上 3x3 = diag(s) @ R.T；轉回
+    # column-convention 的 R = Rz @ Ry @ Rx 後擷取
+    rot = (arr / scale_arr[:, None]).T
+    if abs(rot[2, 0]) < 1.0 - 1e-9:
+        ry = math.asin(-rot[2, 0])
+        rx = math.atan2(rot[2, 1], rot[2, 2])
+        rz = math.atan2(rot[1, 0], rot[0, 0])
+    else:
+        # gimbal lock：ry = ±90°，rx/rz 耦合，約定 rz = 0
+        ry = math.copysign(math.pi / 2, -rot[2, 0])
+        rx = math.atan2(-rot[1, 2], rot[1, 1])
+        rz = 0.0
+
+    rotation = [math.degrees(rx), math.degrees(ry), math.degrees(rz)]
+    return translation, rotation, scale_arr.tolist()
+
+
+def transform_points(
+    points: "np.ndarray", matrix: Gf.Matrix4d
+) -> "np.ndarray":
+    """
+    批量以變換矩陣轉換點陣列
+
+    4x4 矩陣先一次性擷取為 NumPy 陣列，整個 (N,3) 以單一
+    矩陣乘法（BLAS）轉換；不逐點走 Gf.Vec3d + matrix.Transform
+    的 pybind 往返。仿射矩陣走 3x3 乘法 + 平移的快路徑，
+    投影矩陣（最後一行非 [0,0,0,1]）退回完整齊次除法。
+
+    Args:
+        points: 點陣列，shape (N,3)
+        matrix: 4x4 變換矩陣（row-vector 慣例）
+
+    Returns:
+        np.ndarray: 轉換後的點陣列，shape (N,3)，dtype float64
+    """
+    points = np.asarray(points, dtype=np.float64)
+    m = np.array(
+        [[matrix[i][j] for j in range(4)] for i in range(4)],
+        dtype=np.float64,
+    )
+    # row-vector 慣例：p' = p @ M，上 3x3 在 m[:3,:3]、平移在
+    # 第 3 列；仿射時最後一行為 [0,0,0,1]
+    if (
+        m[0, 3] == 0.0
+        and m[1, 3] == 0.0
+        and m[2, 3] == 0.0
+        and m[3, 3] == 1.0
+    ):
+        return points @ m[:3, :3] + m[3, :3]
+
+    homogeneous = np.empty((points.shape[0], 4), dtype=np.float64)
+    homogeneous[:, :3] = points
+    homogeneous[:, 3] = 1.0
+    transformed = homogeneous @ m
+    return transformed[:, :3] / transformed[:, 3:]
+
+
+def transform_point(
+    point: Sequence[float], matrix: Gf.Matrix4d
+) -> List[float]:
+    """
+    以變換矩陣轉換單一點（transform_points 的薄包裝）
+
+    Args:
+        point: [x, y, z]
+        matrix: 4x4 變換矩陣
+
+    Returns:
+        List[float]: 轉換後的 [x, y, z]
+    """
+    transformed = transform_points(
+        np.asarray(point, dtype=np.float64).reshape(1, 3), matrix
+    )
+    return transformed[0].tolist()
+
+
+def get_stage_up_axis(stage: Usd.Stage) -> str:
+    """
+    獲取 Stage 的上軸
+
+    Args:
+        stage: 目標 Stage
+
+    Returns:
+        str: "Y" 或 "Z"
+    """
+    if UsdGeom.GetStageUpAxis(stage) == _TOKEN_Y:
+        return "Y"
+    return "Z"
+
+
+def set_prim_transform(
+    prim: Usd.Prim,
+    translation: Sequence[float] = (0.0, 0.0, 0.0),
+    rotation: Sequence[float] = (0.0, 0.0, 0.0),
+    scale: Sequence[float] = (1.0, 1.0, 1.0),
+):
+    """
+    設定 Prim 的變換（translate / rotate / scale op）
+
+    既有的 xformOp 順序與本次需求一致時，直接對現有 op
+    呼叫 `.Set()` 重用；動畫 bake 等每幀重設同一批 prim 的
+    熱路徑免去 ClearXformOpOrder + 重建 op 的結構性編輯。
+
+    旋轉有兩軸以上非零時 authoring 單一 RotateXYZ 複合 op
+    （一次 pybind、layer 中一個 op），恰一軸非零時走單軸 op
+    快路徑，全零時不產生旋轉 op。
+
+    Args:
+        prim: 目標 Prim
+        translation: 平移 [x, y, z]
+        rotation: Euler 旋轉角（度，XYZ 順序）
+        scale: 縮放 [x, y, z]
+    """
+    xformable = UsdGeom.Xformable(prim)
+    wanted = [(_OP_TRANSLATE, Gf.Vec3d(*translation))]
+    nonzero_axes = sum(1 for angle in rotation if angle != 0.0)
+    if nonzero_axes >= 2:
+        # 複合 op 的套用順序為 X → Y → Z，與逐軸
+        # RotateZ/RotateY/RotateX op 序列等價
+        wanted.append((_OP_ROTATE_XYZ, Gf.Vec3f(*rotation)))
+    elif nonzero_axes == 1:
+        if rotation[2] != 0.0:
+            wanted.append((_OP_ROTATE_Z, rotation[2]))
+        elif rotation[1] != 0.0:
+            wanted.append((_OP_ROTATE_Y, rotation[1]))
+        else:
+            wanted.append((_OP_ROTATE_X, rotation[0]))
+    wanted.append((_OP_SCALE, Gf.Vec3f(*scale)))
+
+    existing = xformable.GetOrderedXformOps()
+    if len(existing) == len(wanted) and all(
+        op.GetOpType() == op_type
+        for op, (op_type, _) in zip(existing, wanted)
+    ):
+        for op, (_, value) in zip(existing, wanted):
+            op.Set(value)
+        return
+
+    xformable.ClearXformOpOrder()
+    for op_type, value in wanted:
+        if op_type is _OP_TRANSLATE:
+            xformable.AddTranslateOp().Set(value)
+        elif op_type is _OP_ROTATE_XYZ:
+            xformable.AddRotateXYZOp().Set(value)
+        elif op_type is _OP_ROTATE_Z:
+            xformable.AddRotateZOp().Set(value)
+        elif op_type is _OP_ROTATE_Y:
+            xformable.AddRotateYOp().Set(value)
+        elif op_type is _OP_ROTATE_X:
+            xformable.AddRotateXOp().Set(value)
+        else:
+            xformable.AddScaleOp().Set(value)
+
+
+def get_prim_transform(prim: Usd.Prim) -> Gf.Matrix4d:
+    """
+    獲取 Prim 的局部變換矩陣
+
+    Args:
+        prim: 目標 Prim
+
+    Returns:
+        Gf.Matrix4d: 局部變換矩陣
+    """
+    # GetLocalTransformation 的 Python 綁定直接返回 Gf.Matrix4d
+    return UsdGeom.Xformable(prim).GetLocalTransformation()
+
+
+# XformCache 攤銷祖先鏈的矩陣組合，但每次呼叫都新建等於
+# 放棄攤銷；以 thread-local 單例跨呼叫重用（cache 非
+# thread-safe，不得跨執行緒共用）
+_tls = threading.local()
+
+
+def _thread_xform_cache() -> UsdGeom.XformCache:
+    cache = getattr(_tls, "xform_cache", None)
+    if cache is None:
+        cache = UsdGeom.XformCache()
+        _tls.xform_cache = cache
+    return cache
+
+
+def clear_xform_cache():
+    """
+    清空當前執行緒的共享 XformCache
+
+    編輯 stage 變換後（或切換 stage）呼叫，避免後續
+    get_prim_world_transform 讀到過期的矩陣。
+    """
+    cache = getattr(_tls, "xform_cache", None)
+    if cache is not None:
+        cache.Clear()
+
+
+def get_prim_world_transform(
+    prim: Usd.Prim, cache: Optional[UsdGeom.XformCache] = None
+) -> Gf.Matrix4d:
+    """
+    獲取 Prim 的世界變換矩陣
+
+    預設使用 thread-local 的共享 XformCache，跨呼叫重用已
+    組合的祖先矩陣；對同一子樹批量查詢時只計算共同祖先一次。
+    呼叫端也可傳入自管的 cache（例如每個遍歷一個）。
+
+    Args:
+        prim: 目標 Prim
+        cache: 選配的 XformCache（None 時用 thread-local 單例）
+
+    Returns:
+        Gf.Matrix4d: 世界變換矩陣
+    """
+    if cache is None:
+        cache = _thread_xform_cache()
+    return cache.GetLocalToWorldTransform(prim)
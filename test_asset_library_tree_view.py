@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# test_asset_library_tree_view.py
+
+"""
+資產庫樹狀檢視測試
+
+載入 IADL 資產庫與 FDL 佈局後，以「資產類型 → 實例 → Tag」
+的樹狀結構列印資產庫檢視（模擬 IADL Designer 的樹狀面板）。
+
+    python test_asset_library_tree_view.py
+"""
+
+from operator import attrgetter
+
+from tests._paths import FDL_FILE, IADL_DIR
+
+from core.eventbus.inmem import InMemoryEventBus  # noqa: E402
+from core.runtime.ndh_service import NDHService  # noqa: E402
+
+
+def print_asset_tree(ndh_service: NDHService):
+    """
+    以樹狀結構列印資產庫（類型 → 實例 → Tag）
+
+    Args:
+        ndh_service: 已生成 Servant 的 NDH 服務
+    """
+    # 屬性鏈以 C 實作的 attrgetter 於迴圈外綁定一次
+    get_display = attrgetter("tag_definition.display")
+    # 分組檢視由 NDHService 快取（重繪不重建分組、不重排序）
+    for asset_name, servants in ndh_service.iter_asset_types():
+        # 每組的 Tag 總數計算一次，不逐實例重算
+        total_tags = sum(len(s.get_all_tag_servants()) for s in servants)
+        print(f"📦 {asset_name}（{len(servants)} 個實例，{total_tags} 個 Tag）")
+        for servant in servants:
+            # TagServant 列表單次取得並重用：len、切片與
+            # 「還有更多」判斷共用同一個綁定
+            tags = servant.get_all_tag_servants()
+            tag_count = len(tags)
+            print(f"  └─ {servant.instance.instance_id}（{tag_count} 個 Tag）")
+            for tag_servant in tags[:3]:
+                # display 於 Tag 建構期渲染一次
+                print(f"      • {get_display(tag_servant)}")
+            if tag_count > 3:
+                print(f"      … 另有 {tag_count - 3} 個 Tag")
+
+
+def main():
+    print("=== 資產庫樹狀檢視測試 ===\n")
+
+    event_bus = InMemoryEventBus()
+    event_bus.start()
+
+    ndh_service = NDHService(event_bus=event_bus)
+
+    asset_count = ndh_service.load_iadl_assets(IADL_DIR)
+    print(f"載入 IADL 資產定義: {asset_count} 個")
+
+    ndh_service.load_fdl_from_file(FDL_FILE)
+    servant_count = ndh_service.generate_servants()
+    print(f"生成 Asset Servant: {servant_count} 個\n")
+
+    print_asset_tree(ndh_service)
+
+    print(
+        f"\n總計: {len(ndh_service.asset_servants)} 個實例, "
+        f"{ndh_service.tag_servant_count} 個 Tag"
+    )
+    event_bus.stop()
+
+
+if __name__ == "__main__":
+    main()
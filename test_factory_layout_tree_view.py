@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# test_factory_layout_tree_view.py
+
+"""
+工廠佈局樹狀檢視測試
+
+載入 FDL 後以「廠區 → 區域 → 實例」的樹狀結構列印佈局
+（模擬 FDL Designer 的樹狀面板，每區域只展開前 3 個實例）。
+
+    python test_factory_layout_tree_view.py
+"""
+
+import io
+import sys
+from itertools import islice
+
+from tests._paths import FDL_FILE
+
+from core.fdl.parser import parse_fdl_file  # noqa: E402
+
+
+def print_tree_structure(fdl, out=None):
+    """
+    以樹狀結構列印工廠佈局（每區域只展開前 3 個實例）
+
+    格式化工作與顯示深度綁定：被截斷的實例不產出 Transform
+    字串，長度與彙總計數只計算一次，整體成本為
+    O(區域數 × 3) 而非 O(實例總數)。
+
+    整棵樹先寫入 StringIO，最後單次 sys.stdout.write 送出：
+    行緩衝 stdout 下 syscall 自 O(行數) 降為 O(1)。
+
+    Args:
+        fdl: 已解析的 FDL
+        out: 輸出 writer（預設 StringIO 緩衝後一次寫 stdout）
+    """
+    buf = out or io.StringIO()
+    write = buf.write
+
+    site = fdl.site
+    write(f"🏭 {site.name}（{site.site_id}）\n")
+    if site.location is not None:
+        write(
+            f"   位置: ({site.location.latitude}, "
+            f"{site.location.longitude})\n"
+        )
+
+    for area in site.areas:
+        instances = area.instances
+        instance_count = len(instances)
+        write(
+            f"  📁 {area.name} [{area.type}] — "
+            f"{instance_count} 個實例, {len(area.connections)} 個連接\n"
+        )
+        # 只具現前 3 個實例的顯示列；隱藏實例不做任何格式化
+        for instance in islice(instances, 3):
+            write(f"    └─ {instance.instance_id} ← {instance.ref_asset}\n")
+            transform = instance.transform
+            write(
+                f"        T={transform.translation} "
+                f"R={transform.rotation} S={transform.scale}\n"
+            )
+        if instance_count > 3:
+            write(f"    … 另有 {instance_count - 3} 個實例\n")
+
+    # 彙總計數為 Site 上的 cached_property，不重走區域列表
+    write(
+        f"\n總計: {len(site.areas)} 個區域, "
+        f"{site.total_instances} 個實例, "
+        f"{site.total_connections} 個連接\n"
+    )
+
+    if out is None:
+        sys.stdout.write(buf.getvalue())
+
+
+def main():
+    print("=== 工廠佈局樹狀檢視測試 ===\n")
+    fdl = parse_fdl_file(FDL_FILE)
+    print(f"FDL 版本: {fdl.fdl_version}")
+    print(f"單位: {fdl.units.get('length')}, 上軸 {fdl.units.get('up_axis')}\n")
+    print_tree_structure(fdl)
+    print("\n✓ 佈局樹狀檢視完成")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# test_ndh_integration.py
+
+"""
+NDH 整合測試
+
+IADL 載入 → FDL 載入 → Servant 生成 → 事件流 → TSDB 寫入
+的端到端流程驗證。
+
+    python test_ndh_integration.py
+"""
+
+from collections import Counter, deque
+
+from tests._paths import FDL_FILE, IADL_DIR
+
+from core.eventbus.inmem import InMemoryEventBus  # noqa: E402
+from core.runtime.ndh_service import NDHService  # noqa: E402
+from core.tsdb.sqlite_tsdb import SQLiteTSDB  # noqa: E402
+
+
+def main():
+    print("=== NDH 整合測試 ===\n")
+
+    # 訂閱者只做 O(1) 的 deque append——逐事件 print 會讓
+    # start_all_servants 的發布風暴變成 stdout I/O bound；
+    # 彙總輸出延後到步驟結尾一次完成
+    events_log = deque(maxlen=1000)
+
+    def on_event(event):
+        events_log.append((event.event_type, event.source))
+
+    print("[1] 建立 Event Bus")
+    event_bus = InMemoryEventBus()
+    event_bus.start()
+    event_bus.subscribe("*", on_event)
+
+    print("[2] 建立 TSDB（:memory:）")
+    tsdb = SQLiteTSDB(":memory:")
+
+    print("[3] 載入 IADL 資產庫")
+    ndh_service = NDHService(event_bus=event_bus, tsdb=tsdb)
+    asset_count = ndh_service.load_iadl_assets(IADL_DIR)
+    print(f"    載入 {asset_count} 個資產定義")
+
+    print("[4] 載入 FDL 佈局")
+    fdl = ndh_service.load_fdl_from_file(FDL_FILE)
+    print(f"    廠區: {fdl.site.name}")
+
+    print("[5] 生成並啟動 Servant")
+    servant_count = ndh_service.generate_servants()
+    ndh_service.start_all_servants()
+    # 確定性屏障：等非同步代理派發完畢（而非猜一個 sleep 時長）
+    ndh_service.event_bus.drain()
+    print(
+        f"    {servant_count} 個 AssetServant, "
+        f"{ndh_service.tag_servant_count} 個 TagServant"
+    )
+
+    print("[6] 模擬 Tag 值更新")
+    # 取插入序第一個 servant：next(iter(...)) 為 O(1)，
+    # 不為取首項把整個 values 檢視具現成 list
+    if ndh_service.asset_servants:
+        first_servant = next(iter(ndh_service.asset_servants.values()))
+        for i, tag_servant in enumerate(first_servant.get_all_tag_servants()):
+            tag_servant.update_value(20.0 + i)
+            tag_servant.update_value(21.5 + i)
+    ndh_service.event_bus.drain()
+    ndh_service.write_buffer.flush()
+
+    print("[7] 停止所有 Servant")
+    ndh_service.stop_all_servants()
+
+    type_counts = Counter(event_type for event_type, _ in events_log)
+    print("\n--- 事件彙總 ---")
+    for event_type, count in sorted(type_counts.items()):
+        print(f"  {event_type}: {count}")
+    print(f"  共 {sum(type_counts.values())} 個事件")
+
+    tsdb.close()
+    event_bus.stop()
+    print("\n✓ 整合測試完成")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# test_ndh_with_queue.py
+
+"""
+NDH + SQLite 佇列整合測試
+
+在 NDH 整合流程之上，將事件同步推入 SQLite 持久化佇列，
+模擬外部系統（SCADA gateway 等）經佇列消費 NDH 事件。
+
+    python test_ndh_with_queue.py
+"""
+
+from collections import Counter, deque
+
+from tests._paths import FDL_FILE, IADL_DIR
+
+from core.eventbus.inmem import InMemoryEventBus  # noqa: E402
+from core.eventbus.sqlite_queue import SQLiteQueueManager  # noqa: E402
+from core.runtime.ndh_service import NDHService  # noqa: E402
+
+
+def main():
+    print("=== NDH + SQLite 佇列整合測試 ===\n")
+
+    print("[1] 建立佇列管理器（:memory:）")
+    queue_manager = SQLiteQueueManager(":memory:")
+    event_queue = queue_manager.get_queue("ndh_events")
+
+    # 訂閱者推入佇列 + deque append，不做逐事件 print
+    # （發布風暴下 stdout 才是瓶頸）；輸出延後到彙總一次完成
+    events_log = deque(maxlen=1000)
+
+    def on_event(event):
+        event_queue.put(event.to_dict())
+        events_log.append((event.event_type, event.source))
+
+    print("[2] 建立 Event Bus 並訂閱")
+    event_bus = InMemoryEventBus()
+    event_bus.start()
+    event_bus.subscribe("*", on_event)
+
+    print("[3] 載入 IADL / FDL")
+    ndh_service = NDHService(event_bus=event_bus)
+    asset_count = ndh_service.load_iadl_assets(IADL_DIR)
+    ndh_service.load_fdl_from_file(FDL_FILE)
+    print(f"    載入 {asset_count} 個資產定義")
+
+    print("[4] 生成 Servant")
+    servant_count = ndh_service.generate_servants()
+    print(f"    {servant_count} 個 AssetServant")
+
+    print("[5] 啟動所有 Servant（TagCreated 發布風暴）")
+    ndh_service.start_all_servants()
+    # 確定性屏障：等非同步代理派發完畢（而非猜一個 sleep 時長）
+    ndh_service.event_bus.drain()
+
+    print("[6] 自佇列消費事件")
+    # 單一交易取空，不做逐訊息的 size/get 輪詢
+    events_from_queue = event_queue.drain()
+    print(f"    消費 {len(events_from_queue)} 個事件")
+
+    print("[7] 佇列獨立 put/get 驗證")
+    for i in range(10):
+        test_queue = queue_manager.get_queue("test_queue")
+        test_queue.put({"seq": i, "value": i * 1.5})
+    retrieved = test_queue.drain()
+    assert [m["seq"] for m in retrieved] == list(range(10)), "FIFO 順序錯誤"
+    print(f"    放入 10、取回 {len(retrieved)}，順序正確")
+
+    print("[8] 停止所有 Servant")
+    ndh_service.stop_all_servants()
+
+    type_counts = Counter(event_type for event_type, _ in events_log)
+    print("\n--- 事件彙總 ---")
+    for event_type, count in sorted(type_counts.items()):
+        print(f"  {event_type}: {count}")
+
+    queue_manager.close()
+    event_bus.stop()
+    print("\n✓ 佇列整合測試完成")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# test_realtime_tag_monitor.py
+
+"""
+即時 Tag 監控測試
+
+啟動 NDH 後模擬數輪 Tag 值更新，再自 TSDB 查回最近 5 秒
+的數據，驗證「更新 → 批量寫入 → 範圍查詢」的即時監控路徑。
+
+    python test_realtime_tag_monitor.py
+"""
+
+import time
+
+from tests._paths import FDL_FILE, IADL_DIR
+
+from core.eventbus.inmem import InMemoryEventBus  # noqa: E402
+from core.runtime.ndh_service import NDHService  # noqa: E402
+from core.tsdb.sqlite_tsdb import SQLiteTSDB  # noqa: E402
+
+
+def main():
+    print("=== 即時 Tag 監控測試 ===\n")
+
+    print("[1] 建立 Event Bus 與 TSDB")
+    event_bus = InMemoryEventBus()
+    event_bus.start()
+    # :memory: 資料庫：監控路徑驗證不需要落盤持久化，
+    # 免除每筆交易的 fsync 成本，也不在工作目錄留下 .db 檔
+    tsdb = SQLiteTSDB(":memory:")
+
+    print("[2] 載入 IADL / FDL")
+    ndh_service = NDHService(event_bus=event_bus, tsdb=tsdb)
+    ndh_service.load_iadl_assets(IADL_DIR)
+    ndh_service.load_fdl_from_file(FDL_FILE)
+
+    print("[3] 生成並啟動 Servant")
+    ndh_service.generate_servants()
+    ndh_service.start_all_servants()
+
+    print("[4] 監控前 10 個 Tag")
+    monitored_tags = ndh_service.get_all_tag_servants()[:10]
+
+    print("[5] 模擬 5 輪值更新")
+    for round_no in range(5):
+        for i, tag_servant in enumerate(monitored_tags):
+            tag_servant.update_value(50.0 + round_no + i * 0.1)
+    # 確定性沖刷寫入緩衝（而非 time.sleep(2) 等背景 flusher）：
+    # TSDB 寫入走 executemany + 單一交易，此處只等一次 fsync
+    ndh_service.write_buffer.flush()
+
+    print("[6] 查詢最近 5 秒的數據\n")
+    # 10 個 Tag 以單一 IN 查詢批量取回（1 次 SQL 往返），
+    # 迴圈內只剩 dict 查找；ID 直接取 servant 建構期組好的
+    # tag_instance_id，不重新格式化
+    tag_ids = [ts.tag_instance_id for ts in monitored_tags]
+    # 時間邊界以 epoch 秒 float 一次算好：TSDB 原生收 float，
+    # 不經 datetime 物件配置與 ISO 字串解析
+    now = time.time()
+    results = tsdb.query_tag_values_multi(tag_ids, now - 5.0, now)
+    for tag_servant, tag_id in zip(monitored_tags, tag_ids):
+        values = results[tag_id]
+        latest = values[-1].value if values else None
+        print(
+            f"  {tag_servant.tag_definition.name:<22}"
+            f"{len(values):>3} 筆, 最新值 = {latest}"
+        )
+
+    print("\n[7] 停止")
+    ndh_service.stop_all_servants()
+    tsdb.close()
+    event_bus.stop()
+    print("\n✓ 即時監控測試完成")
+
+
+if __name__ == "__main__":
+    main()
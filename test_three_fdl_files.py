@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# test_three_fdl_files.py
+
+"""
+三份 FDL 佈局測試
+
+對三個測試廠區（半導體廠、數據中心、LNG 電廠）各跑一次
+「IADL 載入 → FDL 載入 → Servant 生成 → 檢視」流程。
+三個工作單元彼此獨立（各自的 Event Bus / TSDB / NDH），
+以行程池平行執行；各工作者輸出先捕捉，完成後依序列印。
+
+    python test_three_fdl_files.py [--quiet]
+"""
+
+import argparse
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from operator import attrgetter
+
+from tests._paths import FDL_DIR, IADL_DIR
+
+from core.eventbus.inmem import InMemoryEventBus  # noqa: E402
+from core.fdl.flat import build_flat  # noqa: E402
+from core.runtime.asset_library_svc import AssetLibrary  # noqa: E402
+from core.runtime.ndh_service import NDHService  # noqa: E402
+from core.tsdb.sqlite_tsdb import SQLiteTSDB  # noqa: E402
+
+
+# 測試夾具路徑於模組載入期組好一次（每個 `/` 都配置並正規化
+# 一個新 Path，不在 main 內重算）
+_FDL_FILES = tuple(
+    FDL_DIR / name
+    for name in (
+        "semiconductor_fab.yaml",
+        "data_center.yaml",
+        "lng_power_plant.yaml",
+    )
+)
+
+# 重複列的格式模板於模組層綁定一次（.format 為 C 層呼叫，
+# 多行合併為單一 append，逐列位元組碼更短）
+_AREA_HEAD = (
+    "  • {name} ({type})\n"
+    "    - Area ID: {aid}\n"
+    "    - Instances: {ni}\n"
+    "    - Connections: {nc}"
+).format
+_INSTANCE_ROW = (
+    "      · {iid} ← {ref}\n"
+    "        Transform: T={t}"
+).format
+
+
+def test_asset_library_view(ndh_service):
+    """
+    資產庫檢視（類型 → 實例）
+
+    Args:
+        ndh_service: 已生成 Servant 的 NDH 服務
+    """
+    # 輸出行累積在 list，最後單次 join + write：每行一次
+    # print 的 stdout 鎖取得與 flush 在千級 Tag 下是主要成本
+    out = ["\n--- 資產庫檢視 ---"]
+    append = out.append
+    # 屬性鏈以 C 實作的 attrgetter 於迴圈外綁定一次
+    get_type_name = attrgetter("asset_definition.name")
+    get_instance_id = attrgetter("instance.instance_id")
+    # 平面 dict + 區域綁定的 get：分組此種「建一次、讀一次」
+    # 的模式下比 defaultdict 的 __missing__ 派發快
+    groups = {}
+    get = groups.get
+    for servant in ndh_service.asset_servants.values():
+        name = get_type_name(servant)
+        lst = get(name)
+        if lst is None:
+            groups[name] = lst = []
+        lst.append(servant)
+    # dict 保留插入順序：依首見順序輸出即具決定性，
+    # 不再為列印付 O(N log N) 的排序
+    for asset_name, servants in groups.items():
+        append(f"  • {asset_name}: {len(servants)} 個實例")
+        for servant in servants:
+            append(
+                f"    - {get_instance_id(servant)}"
+                f"（{servant.tag_servant_count} 個 Tag）"
+            )
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def test_factory_layout_view(fdl):
+    """
+    佈局檢視（區域 → 實例摘要）
+
+    Args:
+        fdl: 已解析的 FDL
+    """
+    # 屬性鏈提升為區域變數：fdl.site 解析一次
+    site = fdl.site
+    # 列印迴圈走 CSR 式扁平陣列（循序掃描），
+    # 不在 dataclass 樹上逐物件追逐指標
+    flat = build_flat(fdl)
+    offsets = flat.area_instance_offsets
+    instance_ids = flat.instance_ids
+    ref_assets = flat.instance_ref_assets
+    translations = flat.instance_translation
+    out = ["\n--- 佈局檢視 ---", f"  廠區: {site.name} ({site.site_id})"]
+    append = out.append
+    for a in range(len(flat.area_names)):
+        start = int(offsets[a])
+        ni = int(offsets[a + 1]) - start
+        append(
+            _AREA_HEAD(
+                name=flat.area_names[a],
+                type=flat.area_types[a],
+                aid=flat.area_ids[a],
+                ni=ni,
+                nc=int(flat.area_connection_counts[a]),
+            )
+        )
+        for i in range(start, start + min(ni, 2)):
+            append(
+                _INSTANCE_ROW(
+                    iid=instance_ids[i],
+                    ref=ref_assets[i],
+                    t=translations[i].tolist(),
+                )
+            )
+        if ni > 2:
+            append(f"      … 另有 {ni - 2} 個實例")
+    # 彙總計數為 Site 上的 cached_property，與列印迴圈解耦
+    append(
+        f"  總計: {site.total_instances} 個實例, "
+        f"{site.total_connections} 個連接"
+    )
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _run_fdl(ndh_service, fdl_file, quiet):
+    """
+    於已備妥的 NDH 服務上跑單一 FDL（reset → load → generate → 檢視）
+
+    Args:
+        ndh_service: 已載入資產庫的 NDH 服務
+        fdl_file: FDL 文件路徑
+        quiet: 是否略過檢視輸出
+    """
+    ndh_service.reset_fdl()
+    fdl = ndh_service.load_fdl_from_file(fdl_file)
+    servant_count = ndh_service.generate_servants()
+    print(
+        f"  生成 {servant_count} 個 AssetServant, "
+        f"{ndh_service.tag_servant_count} 個 TagServant"
+    )
+
+    # 檢視輸出純為診斷用；CI / 重定向下 print 開銷遠大於
+    # 被測邏輯，--quiet 模式整段跳過，摘要不受影響
+    if not quiet:
+        test_asset_library_view(ndh_service)
+        test_factory_layout_view(fdl)
+
+    ndh_service.stop_all_servants()
+
+
+def test_single_fdl(fdl_file, iadl_dir, asset_library=None, quiet=False):
+    """
+    單一 FDL 的載入與檢視流程
+
+    以子行程執行：參數皆可 pickle，stdout 於行程內捕捉成
+    字串回傳，由 main 依序輸出以保持可讀性。
+
+    Args:
+        fdl_file: FDL 文件路徑
+        iadl_dir: IADL 目錄路徑
+        asset_library: 預先載入的資產庫（None 時自 iadl_dir 載入）
+        quiet: 是否略過逐實例的檢視輸出，只留載入/生成摘要
+
+    Returns:
+        str: 此 FDL 流程的完整輸出
+    """
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        print(f"=== {fdl_file.name} ===")
+        event_bus = InMemoryEventBus()
+        event_bus.start()
+        # 共享 in-memory TSDB：同行程內重複建構時 schema 只建一次
+        tsdb = SQLiteTSDB.shared_memory("fdl_test")
+        ndh_service = NDHService(event_bus=event_bus, tsdb=tsdb)
+
+        if asset_library is not None:
+            # 共用 main 已載入的資產庫：每個 FDL 不再重讀
+            # 整個 IADL 目錄（pickle 傳遞比重新解析便宜）
+            ndh_service.asset_library = asset_library
+            asset_count = len(asset_library)
+        else:
+            asset_count = ndh_service.load_iadl_assets(iadl_dir)
+        print(f"  載入 {asset_count} 個資產定義")
+
+        _run_fdl(ndh_service, fdl_file, quiet)
+        tsdb.close()
+        event_bus.stop()
+    return buf.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="三份 FDL 佈局測試")
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        default=bool(os.environ.get("FDL_TEST_QUIET")),
+        help="略過逐實例檢視輸出，只留摘要（亦可設 FDL_TEST_QUIET）",
+    )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="單行程依序執行，重用同一個 NDH 服務（reset_fdl）",
+    )
+    args = parser.parse_args()
+
+    print("=== 三份 FDL 佈局測試 ===\n")
+
+    fdl_files = [f for f in _FDL_FILES if f.exists()]
+
+    # IADL 只在 main 載入一次，各工作者共用同一份資產庫
+    asset_library = AssetLibrary()
+    asset_library.load_directory(IADL_DIR)
+
+    if args.serial:
+        # 序列模式：一組 bus/TSDB/NDH 服務跑完三份 FDL，
+        # 每份之間只 reset_fdl，不重付連線與服務建構成本
+        event_bus = InMemoryEventBus()
+        event_bus.start()
+        tsdb = SQLiteTSDB.shared_memory("fdl_test")
+        ndh_service = NDHService(event_bus=event_bus, tsdb=tsdb)
+        ndh_service.asset_library = asset_library
+        outputs = []
+        for fdl_file in fdl_files:
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                print(f"=== {fdl_file.name} ===")
+                print(f"  載入 {len(asset_library)} 個資產定義")
+                _run_fdl(ndh_service, fdl_file, args.quiet)
+            outputs.append(buf.getvalue())
+        tsdb.close()
+        event_bus.stop()
+    else:
+        # 三個工作單元無共享可變狀態，行程池平行跑滿多核；
+        # ex.map 保持提交順序，輸出仍依文件序列印
+        n = len(fdl_files)
+        with ProcessPoolExecutor(max_workers=n) as ex:
+            outputs = list(
+                ex.map(
+                    test_single_fdl,
+                    fdl_files,
+                    [IADL_DIR] * n,
+                    [asset_library] * n,
+                    [args.quiet] * n,
+                )
+            )
+    for output in outputs:
+        print(output)
+
+    print(f"✓ {len(outputs)} 份 FDL 測試完成")
+
+
+if __name__ == "__main__":
+    main()
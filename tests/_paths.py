@@ -0,0 +1,22 @@
+# tests/_paths.py
+
+"""
+測試共用路徑常數
+
+src 路徑插入與測試夾具路徑於模組載入期計算一次，供所有
+測試/示範腳本匯入；不再每個腳本重複 Path 運算，也不在
+sys.path 堆疊重複的 src 項（重複項會放大後續 import 掃描）。
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT / "src"
+IADL_DIR = ROOT / "testfiles" / "IADL"
+FDL_DIR = ROOT / "testfiles" / "FDL"
+FDL_FILE = FDL_DIR / "semiconductor_fab.yaml"
+
+_src = str(SRC_DIR)
+if _src not in sys.path:
+    sys.path.insert(0, _src)
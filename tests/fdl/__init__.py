@@ -0,0 +1 @@
+# tests/fdl/__init__.py
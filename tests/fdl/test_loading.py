@@ -0,0 +1,62 @@
+# tests/fdl/test_loading.py
+
+"""
+FDL 載入測試
+
+對三份測試佈局逐一執行 parse_fdl_file，驗證站點結構
+與實例/連接計數完整解析。
+"""
+
+import pytest
+
+from tests._paths import FDL_DIR
+
+from core.fdl.flat import build_flat  # noqa: E402
+from core.fdl.parser import parse_fdl_file  # noqa: E402
+from core.fdl.validator import parse_and_validate_fdl_file  # noqa: E402
+
+# 夾具路徑於模組載入期組好一次，兩組參數化測試共用
+_FDL_FILES = tuple(
+    FDL_DIR / name
+    for name in (
+        "semiconductor_fab.yaml",
+        "data_center.yaml",
+        "lng_power_plant.yaml",
+    )
+)
+_FDL_IDS = [f.name for f in _FDL_FILES]
+
+
+@pytest.mark.parametrize("fdl_file", _FDL_FILES, ids=_FDL_IDS)
+def test_load_fdl_file(fdl_file):
+    fdl = parse_fdl_file(fdl_file, use_cache=False)
+    site = fdl.site
+    assert fdl.fdl_version == "0.1"
+    assert site.site_id
+    assert site.areas
+    assert site.total_instances > 0
+
+
+@pytest.mark.parametrize("fdl_file", _FDL_FILES, ids=_FDL_IDS)
+def test_parse_and_validate_fdl_file(fdl_file):
+    fdl, errors = parse_and_validate_fdl_file(fdl_file, use_cache=False)
+    assert errors == []
+    assert fdl.site.total_instances > 0
+
+
+def test_build_flat_matches_tree():
+    fdl = parse_fdl_file(_FDL_FILES[0], use_cache=False)
+    flat = build_flat(fdl)
+    site = fdl.site
+    assert len(flat.area_names) == len(site.areas)
+    assert flat.area_instance_offsets[-1] == site.total_instances
+    assert len(flat.instance_ids) == site.total_instances
+    # 同一 FDL 物件的扁平檢視為快取共用
+    assert build_flat(fdl) is flat
+    # 區段切片與樹狀走訪一致
+    for a, area in enumerate(site.areas):
+        start = int(flat.area_instance_offsets[a])
+        end = int(flat.area_instance_offsets[a + 1])
+        assert flat.instance_ids[start:end] == [
+            i.instance_id for i in area.instances
+        ]
@@ -0,0 +1,30 @@
+# tools/fbx2usd_proxy/_blender_driver.py
+
+"""
+在 Blender 內執行的轉換 driver
+
+由 convert.py 以 `blender --background --python _blender_driver.py
+-- <pairs_json>` 啟動；自 `--` 之後的 argv 取 (fbx, usd) 對列表，
+每對之間重置場景，同一行程內循環轉換。
+
+以實體文件（而非每次轉換寫入的暫存腳本）發佈：免去每次呼叫
+的 temp-file 寫入/刪除，且 Blender 可重用編譯後的 .pyc。
+"""
+
+import json
+import sys
+
+import bpy  # noqa: F401  （僅 Blender 內可用）
+
+
+def main():
+    args = sys.argv[sys.argv.index("--") + 1 :]
+    pairs = json.loads(args[0])
+    for fbx_path, usd_path in pairs:
+        bpy.ops.wm.read_homefile(use_empty=True)
+        bpy.ops.import_scene.fbx(filepath=fbx_path)
+        bpy.ops.wm.usd_export(filepath=usd_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# tools/fbx2usd_proxy/convert.py
+
+"""
+FBX → USD 轉換代理（經 Blender headless）
+
+批量轉換以單次 Blender 行程處理全部文件：Blender 啟動成本
+（~2-3 秒）只付一次，由 driver 腳本在行程內循環
+import FBX → export USD；單檔 API 為批量路徑的 N=1 包裝。
+
+    python tools/fbx2usd_proxy/convert.py model.fbx model.usdc
+"""
+
+import argparse
+import json
+import subprocess
+from pathlib import Path
+from typing import List, Tuple
+
+# driver 以實體文件發佈（見 _blender_driver.py），路徑於
+# import 期解析一次；免去每次呼叫的暫存腳本寫入/刪除
+_DRIVER_PATH = Path(__file__).resolve().parent / "_blender_driver.py"
+
+
+def convert_fbx_to_usd_batch(
+    pairs: List[Tuple[str, str]], blender_exe: str = "blender"
+) -> int:
+    """
+    批量轉換 FBX 文件為 USD
+
+    Args:
+        pairs: (fbx_path, usd_path) 對列表
+        blender_exe: Blender 可執行文件路徑
+
+    Returns:
+        int: 成功轉換的文件數（Blender 行程失敗時為 0）
+    """
+    if not pairs:
+        return 0
+
+    result = subprocess.run(
+        [
+            blender_exe,
+            "--background",
+            "--python",
+            str(_DRIVER_PATH),
+            "--",
+            json.dumps([[str(fbx), str(usd)] for fbx, usd in pairs]),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(f"[fbx2usd] Blender 轉換失敗:\n{result.stderr}")
+        return 0
+    return len(pairs)
+
+
+def convert_fbx_to_usd(
+    fbx_path: str, usd_path: str, blender_exe: str = "blender"
+) -> bool:
+    """
+    轉換單一 FBX 文件為 USD（批量路徑的 N=1 包裝）
+
+    Args:
+        fbx_path: 來源 FBX 文件路徑
+        usd_path: 輸出 USD 文件路徑
+        blender_exe: Blender 可執行文件路徑
+
+    Returns:
+        bool: 是否成功轉換
+    """
+    return convert_fbx_to_usd_batch(
+        [(fbx_path, usd_path)], blender_exe
+    ) == 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FBX → USD 轉換")
+    parser.add_argument("fbx", help="來源 FBX 文件")
+    parser.add_argument("usd", help="輸出 USD 文件")
+    parser.add_argument(
+        "--blender", default="blender", help="Blender 可執行文件路徑"
+    )
+    args = parser.parse_args()
+    ok = convert_fbx_to_usd(args.fbx, args.usd, blender_exe=args.blender)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
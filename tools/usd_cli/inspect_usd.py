@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# tools/usd_cli/inspect_usd.py
+
+"""
+USD 文件檢視 CLI
+
+列印 USD 文件的 prim 階層、類型與 stage 中繼數據：
+
+    python tools/usd_cli/inspect_usd.py scene.usdc
+
+（文件名避開 stdlib 的 inspect：腳本目錄位於 sys.path 首位，
+同名模組會遮蔽標準庫並使 pxr 匯入時循環失敗。）
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from core.usdkit.io import open_stage_for_read  # noqa: E402
+
+from pxr import Usd, UsdGeom  # noqa: E402
+
+# 縮排字串於模組載入期展開，per-prim 迴圈以索引取用，
+# 不逐 prim 重新配置 "  " * n（64 層以上才退回動態乘法）
+_INDENT = tuple("  " * i for i in range(64))
+
+
+def inspect_usd(file_path: str) -> Optional[int]:
+    """
+    檢視 USD 文件並列印 prim 階層
+
+    單次遍歷同時列印階層並統計 prim 數；縮排深度以
+    pathString.count('/') 取得，不為每個 prim 配置 split 列表。
+    以 LoadNone 開啟，遍歷不觸發 payload 載入。
+
+    Args:
+        file_path: USD 文件路徑
+
+    Returns:
+        Optional[int]: prim 總數（無法開啟文件時為 None）
+    """
+    stage = open_stage_for_read(file_path)
+    if stage is None:
+        print(f"無法開啟: {file_path}", file=sys.stderr)
+        return None
+
+    # 輸出累積到列表後單次 write：逐 prim print 在 10 萬級
+    # prim 的 stage 上就是 10 萬次 write 系統呼叫
+    lines = [
+        f"=== {file_path} ===",
+        f"upAxis: {UsdGeom.GetStageUpAxis(stage)}",
+        f"metersPerUnit: {UsdGeom.GetStageMetersPerUnit(stage)}",
+        "",
+    ]
+    # 述詞在 C++ 層剪枝 inactive/abstract/未載入子樹，
+    # 不在 Python 端逐 prim 過濾
+    prim_count = 0
+    for prim in Usd.PrimRange.Stage(
+        stage, Usd.PrimIsActive & Usd.PrimIsDefined & Usd.PrimIsLoaded
+    ):
+        prim_count += 1
+        path_string = prim.GetPath().pathString
+        name = prim.GetName()
+        type_name = prim.GetTypeName() or "(無類型)"
+        depth = path_string.count("/") - 1
+        indent = _INDENT[depth] if depth < 64 else "  " * depth
+        lines.append(f"{indent}{name} [{type_name}]")
+
+    lines.append(f"\nprim 總數: {prim_count}")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
+    return prim_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="檢視 USD 文件")
+    parser.add_argument("file", help="USD 文件路徑")
+    args = parser.parse_args()
+    if inspect_usd(args.file) is None:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()